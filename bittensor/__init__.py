@@ -280,6 +280,7 @@ from .errors import (
     NotVerifiedException,
     PostProcessException,
     PriorityException,
+    QueueExpiredError,
     RegistrationError,
     RunException,
     StakeError,
@@ -357,10 +358,12 @@ from .metagraph import metagraph as metagraph
 from .threadpool import PriorityThreadPoolExecutor as PriorityThreadPoolExecutor
 
 from .synapse import TerminalInfo, Synapse
-from .stream import StreamingSynapse
+from .stream import StreamingSynapse, FramedStreamingSynapse, FramedStreamWriter
 from .tensor import tensor, Tensor
 from .axon import axon as axon
 from .dendrite import dendrite as dendrite
+from .synapse_history import SynapseHistory as SynapseHistory
+from .metagraph_history import MetagraphHistory as MetagraphHistory
 
 from .mock.keyfile_mock import MockKeyfile as MockKeyfile
 from .mock.subtensor_mock import MockSubtensor as MockSubtensor
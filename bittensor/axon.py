@@ -24,24 +24,26 @@ import asyncio
 import contextlib
 import copy
 import inspect
-import json
+import multiprocessing
 import os
+import shutil
+import socket
+import tempfile
 import threading
 import time
 import traceback
 import typing
 import uuid
 from inspect import signature, Signature, Parameter
-from typing import List, Optional, Tuple, Callable, Any, Dict, Awaitable
+from typing import List, Optional, Tuple, Callable, Dict, Awaitable
 
 import uvicorn
-from fastapi import FastAPI, APIRouter, Depends
+from fastapi import FastAPI, APIRouter
 from fastapi.responses import JSONResponse
 from fastapi.routing import serialize_response
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import Response
-from substrateinterface import Keypair
 
 import bittensor
 from bittensor.errors import (
@@ -53,11 +55,22 @@ from bittensor.errors import (
     BlacklistedException,
     PriorityException,
     PostProcessException,
+    QueueExpiredError,
     SynapseException,
 )
+from bittensor.btlogging.format import TRACE_LEVEL_NUM
 from bittensor.constants import ALLOWED_DELTA, V_7_2_0
-from bittensor.threadpool import PriorityThreadPoolExecutor
+from bittensor.nonce_store import (
+    NonceStore,
+    MemoryNonceStore,
+    SQLiteNonceStore,
+    nonce_expiry,
+    nonce_window,
+)
+from bittensor.synapse import JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE
+from bittensor.threadpool import PrioritySemaphore
 from bittensor.utils import networking
+from bittensor.verification import BatchVerifier, KeypairCache
 
 
 class FastAPIThreadedServer(uvicorn.Server):
@@ -153,6 +166,63 @@ class FastAPIThreadedServer(uvicorn.Server):
             self.should_exit = True
 
 
+class AxonMetrics:
+    """
+    Request counters of an axon, kept per worker process in shared memory.
+
+    Each worker only writes to its own row, so no locking is required. The parent process reads every row to
+    aggregate the metrics of all workers, see :func:`axon.metrics`.
+
+    Args:
+        num_workers (int): The number of worker processes (rows).
+    """
+
+    FIELDS: typing.ClassVar[Tuple[str, ...]] = (
+        "requests",
+        "status_2xx",
+        "status_4xx",
+        "status_5xx",
+        "process_time",
+    )
+
+    def __init__(self, num_workers: int = 1):
+        self.num_workers = num_workers
+        self._values = multiprocessing.get_context("fork").Array(
+            "d", num_workers * len(self.FIELDS), lock=False
+        )
+
+    def record(self, worker_id: int, status_code: int, process_time: float):
+        """
+        Records a processed request on the row of ``worker_id``.
+        """
+        offset = worker_id * len(self.FIELDS)
+        self._values[offset] += 1
+        status_class = status_code // 100
+        if status_class == 2:
+            self._values[offset + 1] += 1
+        elif status_class == 4:
+            self._values[offset + 2] += 1
+        elif status_class == 5:
+            self._values[offset + 3] += 1
+        self._values[offset + 4] += process_time
+
+    def worker(self, worker_id: int) -> Dict[str, float]:
+        """
+        Returns the metrics of a single worker.
+        """
+        offset = worker_id * len(self.FIELDS)
+        return dict(zip(self.FIELDS, self._values[offset : offset + len(self.FIELDS)]))
+
+    def total(self) -> Dict[str, float]:
+        """
+        Returns the metrics summed over all workers.
+        """
+        workers = [self.worker(worker_id) for worker_id in range(self.num_workers)]
+        return {
+            field: sum(worker[field] for worker in workers) for field in self.FIELDS
+        }
+
+
 class axon:
     """
     The ``axon`` class in Bittensor is a fundamental component that serves as the server-side interface for a neuron within the Bittensor network.
@@ -298,6 +368,8 @@ class axon:
         external_ip: Optional[str] = None,
         external_port: Optional[int] = None,
         max_workers: Optional[int] = None,
+        nonce_store: Optional[NonceStore] = None,
+        workers: Optional[int] = None,
     ):
         r"""Creates a new bittensor.Axon object from passed arguments.
         Args:
@@ -315,6 +387,13 @@ class axon:
                 The external port of the server to broadcast to the network.
             max_workers (:type:`Optional[int]`, `optional`):
                 Used to create the threadpool if not passed, specifies the number of active threads servicing requests.
+                Also bounds the number of async forward functions running concurrently.
+            nonce_store (:obj:`Optional[bittensor.nonce_store.NonceStore]`, `optional`):
+                Store of the last accepted nonce per dendrite, used for replay protection. Defaults to a
+                :class:`SQLiteNonceStore` if ``axon.nonce_store_path`` is set, else to a :class:`MemoryNonceStore`.
+            workers (:type:`Optional[int]`, `optional`):
+                Number of server processes sharing the port with ``SO_REUSEPORT``. Defaults to ``1``, serving from
+                a thread of the current process.
         """
         # Build and check config.
         if config is None:
@@ -331,6 +410,9 @@ class axon:
         config.axon.max_workers = max_workers or config.axon.get(
             "max_workers", bittensor.defaults.axon.max_workers
         )
+        config.axon.workers = workers or config.axon.get(
+            "workers", bittensor.defaults.axon.workers
+        )
         axon.check_config(config)
         self.config = config  # type: ignore [method-assign]
 
@@ -354,11 +436,59 @@ class axon:
         self.full_address = str(self.config.axon.ip) + ":" + str(self.config.axon.port)
         self.started = False
 
+        # Worker processes, only used when serving with more than one worker.
+        self.worker_id = 0
+        self.worker_processes: List[multiprocessing.process.BaseProcess] = []
+        # Temporary directory of the nonce store shared by the workers, and the nonce store it replaced.
+        self._worker_nonce_store_dir: Optional[str] = None
+        self._local_nonces: Optional[NonceStore] = None
+        self.metrics = AxonMetrics(num_workers=self.config.axon.workers)
+
         # Build middleware
         self.thread_pool = bittensor.PriorityThreadPoolExecutor(
             max_workers=self.config.axon.max_workers
         )
-        self.nonces: Dict[str, int] = {}
+        # Async forward functions run on the event loop, they are only queued by priority when capped.
+        max_async_forwards = self.config.axon.get(
+            "max_async_forwards", bittensor.defaults.axon.max_async_forwards
+        )
+        self.forward_semaphore: Optional[PrioritySemaphore] = (
+            PrioritySemaphore(max_async_forwards) if max_async_forwards else None
+        )
+        if nonce_store is None:
+            nonce_store_path = self.config.axon.get("nonce_store_path")
+            nonce_store = (
+                SQLiteNonceStore(nonce_store_path)
+                if nonce_store_path
+                else MemoryNonceStore(
+                    max_size=self.config.axon.get(
+                        "nonce_store_size", bittensor.defaults.axon.nonce_store_size
+                    ),
+                    max_legacy_size=self.config.axon.get(
+                        "legacy_nonce_store_size",
+                        bittensor.defaults.axon.legacy_nonce_store_size,
+                    ),
+                )
+            )
+        self.nonces: NonceStore = nonce_store
+
+        # Signature verification of dendrite requests.
+        self.keypair_cache = KeypairCache(
+            max_size=self.config.axon.get(
+                "keypair_cache_size", bittensor.defaults.axon.keypair_cache_size
+            )
+        )
+        self.batch_verifier: Optional[BatchVerifier] = None
+        verify_workers = self.config.axon.get(
+            "verify_workers", bittensor.defaults.axon.verify_workers
+        )
+        if verify_workers > 0:
+            self.batch_verifier = BatchVerifier(
+                max_workers=verify_workers,
+                max_batch_size=self.config.axon.get(
+                    "verify_batch_size", bittensor.defaults.axon.verify_batch_size
+                ),
+            )
 
         # Request default functions.
         self.forward_class_types: Dict[str, List[Signature]] = {}
@@ -371,7 +501,13 @@ class axon:
         self.app = FastAPI()
         log_level = "trace" if bittensor.logging.__trace_on__ else "critical"
         self.fast_config = uvicorn.Config(
-            self.app, host="0.0.0.0", port=self.config.axon.port, log_level=log_level
+            self.app,
+            host="0.0.0.0",
+            port=self.config.axon.port,
+            log_level=log_level,
+            timeout_keep_alive=self.config.axon.get(
+                "keepalive_timeout", bittensor.defaults.axon.keepalive_timeout
+            ),
         )
         self.fast_server = FastAPIThreadedServer(config=self.fast_config)
         self.router = APIRouter()
@@ -482,27 +618,57 @@ class axon:
         ), "The first argument of forward_fn must inherit from bittensor.Synapse"
         request_name = param_class.__name__
 
-        async def endpoint(*args, **kwargs):
+        async def endpoint(request: Request) -> Response:
             start_time = time.time()
-            response_synapse = forward_fn(*args, **kwargs)
+            # The synapse parsed from the request and the scheduling parameters, assigned by the middleware.
+            synapse = request.state.bt_synapse
+            priority = getattr(request.state, "bt_priority", 0.0)
+            deadline = getattr(request.state, "bt_deadline", None)
+            try:
+                if not inspect.iscoroutinefunction(forward_fn):
+                    response_synapse = await asyncio.wrap_future(
+                        self.thread_pool.submit(
+                            forward_fn, synapse, priority=priority, deadline=deadline
+                        )
+                    )
+                elif self.forward_semaphore is None:
+                    response_synapse = await forward_fn(synapse)
+                else:
+                    async with self.forward_semaphore.slot(priority, deadline):
+                        response_synapse = await forward_fn(synapse)
+            except QueueExpiredError as e:
+                # The request waited in the queue past its deadline, the forward function was not run.
+                synapse.axon.status_code = 408
+                raise PriorityException(
+                    f"Response timeout after: {synapse.timeout}s", synapse=synapse
+                ) from e
             if isinstance(response_synapse, Awaitable):
                 response_synapse = await response_synapse
+            if isinstance(response_synapse, Response):
+                # Streaming responses, e.g. of :class:`bittensor.FramedStreamingSynapse`, are sent as they are,
+                # with the headers of the request synapse.
+                synapse.axon.status_code = 200
+                synapse.axon.status_message = "Success"
+                synapse.axon.process_time = time.time() - start_time
+                response_synapse.headers.update(synapse.to_headers())
+                return response_synapse
+            # Answer in msgpack to the dendrites accepting it, see :func:`bittensor.dendrite`.
+            content_type = (
+                MSGPACK_CONTENT_TYPE
+                if MSGPACK_CONTENT_TYPE in request.headers.get("accept", "")
+                else JSON_CONTENT_TYPE
+            )
             return await self.middleware_cls.synapse_to_response(
-                synapse=response_synapse, start_time=start_time
+                synapse=response_synapse,
+                start_time=start_time,
+                content_type=content_type,
             )
 
-        # replace the endpoint signature, but set return annotation to JSONResponse
-        endpoint.__signature__ = Signature(  # type: ignore
-            parameters=list(forward_sig.parameters.values()),
-            return_annotation=JSONResponse,
-        )
-
         # Add the endpoint to the router, making it available on both GET and POST methods
         self.router.add_api_route(
             f"/{request_name}",
             endpoint,
             methods=["GET", "POST"],
-            dependencies=[Depends(self.verify_body_integrity)],
         )
         self.app.include_router(self.router)
 
@@ -593,6 +759,29 @@ class axon:
             default_axon_external_port = os.getenv("BT_AXON_EXTERNAL_PORT") or None
             default_axon_external_ip = os.getenv("BT_AXON_EXTERNAL_IP") or None
             default_axon_max_workers = os.getenv("BT_AXON_MAX_WORERS") or 10
+            default_axon_max_async_forwards = (
+                os.getenv("BT_AXON_MAX_ASYNC_FORWARDS") or 0
+            )
+            default_axon_workers = os.getenv("BT_AXON_WORKERS") or 1
+            default_axon_keepalive_timeout = (
+                os.getenv("BT_AXON_KEEPALIVE_TIMEOUT") or 75
+            )
+            default_axon_nonce_store_path = (
+                os.getenv("BT_AXON_NONCE_STORE_PATH") or None
+            )
+            default_axon_nonce_store_size = (
+                os.getenv("BT_AXON_NONCE_STORE_SIZE") or 100_000
+            )
+            default_axon_legacy_nonce_store_size = (
+                os.getenv("BT_AXON_LEGACY_NONCE_STORE_SIZE") or 100_000
+            )
+            default_axon_keypair_cache_size = (
+                os.getenv("BT_AXON_KEYPAIR_CACHE_SIZE") or 4096
+            )
+            default_axon_verify_workers = os.getenv("BT_AXON_VERIFY_WORKERS") or 0
+            default_axon_verify_batch_size = (
+                os.getenv("BT_AXON_VERIFY_BATCH_SIZE") or 32
+            )
 
             # Add command-line arguments to the parser
             parser.add_argument(
@@ -628,6 +817,68 @@ class axon:
                         The grpc server distributes new worker threads to service requests up to this number.""",
                 default=default_axon_max_workers,
             )
+            parser.add_argument(
+                "--" + prefix_str + "axon.max_async_forwards",
+                type=int,
+                help="""The maximum number of async forward functions running simultaneously on this endpoint,
+                        waiting requests are served by priority. 0 runs them all as they come.""",
+                default=default_axon_max_async_forwards,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.workers",
+                type=int,
+                help="""The number of server processes sharing the axon port with SO_REUSEPORT. Attached functions
+                        are replicated into each process. Defaults to a single in-process server.""",
+                default=default_axon_workers,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.keepalive_timeout",
+                type=int,
+                help="""Seconds an idle dendrite connection is kept open. It should exceed the keep-alive of the
+                        dendrites (60s by default), so that they can reuse their pooled connections.""",
+                default=default_axon_keepalive_timeout,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.nonce_store_path",
+                type=str,
+                required=False,
+                help="""Path of a SQLite file used to store request nonces. Axons sharing the file enforce replay
+                        protection together. If not set, nonces are kept in memory.""",
+                default=default_axon_nonce_store_path,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.nonce_store_size",
+                type=int,
+                help="""The maximum number of dendrite nonces kept by the in-memory nonce store. Nonces are kept until
+                they can no longer be replayed, so when it is full, new dendrites are rejected until some expire.""",
+                default=default_axon_nonce_store_size,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.legacy_nonce_store_size",
+                type=int,
+                help="""The maximum number of pre-7.2.0 dendrite nonces kept by the in-memory nonce store. They are
+                never evicted, as they are not bound to a time window. When it is full, new legacy dendrites are
+                rejected.""",
+                default=default_axon_legacy_nonce_store_size,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.keypair_cache_size",
+                type=int,
+                help="""The maximum number of dendrite hotkey keypairs kept for signature verification.""",
+                default=default_axon_keypair_cache_size,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.verify_workers",
+                type=int,
+                help="""Number of threads verifying request signatures in batches, 0 verifies them on the event loop.""",
+                default=default_axon_verify_workers,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.verify_batch_size",
+                type=int,
+                help="""The maximum number of signatures verified per batch by the verify workers.""",
+                default=default_axon_verify_batch_size,
+            )
 
         except argparse.ArgumentError:
             # Exception handling for re-parsing arguments
@@ -658,11 +909,10 @@ class axon:
 
         This method performs several key functions:
 
-        1. Decoding and loading the request body for inspection.
-        2. Gathering required field names for hash comparison from the Axon configuration.
-        3. Loading and parsing the request body into a dictionary.
-        4. Reconstructing the Synapse object and recomputing the hash for verification and logging.
-        5. Comparing the recomputed hash with the hash provided in the request headers for verification.
+        1. Decoding the request body according to its ``content-type``, JSON or msgpack, like the axon
+           middleware does, see :func:`bittensor.Synapse.from_body_and_headers`.
+        2. Reconstructing the Synapse object and recomputing the hash for verification and logging.
+        3. Comparing the recomputed hash with the hash provided in the request headers for verification.
 
         Note:
             The integrity verification is an essential step in ensuring the security of the data exchange
@@ -671,15 +921,16 @@ class axon:
         """
         # Await and load the request body so we can inspect it
         body = await request.body()
-        request_body = body.decode() if isinstance(body, bytes) else body
 
         request_name = request.url.path.split("/")[1]
 
-        # Load the body dict and check if all required field hashes match
-        body_dict = json.loads(request_body)
+        # Decode the body dict in the wire format of the request
+        body_dict = bittensor.Synapse.decode_body(
+            body, request.headers.get("content-type")
+        )
 
         # Reconstruct the synapse object from the body dict and recompute the hash
-        syn = self.forward_class_types[request_name](**body_dict)  # type: ignore
+        syn = self.forward_class_types[request_name].model_validate(body_dict)  # type: ignore
         parsed_body_hash = syn.body_hash  # Rehash the body from request
 
         body_hash = request.headers.get("computed_body_hash", "")
@@ -710,6 +961,10 @@ class axon:
             config.axon.external_port > 1024 and config.axon.external_port < 65535
         ), "External port must be in range [1024, 65535]"
 
+        assert (
+            config.axon.get("workers") is None or config.axon.workers >= 1
+        ), "Axon workers must be at least 1"
+
     def to_string(self):
         """
         Provides a human-readable representation of the AxonInfo for this Axon.
@@ -761,13 +1016,86 @@ class axon:
             ... # setup axon, attach functions, etc.
             my_axon.start()  # Starts the axon server
 
+        When ``axon.workers`` is larger than ``1``, the server is instead forked into that many worker processes,
+        each binding the axon port with ``SO_REUSEPORT`` so that the kernel balances connections between them. The
+        attached functions are replicated into every worker by the fork, so :func:`attach` must be called before
+        :func:`start`.
+
         Note:
             After invoking this method, the Axon is ready to handle requests as per its configured endpoints and custom logic.
         """
-        self.fast_server.start()
+        if self.config.axon.workers > 1:  # type: ignore
+            self._start_workers()
+        else:
+            self.fast_server.start()
         self.started = True
         return self
 
+    def _start_workers(self):
+        """
+        Forks ``axon.workers`` server processes sharing the axon port.
+
+        Replay protection must be shared between the workers, as a dendrite's connections may be balanced to any of
+        them. An in-memory nonce store is therefore replaced by a :class:`SQLiteNonceStore` in a temporary
+        directory, which is removed by :func:`stop`.
+        """
+        if not hasattr(socket, "SO_REUSEPORT"):
+            raise RuntimeError(
+                "Serving with several axon workers requires SO_REUSEPORT"
+            )
+        if self.worker_processes:
+            return
+
+        if not isinstance(self.nonces, SQLiteNonceStore):
+            bittensor.logging.warning(
+                "Axon workers need a shared nonce store, set axon.nonce_store_path to choose its location."
+            )
+            self._worker_nonce_store_dir = tempfile.mkdtemp(prefix="bittensor-axon-")
+            self._local_nonces = self.nonces
+            self.nonces = SQLiteNonceStore(
+                os.path.join(self._worker_nonce_store_dir, "nonces.db")
+            )
+
+        context = multiprocessing.get_context("fork")
+        for worker_id in range(self.config.axon.workers):  # type: ignore
+            process = context.Process(
+                target=self._run_worker, args=(worker_id,), daemon=True
+            )
+            process.start()
+            self.worker_processes.append(process)
+
+    def _run_worker(self, worker_id: int):
+        """
+        Entry point of a forked worker process, serving the FastAPI application on a ``SO_REUSEPORT`` socket.
+        """
+        self.worker_id = worker_id
+        self.worker_processes = []
+
+        # Threads and database connections do not survive the fork.
+        self.thread_pool = bittensor.PriorityThreadPoolExecutor(
+            max_workers=self.config.axon.max_workers  # type: ignore
+        )
+        if isinstance(self.nonces, SQLiteNonceStore):
+            self.nonces = SQLiteNonceStore(
+                self.nonces.path, prune_interval=self.nonces.prune_interval
+            )
+        if self.batch_verifier is not None:
+            self.batch_verifier = BatchVerifier(
+                max_workers=self.batch_verifier.max_workers,
+                max_batch_size=self.batch_verifier.max_batch_size,
+            )
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind((self.fast_config.host, self.fast_config.port))
+
+        try:
+            uvicorn.Server(config=self.fast_config).run(sockets=[sock])
+        finally:
+            sock.close()
+            os._exit(0)
+
     def stop(self) -> "bittensor.axon":
         """
         Stops the Axon server and its underlying GRPC server thread, transitioning the state of the Axon
@@ -793,6 +1121,25 @@ class axon:
             It is advisable to ensure that all ongoing processes or requests are completed or properly handled before invoking this method.
         """
         self.fast_server.stop()
+        if self.batch_verifier is not None:
+            self.batch_verifier.shutdown()
+            # Its threads are only spawned on use, so a new pool is ready for a restart.
+            self.batch_verifier = BatchVerifier(
+                max_workers=self.batch_verifier.max_workers,
+                max_batch_size=self.batch_verifier.max_batch_size,
+            )
+        for process in self.worker_processes:
+            process.terminate()
+        for process in self.worker_processes:
+            process.join()
+        self.worker_processes = []
+        if self._worker_nonce_store_dir is not None:
+            if isinstance(self.nonces, SQLiteNonceStore):
+                self.nonces.close()
+            shutil.rmtree(self._worker_nonce_store_dir, ignore_errors=True)
+            self._worker_nonce_store_dir = None
+        if self._local_nonces is not None:
+            self.nonces, self._local_nonces = self._local_nonces, None
         self.started = False
         return self
 
@@ -870,6 +1217,7 @@ class axon:
         Raises:
             Exception: If the ``receiver_hotkey`` doesn't match with ``self.receiver_hotkey``.
             Exception: If the nonce is not larger than the previous nonce for the same endpoint key.
+            Exception: If the nonce is more than ``ALLOWED_DELTA`` in the future.
             Exception: If the signature verification fails.
 
         After successful verification, the nonce for the given endpoint key is updated.
@@ -881,7 +1229,7 @@ class axon:
         """
         # Build the keypair from the dendrite_hotkey
         if synapse.dendrite is not None:
-            keypair = Keypair(ss58_address=synapse.dendrite.hotkey)
+            keypair = self.keypair_cache.get(synapse.dendrite.hotkey)  # type: ignore
 
             # Build the signature messages.
             message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{self.wallet.hotkey.ss58_address}.{synapse.dendrite.uuid}.{synapse.computed_body_hash}"
@@ -893,41 +1241,62 @@ class axon:
             if synapse.dendrite.nonce is None:
                 raise Exception("Missing Nonce")
 
-            # If we don't have a nonce stored, ensure that the nonce falls within
-            # a reasonable delta.
-
+            now = time.time_ns()
+            # Legacy nonces are not bound to a time window, forgetting one would make its requests replayable.
+            expires_at: Optional[int] = None
             if (
                 synapse.dendrite.version is not None
                 and synapse.dendrite.version >= V_7_2_0
             ):
+                # A nonce from the future would outlive its store entry and become replayable.
+                if synapse.dendrite.nonce > now + ALLOWED_DELTA:
+                    raise Exception("Nonce is too far in the future")
+
+                # Once out of the delta window the nonce is rejected anyway, so it can be forgotten.
+                expires_at = nonce_expiry(synapse.dendrite.nonce, now)
+
+                if self.config.axon.workers > 1:  # type: ignore
+                    # Concurrent requests of a dendrite can be handled out of order by different
+                    # workers, so any nonce within the delta window is accepted, but only once.
+                    endpoint_key = f"{endpoint_key}:{synapse.dendrite.nonce}"
+                    stored_nonce = None
+                else:
+                    stored_nonce = self.nonces.get(endpoint_key)
+
                 # If we don't have a nonce stored, ensure that the nonce falls within
                 # a reasonable delta.
                 if (
-                    self.nonces.get(endpoint_key) is None
-                    and synapse.dendrite.nonce
-                    <= time.time_ns() - ALLOWED_DELTA - (synapse.timeout or 0)
+                    stored_nonce is None
+                    and synapse.dendrite.nonce <= now - nonce_window(synapse.timeout)
                 ):
                     raise Exception("Nonce is too old")
-                if (
-                    self.nonces.get(endpoint_key) is not None
-                    and synapse.dendrite.nonce <= self.nonces[endpoint_key]
-                ):
+                if stored_nonce is not None and synapse.dendrite.nonce <= stored_nonce:
                     raise Exception("Nonce is too old")
             else:
-                if (
-                    endpoint_key in self.nonces.keys()
-                    and self.nonces[endpoint_key] is not None
-                    and synapse.dendrite.nonce <= self.nonces[endpoint_key]
-                ):
+                stored_nonce = self.nonces.get(endpoint_key)
+                if stored_nonce is not None and synapse.dendrite.nonce <= stored_nonce:
                     raise Exception("Nonce is too small")
 
-            if not keypair.verify(message, synapse.dendrite.signature):
+            if self.batch_verifier is not None:
+                verified = await self.batch_verifier.verify(
+                    keypair,
+                    message,
+                    synapse.dendrite.signature,  # type: ignore
+                )
+            else:
+                verified = keypair.verify(message, synapse.dendrite.signature)
+            if not verified:
                 raise Exception(
                     f"Signature mismatch with {message} and {synapse.dendrite.signature}"
                 )
 
-            # Success
-            self.nonces[endpoint_key] = synapse.dendrite.nonce  # type: ignore
+            # Success, unless a concurrent request (e.g. on another worker) already used this nonce.
+            if not self.nonces.update(endpoint_key, synapse.dendrite.nonce, expires_at):
+                if expires_at is None:
+                    raise Exception(
+                        "Nonce is too small or the legacy nonce store is full"
+                    )
+                raise Exception("Nonce is too old or the nonce store is full")
         else:
             raise SynapseDendriteNoneException(synapse=synapse)
 
@@ -956,8 +1325,9 @@ def log_and_handle_error(
     if isinstance(exception, SynapseException):
         synapse = exception.synapse or synapse
 
-        bittensor.logging.trace(f"Forward handled exception: {exception}")
-    else:
+        if bittensor.logging.isEnabledFor(TRACE_LEVEL_NUM):
+            bittensor.logging.trace(f"Forward handled exception: {exception}")
+    elif bittensor.logging.isEnabledFor(TRACE_LEVEL_NUM):
         bittensor.logging.trace(f"Forward exception: {traceback.format_exc()}")
 
     if synapse.axon is None:
@@ -1055,14 +1425,21 @@ class AxonMiddleware(BaseHTTPMiddleware):
         1. Request Preprocessing: Sets up Synapse object from request headers and fills necessary information.
         2. Logging: Logs the start of request processing.
         3. Blacklist Checking: Verifies if the request is blacklisted.
-        4. Request Verification: Ensures the authenticity and integrity of the request.
-        5. Priority Assessment: Evaluates and assigns priority to the request.
+        4. Request Verification: Ensures the authenticity and integrity of the request from its headers, before
+           the body is read, then parses the body once and checks it against the signed body hash.
+        5. Priority Assessment: Evaluates and assigns priority to the request, which together with the
+           request timeout decides when the forward function runs.
         6. Request Execution: Calls the next function in the middleware chain to process the request.
         7. Response Postprocessing: Updates response headers and logs the end of the request processing.
 
         The method also handles exceptions and errors that might occur during each stage, ensuring that
-        appropriate responses are returned to the client.
+        appropriate responses are returned to the client. ``HEAD`` requests to the root path, sent by
+        :func:`bittensor.dendrite.warm_pool` to open pooled connections, are answered right away.
         """
+        # Connection warm-ups carry no synapse, answer them without processing or logging them.
+        if request.method == "HEAD" and request.url.path == "/":
+            return Response(status_code=200)
+
         # Records the start time of the request processing.
         start_time = time.time()
 
@@ -1078,14 +1455,7 @@ class AxonMiddleware(BaseHTTPMiddleware):
                 raise
 
             # Logs the start of the request processing
-            if synapse.dendrite is not None:
-                bittensor.logging.trace(
-                    f"axon     | <-- | {request.headers.get('content-length', -1)} B | {synapse.name} | {synapse.dendrite.hotkey} | {synapse.dendrite.ip}:{synapse.dendrite.port} | 200 | Success "
-                )
-            else:
-                bittensor.logging.trace(
-                    f"axon     | <-- | {request.headers.get('content-length', -1)} B | {synapse.name} | None | None | 200 | Success "
-                )
+            self._log_incoming_request(request, synapse)
 
             # Call the blacklist function
             await self.blacklist(synapse)
@@ -1093,8 +1463,19 @@ class AxonMiddleware(BaseHTTPMiddleware):
             # Call verify and return the verified request
             await self.verify(synapse)
 
-            # Call the priority function
-            await self.priority(synapse)
+            # Parse the body of the verified request and check it against the verified body hash
+            synapse = await self.parse_body(request, synapse)
+            await self.verify_body_integrity(synapse)
+
+            # Call the priority function, the forward function is scheduled by its result.
+            deadline = (
+                start_time + synapse.timeout if synapse.timeout is not None else None
+            )
+            request.state.bt_priority = await self.priority(synapse, deadline)
+            request.state.bt_deadline = deadline
+
+            # Hand the synapse over to the endpoint, which passes it to the forward function.
+            request.state.bt_synapse = synapse
 
             # Call the run function
             response = await self.run(synapse, call_next, request)
@@ -1120,23 +1501,59 @@ class AxonMiddleware(BaseHTTPMiddleware):
         # Logs the end of request processing and returns the response
         finally:
             # Log the details of the processed synapse, including total size, name, hotkey, IP, port,
-            # status code, and status message, using the debug level of the logger.
-            if synapse.dendrite is not None and synapse.axon is not None:
-                bittensor.logging.trace(
-                    f"axon     | --> | {response.headers.get('content-length', -1)} B | {synapse.name} | {synapse.dendrite.hotkey} | {synapse.dendrite.ip}:{synapse.dendrite.port}  | {synapse.axon.status_code} | {synapse.axon.status_message}"
-                )
-            elif synapse.axon is not None:
-                bittensor.logging.trace(
-                    f"axon     | --> | {response.headers.get('content-length', -1)} B | {synapse.name} | None | None | {synapse.axon.status_code} | {synapse.axon.status_message}"
-                )
-            else:
-                bittensor.logging.trace(
-                    f"axon     | --> | {response.headers.get('content-length', -1)} B | {synapse.name} | None | None | 200 | Success "
-                )
+            # status code, and status message, using the trace level of the logger.
+            self._log_outgoing_response(response, synapse)
+
+            # Record the request in the metrics of this worker.
+            self.axon.metrics.record(
+                self.axon.worker_id, response.status_code, time.time() - start_time
+            )
 
             # Return the response to the requester.
             return response
 
+    def _log_incoming_request(self, request: Request, synapse: bittensor.Synapse):
+        """
+        Logs the incoming request at the trace level. The message is only built if trace logging is enabled.
+
+        Args:
+            request (Request): The incoming request.
+            synapse (bittensor.Synapse): The synapse parsed from the request.
+        """
+        if not bittensor.logging.isEnabledFor(TRACE_LEVEL_NUM):
+            return
+        if synapse.dendrite is not None:
+            bittensor.logging.trace(
+                f"axon     | <-- | {request.headers.get('content-length', -1)} B | {synapse.name} | {synapse.dendrite.hotkey} | {synapse.dendrite.ip}:{synapse.dendrite.port} | 200 | Success "
+            )
+        else:
+            bittensor.logging.trace(
+                f"axon     | <-- | {request.headers.get('content-length', -1)} B | {synapse.name} | None | None | 200 | Success "
+            )
+
+    def _log_outgoing_response(self, response: Response, synapse: bittensor.Synapse):
+        """
+        Logs the outgoing response at the trace level. The message is only built if trace logging is enabled.
+
+        Args:
+            response (Response): The response sent to the requester.
+            synapse (bittensor.Synapse): The processed synapse.
+        """
+        if not bittensor.logging.isEnabledFor(TRACE_LEVEL_NUM):
+            return
+        if synapse.dendrite is not None and synapse.axon is not None:
+            bittensor.logging.trace(
+                f"axon     | --> | {response.headers.get('content-length', -1)} B | {synapse.name} | {synapse.dendrite.hotkey} | {synapse.dendrite.ip}:{synapse.dendrite.port}  | {synapse.axon.status_code} | {synapse.axon.status_message}"
+            )
+        elif synapse.axon is not None:
+            bittensor.logging.trace(
+                f"axon     | --> | {response.headers.get('content-length', -1)} B | {synapse.name} | None | None | {synapse.axon.status_code} | {synapse.axon.status_message}"
+            )
+        else:
+            bittensor.logging.trace(
+                f"axon     | --> | {response.headers.get('content-length', -1)} B | {synapse.name} | None | None | 200 | Success "
+            )
+
     async def preprocess(self, request: Request) -> bittensor.Synapse:
         """
         Performs the initial processing of the incoming request. This method is responsible for
@@ -1152,7 +1569,8 @@ class AxonMiddleware(BaseHTTPMiddleware):
         The preprocessing involves:
 
         1. Extracting the request name from the URL path.
-        2. Creating a Synapse instance from the request headers using the appropriate class type.
+        2. Creating a Synapse instance from the request headers using the appropriate class type. The body is
+           only read once the request is verified, see :func:`parse_body`.
         3. Filling in the Axon and Dendrite information into the Synapse object.
         4. Signing the Synapse from the Axon side using the wallet hotkey.
 
@@ -1262,6 +1680,65 @@ class AxonMiddleware(BaseHTTPMiddleware):
                     f"Not Verified with error: {str(e)}", synapse=synapse
                 )
 
+    async def parse_body(
+        self, request: Request, synapse: bittensor.Synapse
+    ) -> bittensor.Synapse:
+        """
+        Reads the body of a verified request and parses it into a new instance of the synapse class, see
+        :func:`bittensor.Synapse.from_body_and_headers`. This is the only time the body is parsed, the returned
+        synapse is checked against the body hash and handed to the forward function.
+
+        The body is only awaited after :func:`verify`, so the nonces of concurrent requests from one dendrite are
+        checked in the order their headers arrived, however long their bodies take.
+
+        Args:
+            request (Request): The incoming request.
+            synapse (bittensor.Synapse): The verified synapse built from the request headers by :func:`preprocess`.
+
+        Returns:
+            bittensor.Synapse: The synapse holding the request body, with the name and the axon and dendrite
+            information of ``synapse``.
+
+        Raises:
+            SynapseParsingError: If the body cannot be read or parsed into the synapse class.
+        """
+        try:
+            body = await request.body()
+        except Exception:
+            raise SynapseParsingError(
+                f"Improperly formatted request. Could not read the body of the request {request.url.path}."
+            )
+        try:
+            body_synapse = type(synapse).from_body_and_headers(body, request.headers)  # type: ignore
+        except Exception:
+            raise SynapseParsingError(
+                f"Improperly formatted request. Could not parse body into synapse of type {synapse.name}."
+            )
+        body_synapse.name = synapse.name
+        body_synapse.axon = synapse.axon
+        body_synapse.dendrite = synapse.dendrite
+        return body_synapse
+
+    async def verify_body_integrity(self, synapse: bittensor.Synapse):
+        """
+        Checks that the body of the request matches the body hash of its headers, which is covered by the
+        signature checked in :func:`verify`.
+
+        Args:
+            synapse (bittensor.Synapse): The Synapse object representing the request.
+
+        Raises:
+            SynapseParsingError: If the hash of the body does not match, in which case the request is rejected
+                with a 400 status code.
+        """
+        parsed_body_hash = synapse.body_hash
+        if parsed_body_hash != synapse.computed_body_hash:
+            if synapse.axon is None:
+                raise SynapseParsingError("Synapse.axon object is None")
+            synapse.axon.status_code = 400
+            synapse.axon.status_message = f"Hash mismatch between header body hash {synapse.computed_body_hash} and parsed body hash {parsed_body_hash}"
+            raise SynapseParsingError(synapse.axon.status_message)
+
     async def blacklist(self, synapse: bittensor.Synapse):
         """
         Checks if the request should be blacklisted. This method ensures that requests from disallowed
@@ -1318,46 +1795,38 @@ class AxonMiddleware(BaseHTTPMiddleware):
                     f"Forbidden. Key is blacklisted: {reason}.", synapse=synapse
                 )
 
-    async def priority(self, synapse: bittensor.Synapse):
+    async def priority(
+        self, synapse: bittensor.Synapse, deadline: Optional[float] = None
+    ) -> float:
         """
         Executes the priority function for the request. This method assesses and assigns a priority
         level to the request, determining its urgency and importance in the processing queue.
 
         Args:
             synapse (bittensor.Synapse): The Synapse object representing the request.
+            deadline (float, optional): Unix timestamp after which the requester no longer waits for a response.
+
+        Returns:
+            float: The priority of the request, ``0.0`` if no priority function is attached.
 
         Raises:
-            Exception: If the priority assessment process encounters issues, such as timeouts.
+            PriorityException: If the deadline of the request has passed, in which case it is shed with a 408
+                status code before any work is done.
 
         The priority function plays a crucial role in managing the processing load and ensuring that
-        critical requests are handled promptly.
+        critical requests are handled promptly. Sync forward functions are run by the axon thread pool,
+        which serves waiting requests highest priority first and, at equal priority, earliest deadline first.
+        Async ones run as they come, or in the same order through :attr:`axon.forward_semaphore` if
+        ``axon.max_async_forwards`` caps them.
         """
         # Retrieve the priority function from the 'priority_fns' dictionary that corresponds
         # to the request's name (synapse name).
         priority_fn = self.axon.priority_fns.get(str(synapse.name), None)
 
-        async def submit_task(
-            executor: PriorityThreadPoolExecutor, priority: float
-        ) -> Tuple[float, Any]:
-            """
-            Submits the given priority function to the specified executor for asynchronous execution.
-            The function will run in the provided executor and return the priority value along with the result.
-
-            Args:
-                executor: The executor in which the priority function will be run.
-                priority: The priority function to be executed.
-
-            Returns:
-                tuple: A tuple containing the priority value and the result of the priority function execution.
-            """
-            loop = asyncio.get_event_loop()
-            future = loop.run_in_executor(executor, lambda: priority)
-            result = await future
-            return priority, result
-
-        # If a priority function exists for the request's name
-        if priority_fn:
-            try:
+        try:
+            priority = 0.0
+            # If a priority function exists for the request's name
+            if priority_fn:
                 # Execute the priority function and get the priority value.
                 priority = (
                     await priority_fn(synapse)
@@ -1365,23 +1834,25 @@ class AxonMiddleware(BaseHTTPMiddleware):
                     else priority_fn(synapse)
                 )
 
-                # Submit the task to the thread pool for execution with the given priority.
-                # The submit_task function will handle the execution and return the result.
-                _, result = await submit_task(self.axon.thread_pool, priority)
+            # Shed requests nobody waits for anymore.
+            if deadline is not None and time.time() > deadline:
+                raise TimeoutError("Request deadline passed before execution")
 
-            except TimeoutError as e:
-                # If the execution of the priority function exceeds the timeout,
-                # it raises an exception to handle the timeout error.
-                bittensor.logging.trace(f"TimeoutError: {str(e)}")
+        except TimeoutError as e:
+            # If the execution of the priority function exceeds the timeout,
+            # it raises an exception to handle the timeout error.
+            bittensor.logging.trace(f"TimeoutError: {str(e)}")
 
-                # Set the status code of the synapse to 408 which indicates a timeout error.
-                if synapse.axon is not None:
-                    synapse.axon.status_code = 408
+            # Set the status code of the synapse to 408 which indicates a timeout error.
+            if synapse.axon is not None:
+                synapse.axon.status_code = 408
 
-                # Raise an exception to stop the process and return an appropriate error message to the requester.
-                raise PriorityException(
-                    f"Response timeout after: {synapse.timeout}s", synapse=synapse
-                )
+            # Raise an exception to stop the process and return an appropriate error message to the requester.
+            raise PriorityException(
+                f"Response timeout after: {synapse.timeout}s", synapse=synapse
+            )
+
+        return priority
 
     async def run(
         self,
@@ -1420,14 +1891,19 @@ class AxonMiddleware(BaseHTTPMiddleware):
 
     @classmethod
     async def synapse_to_response(
-        cls, synapse: bittensor.Synapse, start_time: float
-    ) -> JSONResponse:
+        cls,
+        synapse: bittensor.Synapse,
+        start_time: float,
+        content_type: str = JSON_CONTENT_TYPE,
+    ) -> Response:
         """
-        Converts the Synapse object into a JSON response with HTTP headers.
+        Converts the Synapse object into a JSON or msgpack response with HTTP headers.
 
         Args:
             synapse (bittensor.Synapse): The Synapse object representing the request.
             start_time (float): The timestamp when the request processing started.
+            content_type (str): The encoding of the response body, :data:`bittensor.synapse.MSGPACK_CONTENT_TYPE`
+                for a body encoded by :func:`bittensor.Synapse.to_msgpack`, or JSON. Defaults to JSON.
 
         Returns:
             Response: The final HTTP response, with updated headers, ready to be sent back to the client.
@@ -1438,7 +1914,8 @@ class AxonMiddleware(BaseHTTPMiddleware):
         if synapse.axon is None:
             synapse.axon = bittensor.TerminalInfo()
 
-        if synapse.axon.status_code is None:
+        # Requests still marked as in progress (100) by the middleware were handled successfully.
+        if synapse.axon.status_code is None or synapse.axon.status_code == 100:
             synapse.axon.status_code = 200
 
         if synapse.axon.status_code == 200 and not synapse.axon.status_message:
@@ -1446,11 +1923,18 @@ class AxonMiddleware(BaseHTTPMiddleware):
 
         synapse.axon.process_time = time.time() - start_time
 
-        serialized_synapse = await serialize_response(response_content=synapse)
-        response = JSONResponse(
-            status_code=synapse.axon.status_code,
-            content=serialized_synapse,
-        )
+        if content_type == MSGPACK_CONTENT_TYPE:
+            response = Response(
+                status_code=synapse.axon.status_code,
+                content=synapse.to_msgpack(),
+                media_type=MSGPACK_CONTENT_TYPE,
+            )
+        else:
+            serialized_synapse = await serialize_response(response_content=synapse)
+            response = JSONResponse(
+                status_code=synapse.axon.status_code,
+                content=serialized_synapse,
+            )
 
         try:
             updated_headers = synapse.to_headers()
@@ -26,3 +26,10 @@ BITTENSOR_LOGGER_NAME = "bittensor"
 DEFAULT_LOG_FILE_NAME = "bittensor.log"
 DEFAULT_MAX_ROTATING_LOG_FILE_SIZE = 25 * 1024 * 1024
 DEFAULT_LOG_BACKUP_COUNT = 10
+# Records are shipped to the queue listener in batches of at most DEFAULT_LOG_BATCH_SIZE records, or after
+# DEFAULT_LOG_FLUSH_INTERVAL seconds. At most DEFAULT_LOG_MAX_IN_FLIGHT batches wait on the queue, and at most
+# DEFAULT_LOG_MAX_PENDING records wait for one of them to be handled.
+DEFAULT_LOG_BATCH_SIZE = 64
+DEFAULT_LOG_FLUSH_INTERVAL = 0.1
+DEFAULT_LOG_MAX_PENDING = 10_000
+DEFAULT_LOG_MAX_IN_FLIGHT = 64
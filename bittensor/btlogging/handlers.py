@@ -0,0 +1,254 @@
+# The MIT License (MIT)
+# Copyright © 2023 OpenTensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+btlogging.handlers module provides the queue handler and listener shipping log records in batches.
+
+:class:`BatchingQueueHandler` buffers the records of the logging process and puts them on the queue as lists, so that
+a batch of records is pickled and sent at once instead of one record at a time. :class:`BatchingQueueListener` accepts
+both these batches and single records put by a plain :class:`logging.handlers.QueueHandler`.
+"""
+
+import logging
+import os
+import queue
+import threading
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing.synchronize import Semaphore
+from typing import Deque, Dict, Optional
+
+from bittensor.btlogging.defines import (
+    DEFAULT_LOG_BATCH_SIZE,
+    DEFAULT_LOG_FLUSH_INTERVAL,
+    DEFAULT_LOG_MAX_PENDING,
+)
+
+# Time in seconds closing handlers wait for the listener to take each remaining batch.
+CLOSE_TIMEOUT = 1.0
+
+
+class TrackedBatch(list):
+    """A batch of records holding a slot of the ``in_flight`` semaphore until it is handled by the listener."""
+
+
+class BatchingQueueHandler(QueueHandler):
+    """
+    Queue handler putting lists of records on the queue.
+
+    Records are prepared as by :class:`logging.handlers.QueueHandler` and kept in a buffer, which is put on the queue
+    once it holds ``batch_size`` records, a record of ``flush_level`` or above is emitted, or ``flush_interval``
+    seconds after the first buffered record, by a background thread.
+
+    Queues such as :class:`multiprocessing.Queue` buffer without bound when the listener falls behind, so the number
+    of batches on the queue is bounded by ``in_flight``, a semaphore shared with a :class:`BatchingQueueListener`
+    that releases it once a batch is handled. Logging never blocks on the listener: while no slot is free or the
+    queue is full, the records stay buffered, and past ``max_pending`` buffered records the oldest ones are dropped.
+
+    Args:
+        queue: The queue the records are put on, e.g. a :class:`multiprocessing.Queue`.
+        batch_size (int): The maximum number of records put on the queue at once.
+        flush_interval (float): The maximum time in seconds a record is buffered while the queue accepts batches.
+        max_pending (int): The maximum number of buffered records, the oldest are dropped past it.
+        flush_level (int): Records of this level or above are put on the queue immediately.
+        in_flight (multiprocessing.Semaphore, optional): Slots for the batches put on the queue and not yet handled
+            by the listener. Without it only the size of the queue bounds them.
+    """
+
+    def __init__(
+        self,
+        queue,
+        batch_size: int = DEFAULT_LOG_BATCH_SIZE,
+        flush_interval: float = DEFAULT_LOG_FLUSH_INTERVAL,
+        max_pending: int = DEFAULT_LOG_MAX_PENDING,
+        flush_level: int = logging.ERROR,
+        in_flight: Optional[Semaphore] = None,
+    ):
+        super().__init__(queue)
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        if max_pending < batch_size:
+            raise ValueError(
+                f"max_pending must be at least batch_size ({batch_size}), got {max_pending}"
+            )
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.flush_level = flush_level
+        self.in_flight = in_flight
+
+        self._pending: Deque[logging.LogRecord] = deque()
+        self._queued = 0
+        self._dropped = 0
+        self._batches = 0
+
+        self._has_pending = threading.Event()
+        self._stopping = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_pid: Optional[int] = None
+
+    def emit(self, record: logging.LogRecord):
+        """
+        Buffers the prepared record, and flushes the buffer if it is full or the record is of ``flush_level``.
+
+        Like :func:`logging.Handler.emit`, it is called with the handler lock held.
+        """
+        try:
+            record = self.prepare(record)
+            if len(self._pending) >= self.max_pending:
+                self._pending.popleft()
+                self._dropped += 1
+            self._pending.append(record)
+
+            if (
+                len(self._pending) >= self.batch_size
+                or record.levelno >= self.flush_level
+            ):
+                self._flush_pending()
+            if self._pending:
+                self._has_pending.set()
+                self._ensure_flusher()
+        except Exception:
+            self.handleError(record)
+
+    def _flush_pending(self, timeout: Optional[float] = None):
+        """
+        Puts the buffered records on the queue, in batches, until it is empty, the queue is full or no slot of
+        ``in_flight`` is free within ``timeout`` seconds.
+        """
+        while self._pending:
+            count = min(len(self._pending), self.batch_size)
+            records = [self._pending[index] for index in range(count)]
+            if self.in_flight is None:
+                batch = records
+            elif self.in_flight.acquire(timeout is not None, timeout):
+                batch = TrackedBatch(records)
+            else:
+                return
+            try:
+                self.queue.put_nowait(batch)
+            except queue.Full:
+                if self.in_flight is not None:
+                    self.in_flight.release()
+                return
+            for _ in range(count):
+                self._pending.popleft()
+            self._queued += count
+            self._batches += 1
+        self._has_pending.clear()
+
+    def flush(self):
+        """Puts the buffered records on the queue, the records not accepted by a full queue stay buffered."""
+        self.acquire()
+        try:
+            self._flush_pending()
+        finally:
+            self.release()
+
+    def _ensure_flusher(self):
+        # The thread is not inherited by forked processes, they start their own.
+        if self._flusher_pid == os.getpid() or self._stopping.is_set():
+            return
+        self._flusher_pid = os.getpid()
+        self._flusher = threading.Thread(
+            target=self._run_flusher, name="BatchingQueueHandler", daemon=True
+        )
+        self._flusher.start()
+
+    def _run_flusher(self):
+        while not self._stopping.is_set():
+            self._has_pending.wait()
+            # Coalesce the records emitted within the interval.
+            if self._stopping.wait(self.flush_interval):
+                return
+            try:
+                self.flush()
+            except Exception:
+                # The queue was closed, nothing can be shipped anymore.
+                return
+
+    def close(self):
+        """Stops the background thread and puts the remaining buffered records on the queue."""
+        self._stopping.set()
+        self._has_pending.set()
+        if (
+            self._flusher is not None
+            and self._flusher_pid == os.getpid()
+            and self._flusher is not threading.current_thread()
+        ):
+            self._flusher.join()
+        self.acquire()
+        try:
+            self._flush_pending(CLOSE_TIMEOUT)
+            self._dropped += len(self._pending)
+            self._pending.clear()
+        finally:
+            self.release()
+        super().close()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters of the records handled so far.
+
+        Returns:
+            Dict[str, int]: ``queued`` records and ``batches`` put on the queue, buffered ``pending`` records, and
+            ``dropped`` records discarded because the queue could not keep up.
+        """
+        return {
+            "queued": self._queued,
+            "batches": self._batches,
+            "pending": len(self._pending),
+            "dropped": self._dropped,
+        }
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    Queue listener handling the batches of :class:`BatchingQueueHandler`, as well as single records.
+
+    Args:
+        queue: The queue the records are taken from.
+        *handlers: The handlers of the records.
+        respect_handler_level (bool): Whether the level of the handlers is checked.
+        in_flight (multiprocessing.Semaphore, optional): The semaphore of the handlers, released for each of their
+            batches once handled.
+    """
+
+    def __init__(
+        self,
+        queue,
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+        in_flight: Optional[Semaphore] = None,
+    ):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self.in_flight = in_flight
+
+    def handle(self, record):
+        if isinstance(record, list):
+            try:
+                for item in record:
+                    super().handle(item)
+            finally:
+                if isinstance(record, TrackedBatch) and self.in_flight is not None:
+                    self.in_flight.release()
+        else:
+            super().handle(record)
+
+    def enqueue_sentinel(self):
+        # Wait for room in case the queue is bounded, rather than failing to stop the listener.
+        self.queue.put(self._sentinel)
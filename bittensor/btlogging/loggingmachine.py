@@ -28,8 +28,8 @@ import logging as stdlogging
 import multiprocessing as mp
 import os
 import sys
-from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
-from typing import NamedTuple
+from logging.handlers import QueueHandler, RotatingFileHandler
+from typing import Dict, NamedTuple
 
 from statemachine import StateMachine, State
 
@@ -41,8 +41,15 @@ from bittensor.btlogging.defines import (
     DEFAULT_LOG_FILE_NAME,
     DEFAULT_MAX_ROTATING_LOG_FILE_SIZE,
     DEFAULT_LOG_BACKUP_COUNT,
+    DEFAULT_LOG_MAX_IN_FLIGHT,
 )
-from bittensor.btlogging.format import BtStreamFormatter, BtFileFormatter
+from bittensor.btlogging.format import (
+    BtStreamFormatter,
+    BtFileFormatter,
+    SUCCESS_LEVEL_NUM,
+    TRACE_LEVEL_NUM,
+)
+from bittensor.btlogging.handlers import BatchingQueueHandler, BatchingQueueListener
 from bittensor.btlogging.helpers import all_loggers
 
 
@@ -93,6 +100,8 @@ class LoggingMachine(StateMachine):
         # basics
         super(LoggingMachine, self).__init__()
         self._queue = mp.Queue(-1)
+        # the queue is unbounded, the batches waiting on it are bounded instead.
+        self._in_flight = mp.Semaphore(DEFAULT_LOG_MAX_IN_FLIGHT)
         self._primary_loggers = {name}
         self._config = config
 
@@ -112,6 +121,13 @@ class LoggingMachine(StateMachine):
         # configure and start the queue listener
         self._listener = self._create_and_start_listener(self._handlers)
 
+        # records of all the loggers are shipped to the listener in batches by a
+        # single handler, flushed at exit before the listener is stopped.
+        self._queue_handler = BatchingQueueHandler(
+            self._queue, in_flight=self._in_flight
+        )
+        atexit.register(self._queue_handler.close)
+
         # set up all the loggers
         self._logger = self._initialize_bt_logger(name)
         self.disable_third_party_loggers()
@@ -155,7 +171,12 @@ class LoggingMachine(StateMachine):
         This listener receives records from a queue populated by the main bittensor logger, as well as 3rd party loggers
         """
 
-        listener = QueueListener(self._queue, *handlers, respect_handler_level=True)
+        listener = BatchingQueueListener(
+            self._queue,
+            *handlers,
+            respect_handler_level=True,
+            in_flight=self._in_flight,
+        )
         listener.start()
         atexit.register(listener.stop)
         return listener
@@ -164,10 +185,22 @@ class LoggingMachine(StateMachine):
         """
         Get the queue the QueueListener is publishing from.
 
-        To set up logging in a separate process, a QueueHandler must be added to all the desired loggers.
+        To set up logging in a separate process, a QueueHandler must be added to all the desired loggers. The queue is
+        unbounded, so that plain QueueHandlers never fail to put a record. Records can also be shipped in batches by a
+        :class:`bittensor.btlogging.handlers.BatchingQueueHandler`.
         """
         return self._queue
 
+    def queue_stats(self) -> Dict[str, int]:
+        """
+        Counters of the records shipped to the queue listener by this process.
+
+        Returns:
+            Dict[str, int]: ``queued`` records and ``batches`` put on the queue, buffered ``pending`` records, and
+            ``dropped`` records discarded because the listener could not keep up.
+        """
+        return self._queue_handler.stats()
+
     def _initialize_bt_logger(self, name):
         """
         Initialize logging for bittensor.
@@ -176,8 +209,7 @@ class LoggingMachine(StateMachine):
         silenced. Subsequent state transitions will handle all logger outputs.
         """
         logger = stdlogging.getLogger(name)
-        queue_handler = QueueHandler(self._queue)
-        logger.addHandler(queue_handler)
+        logger.addHandler(self._queue_handler)
         return logger
 
     def _deinitialize_bt_logger(self, name):
@@ -224,8 +256,7 @@ class LoggingMachine(StateMachine):
         for logger in all_loggers():
             if logger.name in self._primary_loggers:
                 continue
-            queue_handler = QueueHandler(self._queue)
-            logger.addHandler(queue_handler)
+            logger.addHandler(self._queue_handler)
             logger.setLevel(self._logger.level)
 
     def disable_third_party_loggers(self):
@@ -343,45 +374,70 @@ class LoggingMachine(StateMachine):
         """
         return self.current_state_value == "Trace"
 
+    def isEnabledFor(self, level: int) -> bool:
+        """
+        Checks if messages of the given level are logged, like :func:`logging.Logger.isEnabledFor`.
+
+        Callers building costly messages can check it first, so that nothing is formatted for dropped messages::
+
+            if bittensor.logging.isEnabledFor(TRACE_LEVEL_NUM):
+                bittensor.logging.trace(f"synapse | {synapse.get_total_size()} B")
+
+        Args:
+            level (int): The logging level, e.g. ``TRACE_LEVEL_NUM`` of :mod:`bittensor.btlogging.format`.
+
+        Returns:
+            bool: True if messages of ``level`` are logged, otherwise False.
+        """
+        return self._logger.isEnabledFor(level)
+
     def trace(self, msg="", prefix="", suffix="", *args, **kwargs):
         """Wraps trace message with prefix and suffix."""
-        msg = f"{prefix} - {msg} - {suffix}"
-        self._logger.trace(msg, *args, **kwargs)
+        if self._logger.isEnabledFor(TRACE_LEVEL_NUM):
+            msg = f"{prefix} - {msg} - {suffix}"
+            self._logger.trace(msg, *args, **kwargs)
 
     def debug(self, msg="", prefix="", suffix="", *args, **kwargs):
         """Wraps debug message with prefix and suffix."""
-        msg = f"{prefix} - {msg} - {suffix}"
-        self._logger.debug(msg, *args, **kwargs)
+        if self._logger.isEnabledFor(stdlogging.DEBUG):
+            msg = f"{prefix} - {msg} - {suffix}"
+            self._logger.debug(msg, *args, **kwargs)
 
     def info(self, msg="", prefix="", suffix="", *args, **kwargs):
         """Wraps info message with prefix and suffix."""
-        msg = f"{prefix} - {msg} - {suffix}"
-        self._logger.info(msg, *args, **kwargs)
+        if self._logger.isEnabledFor(stdlogging.INFO):
+            msg = f"{prefix} - {msg} - {suffix}"
+            self._logger.info(msg, *args, **kwargs)
 
     def success(self, msg="", prefix="", suffix="", *args, **kwargs):
         """Wraps success message with prefix and suffix."""
-        msg = f"{prefix} - {msg} - {suffix}"
-        self._logger.success(msg, *args, **kwargs)
+        if self._logger.isEnabledFor(SUCCESS_LEVEL_NUM):
+            msg = f"{prefix} - {msg} - {suffix}"
+            self._logger.success(msg, *args, **kwargs)
 
     def warning(self, msg="", prefix="", suffix="", *args, **kwargs):
         """Wraps warning message with prefix and suffix."""
-        msg = f"{prefix} - {msg} - {suffix}"
-        self._logger.warning(msg, *args, **kwargs)
+        if self._logger.isEnabledFor(stdlogging.WARNING):
+            msg = f"{prefix} - {msg} - {suffix}"
+            self._logger.warning(msg, *args, **kwargs)
 
     def error(self, msg="", prefix="", suffix="", *args, **kwargs):
         """Wraps error message with prefix and suffix."""
-        msg = f"{prefix} - {msg} - {suffix}"
-        self._logger.error(msg, *args, **kwargs)
+        if self._logger.isEnabledFor(stdlogging.ERROR):
+            msg = f"{prefix} - {msg} - {suffix}"
+            self._logger.error(msg, *args, **kwargs)
 
     def critical(self, msg="", prefix="", suffix="", *args, **kwargs):
         """Wraps critical message with prefix and suffix."""
-        msg = f"{prefix} - {msg} - {suffix}"
-        self._logger.critical(msg, *args, **kwargs)
+        if self._logger.isEnabledFor(stdlogging.CRITICAL):
+            msg = f"{prefix} - {msg} - {suffix}"
+            self._logger.critical(msg, *args, **kwargs)
 
     def exception(self, msg="", prefix="", suffix="", *args, **kwargs):
         """Wraps exception message with prefix and suffix."""
-        msg = f"{prefix} - {msg} - {suffix}"
-        self._logger.exception(msg, *args, **kwargs)
+        if self._logger.isEnabledFor(stdlogging.ERROR):
+            msg = f"{prefix} - {msg} - {suffix}"
+            self._logger.exception(msg, *args, **kwargs)
 
     def on(self):
         """Enable default state."""
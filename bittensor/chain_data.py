@@ -21,17 +21,20 @@ including neuron and subnet information, SCALE encoding/decoding, and custom RPC
 """
 
 import json
+import struct
+import threading
 from dataclasses import dataclass, asdict
 from enum import Enum
-from typing import List, Tuple, Dict, Optional, Any, TypedDict, Union
+from typing import List, Tuple, Dict, Optional, Any, TypedDict, Type, Union
 
-from scalecodec.base import RuntimeConfiguration, ScaleBytes
+import numpy as np
+from scalecodec.base import RuntimeConfigurationObject, ScaleBytes, ScaleType
 from scalecodec.type_registry import load_type_registry_preset
 from scalecodec.types import GenericCall
 from scalecodec.utils.ss58 import ss58_encode
 
 import bittensor
-from .utils import networking as net, RAOPERTAO, U16_NORMALIZED_FLOAT
+from .utils import networking as net, RAOPERTAO, U16_MAX, U16_NORMALIZED_FLOAT
 from .utils.balance import Balance
 from .utils.registration import torch, use_torch
 
@@ -381,15 +384,69 @@ def from_scale_encoding_using_type_string(
 
         as_scale_bytes = ScaleBytes(as_bytes)
 
-    rpc_runtime_config = RuntimeConfiguration()
-    rpc_runtime_config.update_type_registry(load_type_registry_preset("legacy"))
-    rpc_runtime_config.update_type_registry(custom_rpc_type_registry)
-
-    obj = rpc_runtime_config.create_scale_object(type_string, data=as_scale_bytes)
+    obj = create_rpc_scale_object(type_string, data=as_scale_bytes)
 
     return obj.decode()
 
 
+_rpc_runtime_config: Optional[RuntimeConfigurationObject] = None
+_rpc_decoder_classes: Dict[str, Type[ScaleType]] = {}
+_rpc_runtime_config_lock = threading.RLock()
+
+
+def get_rpc_runtime_config() -> RuntimeConfigurationObject:
+    """
+    Returns the runtime configuration decoding the results of the runtime API calls.
+
+    The configuration holds the ``legacy`` type registry preset and :data:`custom_rpc_type_registry`. It is created
+    on the first call and shared by the whole process.
+
+    Returns:
+        RuntimeConfigurationObject: The runtime configuration of the runtime API types.
+    """
+    global _rpc_runtime_config
+    if _rpc_runtime_config is None:
+        with _rpc_runtime_config_lock:
+            if _rpc_runtime_config is None:
+                runtime_config = RuntimeConfigurationObject()
+                runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+                runtime_config.update_type_registry(custom_rpc_type_registry)
+                _rpc_runtime_config = runtime_config
+    return _rpc_runtime_config
+
+
+def create_rpc_scale_object(
+    type_string: str, data: Optional[ScaleBytes] = None
+) -> ScaleType:
+    """
+    Creates a SCALE object of the type string from the runtime configuration of :func:`get_rpc_runtime_config`.
+
+    The decoder class of each type string, e.g. ``Vec<NeuronInfoLite>``, is looked up once and reused by the later
+    calls, instead of parsing the type string again.
+
+    Args:
+        type_string (str): The type of the SCALE object, e.g. ``Vec<NeuronInfoLite>``.
+        data (Optional[ScaleBytes]): The SCALE encoded data to decode.
+
+    Returns:
+        ScaleType: The SCALE object.
+
+    Raises:
+        NotImplementedError: If no decoder exists for the type string.
+    """
+    runtime_config = get_rpc_runtime_config()
+    decoder_class = _rpc_decoder_classes.get(type_string)
+    if decoder_class is None:
+        with _rpc_runtime_config_lock:
+            decoder_class = runtime_config.get_decoder_class(type_string)
+            if decoder_class is None:
+                raise NotImplementedError(
+                    f'Decoder class for "{type_string}" not found'
+                )
+            _rpc_decoder_classes[type_string] = decoder_class
+    return decoder_class(data=data, runtime_config=runtime_config)
+
+
 # Dataclasses for chain data.
 @dataclass
 class NeuronInfo:
@@ -665,6 +722,498 @@ class NeuronInfoLite:
         return neuron
 
 
+def _read_compact(data: bytes, offset: int) -> Tuple[int, int]:
+    """Reads a SCALE ``Compact`` integer at ``offset``, returns its value and the offset following it."""
+    mode = data[offset] & 0b11
+    if mode == 0:
+        return data[offset] >> 2, offset + 1
+    if mode == 1:
+        return int.from_bytes(data[offset : offset + 2], "little") >> 2, offset + 2
+    if mode == 2:
+        return int.from_bytes(data[offset : offset + 4], "little") >> 2, offset + 4
+    length = (data[offset] >> 2) + 4
+    return (
+        int.from_bytes(data[offset + 1 : offset + 1 + length], "little"),
+        offset + 1 + length,
+    )
+
+
+def _balance_rao(balance: Union[Balance, int, float]) -> int:
+    return balance.rao if isinstance(balance, Balance) else Balance(balance).rao
+
+
+# block, version, ip, port, ip_type and, for the axon only, protocol and the two placeholders.
+_AXON_INFO_FORMAT = struct.Struct("<QI16sHBBBB")
+_PROMETHEUS_INFO_FORMAT = struct.Struct("<QI16sHB")
+# The columns of NeuronInfoLiteColumns with one value per neuron, besides the key indices.
+_NEURON_LITE_COLUMNS = (
+    "uid",
+    "netuid",
+    "active",
+    "stake",
+    "stake_rao",
+    "rank",
+    "emission",
+    "incentive",
+    "consensus",
+    "trust",
+    "validator_trust",
+    "dividends",
+    "last_update",
+    "validator_permit",
+    "pruning_score",
+    "axon_version",
+    "axon_ip",
+    "axon_port",
+    "axon_ip_type",
+    "prometheus_block",
+    "prometheus_version",
+    "prometheus_ip",
+    "prometheus_port",
+    "prometheus_ip_type",
+)
+
+
+def _stake_entries(stake_indptr: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Returns the indices of the stakes of some rows of :class:`NeuronInfoLiteColumns`, in the order of the rows."""
+    counts = stake_indptr[rows + 1] - stake_indptr[rows]
+    starts = np.repeat(stake_indptr[rows] - (np.cumsum(counts) - counts), counts)
+    return starts + np.arange(counts.sum(), dtype=np.int64)
+
+
+@dataclass
+class NeuronInfoLiteColumns:
+    """
+    Columnar form of a list of :class:`NeuronInfoLite`, one NumPy array per attribute.
+
+    :func:`from_vec_u8` parses the SCALE encoded ``Vec<NeuronInfoLite>`` returned by the ``get_neurons_lite`` runtime
+    API straight into the arrays, without decoding a dictionary and creating the dataclasses of every neuron. The
+    hotkeys and coldkeys are indices in the ``keys`` string table, each distinct account is ss58 encoded once. The
+    amounts staked by each coldkey to neuron ``i`` are at ``stake_indptr[i]:stake_indptr[i + 1]`` of
+    ``stake_coldkey_index`` and ``stake_amounts``.
+
+    Values are converted as by :func:`NeuronInfoLite.fix_decoded_values`: ``stake`` and ``emission`` are in tao,
+    ``stake_rao`` and ``stake_amounts`` in rao, and the ``u16`` scores normalized to ``[0, 1]``. :func:`to_neurons` and :func:`axons` create the objects when they
+    are needed.
+    """
+
+    keys: List[str]
+    hotkey_index: np.ndarray
+    coldkey_index: np.ndarray
+    uid: np.ndarray
+    netuid: np.ndarray
+    active: np.ndarray
+    stake: np.ndarray
+    stake_rao: np.ndarray
+    stake_indptr: np.ndarray
+    stake_coldkey_index: np.ndarray
+    stake_amounts: np.ndarray
+    rank: np.ndarray
+    emission: np.ndarray
+    incentive: np.ndarray
+    consensus: np.ndarray
+    trust: np.ndarray
+    validator_trust: np.ndarray
+    dividends: np.ndarray
+    last_update: np.ndarray
+    validator_permit: np.ndarray
+    pruning_score: np.ndarray
+    axon_version: np.ndarray
+    axon_ip: np.ndarray
+    axon_port: np.ndarray
+    axon_ip_type: np.ndarray
+    prometheus_block: np.ndarray
+    prometheus_version: np.ndarray
+    prometheus_ip: np.ndarray
+    prometheus_port: np.ndarray
+    prometheus_ip_type: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.uid)
+
+    @property
+    def hotkeys(self) -> List[str]:
+        """The ss58 address of the hotkey of each neuron."""
+        return [self.keys[index] for index in self.hotkey_index]
+
+    @property
+    def coldkeys(self) -> List[str]:
+        """The ss58 address of the coldkey of each neuron."""
+        return [self.keys[index] for index in self.coldkey_index]
+
+    @property
+    def total_stake(self) -> np.ndarray:
+        """The total stake of each neuron in tao, the same as :attr:`stake`."""
+        return self.stake
+
+    @classmethod
+    def from_vec_u8(cls, vec_u8: Union[List[int], bytes]) -> "NeuronInfoLiteColumns":
+        """
+        Parses a SCALE encoded ``Vec<NeuronInfoLite>`` into columns.
+
+        Args:
+            vec_u8 (Union[List[int], bytes]): The SCALE encoded neurons, e.g. the result of ``get_neurons_lite``.
+
+        Returns:
+            NeuronInfoLiteColumns: The columns of the neurons.
+
+        Raises:
+            ValueError: If the data is not a valid ``Vec<NeuronInfoLite>``.
+        """
+        data = bytes(vec_u8)
+        try:
+            return cls._parse(data)
+        except (IndexError, struct.error) as e:
+            raise ValueError("Invalid Vec<NeuronInfoLite> encoding") from e
+
+    @classmethod
+    def _parse(cls, data: bytes) -> "NeuronInfoLiteColumns":
+        if not data:
+            return cls.from_neurons([])
+        n, offset = _read_compact(data, 0)
+        key_indices: Dict[bytes, int] = {}
+        raw_keys: List[bytes] = []
+
+        def key_index(key: bytes) -> int:
+            index = key_indices.get(key)
+            if index is None:
+                index = key_indices[key] = len(raw_keys)
+                raw_keys.append(key)
+            return index
+
+        hotkey_index = np.empty(n, dtype=np.int32)
+        coldkey_index = np.empty(n, dtype=np.int32)
+        stake_indptr = np.zeros(n + 1, dtype=np.int64)
+        stake_coldkey_index: List[int] = []
+        stake_amounts: List[int] = []
+        uid: List[int] = []
+        netuid: List[int] = []
+        axon_version: List[int] = []
+        axon_ip: List[int] = []
+        axon_port: List[int] = []
+        axon_ip_type: List[int] = []
+        prometheus_block: List[int] = []
+        prometheus_version: List[int] = []
+        prometheus_ip: List[int] = []
+        prometheus_port: List[int] = []
+        prometheus_ip_type: List[int] = []
+        # rank, emission, incentive, consensus, trust, validator_trust, dividends and last_update, in encoding order.
+        scores: Tuple[List[int], ...] = tuple([] for _ in range(8))
+        pruning_score: List[int] = []
+        active = np.empty(n, dtype=bool)
+        validator_permit = np.empty(n, dtype=bool)
+        stake = np.empty(n, dtype=np.float64)
+        stake_rao = np.empty(n, dtype=np.uint64)
+
+        for i in range(n):
+            hotkey_index[i] = key_index(data[offset : offset + 32])
+            coldkey_index[i] = key_index(data[offset + 32 : offset + 64])
+            value, offset = _read_compact(data, offset + 64)
+            uid.append(value)
+            value, offset = _read_compact(data, offset)
+            netuid.append(value)
+            active[i] = data[offset]
+            offset += 1
+
+            _, version, ip, port, ip_type, _, _, _ = _AXON_INFO_FORMAT.unpack_from(
+                data, offset
+            )
+            offset += _AXON_INFO_FORMAT.size
+            axon_version.append(version)
+            axon_ip.append(int.from_bytes(ip, "little"))
+            axon_port.append(port)
+            axon_ip_type.append(ip_type)
+
+            block, version, ip, port, ip_type = _PROMETHEUS_INFO_FORMAT.unpack_from(
+                data, offset
+            )
+            offset += _PROMETHEUS_INFO_FORMAT.size
+            prometheus_block.append(block)
+            prometheus_version.append(version)
+            prometheus_ip.append(int.from_bytes(ip, "little"))
+            prometheus_port.append(port)
+            prometheus_ip_type.append(ip_type)
+
+            stakes, offset = _read_compact(data, offset)
+            total = 0
+            for _ in range(stakes):
+                stake_coldkey_index.append(key_index(data[offset : offset + 32]))
+                amount, offset = _read_compact(data, offset + 32)
+                stake_amounts.append(amount)
+                total += amount
+            stake_indptr[i + 1] = stake_indptr[i] + stakes
+            stake_rao[i] = total
+            stake[i] = Balance.from_rao(total).tao
+
+            for column in scores:
+                value, offset = _read_compact(data, offset)
+                column.append(value)
+            validator_permit[i] = data[offset]
+            offset += 1
+            value, offset = _read_compact(data, offset)
+            pruning_score.append(value)
+
+        rank, emission, incentive, consensus, trust, validator_trust, dividends = (
+            np.array(column, dtype=np.float64) for column in scores[:7]
+        )
+        ss58_format = bittensor.__ss58_format__
+        return cls(
+            keys=[ss58_encode(key, ss58_format) for key in raw_keys],
+            hotkey_index=hotkey_index,
+            coldkey_index=coldkey_index,
+            uid=np.array(uid, dtype=np.int64),
+            netuid=np.array(netuid, dtype=np.int64),
+            active=active,
+            stake=stake,
+            stake_rao=stake_rao,
+            stake_indptr=stake_indptr,
+            stake_coldkey_index=np.array(stake_coldkey_index, dtype=np.int32),
+            stake_amounts=np.array(stake_amounts, dtype=np.uint64),
+            rank=rank / U16_MAX,
+            emission=emission / RAOPERTAO,
+            incentive=incentive / U16_MAX,
+            consensus=consensus / U16_MAX,
+            trust=trust / U16_MAX,
+            validator_trust=validator_trust / U16_MAX,
+            dividends=dividends / U16_MAX,
+            last_update=np.array(scores[7], dtype=np.int64),
+            validator_permit=validator_permit,
+            pruning_score=np.array(pruning_score, dtype=np.int64),
+            axon_version=np.array(axon_version, dtype=np.int64),
+            axon_ip=np.array(axon_ip, dtype=object),
+            axon_port=np.array(axon_port, dtype=np.int64),
+            axon_ip_type=np.array(axon_ip_type, dtype=np.int64),
+            prometheus_block=np.array(prometheus_block, dtype=np.int64),
+            prometheus_version=np.array(prometheus_version, dtype=np.int64),
+            prometheus_ip=np.array(prometheus_ip, dtype=object),
+            prometheus_port=np.array(prometheus_port, dtype=np.int64),
+            prometheus_ip_type=np.array(prometheus_ip_type, dtype=np.int64),
+        )
+
+    @classmethod
+    def from_neurons(cls, neurons: List["NeuronInfoLite"]) -> "NeuronInfoLiteColumns":
+        """
+        Builds the columns of a list of neurons, e.g. the neurons of a mock subtensor.
+
+        Args:
+            neurons (List[NeuronInfoLite]): The neurons.
+
+        Returns:
+            NeuronInfoLiteColumns: The columns of the neurons.
+        """
+        key_indices: Dict[str, int] = {}
+
+        def key_index(key: str) -> int:
+            return key_indices.setdefault(key, len(key_indices))
+
+        stake_coldkey_index: List[int] = []
+        stake_amounts: List[int] = []
+        stake_indptr = [0]
+        for neuron in neurons:
+            for coldkey, amount in neuron.stake_dict.items():
+                stake_coldkey_index.append(key_index(coldkey))
+                stake_amounts.append(int(amount.rao))
+            stake_indptr.append(len(stake_amounts))
+
+        def column(values, dtype):
+            return np.array(list(values), dtype=dtype)
+
+        def info_column(info_name, attribute, dtype):
+            return column(
+                (
+                    getattr(getattr(neuron, info_name), attribute)
+                    if getattr(neuron, info_name) is not None
+                    else 0
+                    for neuron in neurons
+                ),
+                dtype,
+            )
+
+        def ip_column(info_name):
+            return column(
+                (
+                    net.ip_to_int(getattr(neuron, info_name).ip)
+                    if getattr(neuron, info_name) is not None
+                    else 0
+                    for neuron in neurons
+                ),
+                object,
+            )
+
+        hotkey_index = column((key_index(n.hotkey) for n in neurons), np.int32)
+        coldkey_index = column((key_index(n.coldkey) for n in neurons), np.int32)
+        return cls(
+            keys=list(key_indices),
+            hotkey_index=hotkey_index,
+            coldkey_index=coldkey_index,
+            uid=column((n.uid for n in neurons), np.int64),
+            netuid=column((n.netuid for n in neurons), np.int64),
+            active=column((n.active for n in neurons), bool),
+            stake=column((float(n.stake) for n in neurons), np.float64),
+            stake_rao=column((_balance_rao(n.stake) for n in neurons), np.uint64),
+            stake_indptr=np.array(stake_indptr, dtype=np.int64),
+            stake_coldkey_index=np.array(stake_coldkey_index, dtype=np.int32),
+            stake_amounts=np.array(stake_amounts, dtype=np.uint64),
+            rank=column((n.rank for n in neurons), np.float64),
+            emission=column((n.emission for n in neurons), np.float64),
+            incentive=column((n.incentive for n in neurons), np.float64),
+            consensus=column((n.consensus for n in neurons), np.float64),
+            trust=column((n.trust for n in neurons), np.float64),
+            validator_trust=column((n.validator_trust for n in neurons), np.float64),
+            dividends=column((n.dividends for n in neurons), np.float64),
+            last_update=column((n.last_update for n in neurons), np.int64),
+            validator_permit=column((n.validator_permit for n in neurons), bool),
+            pruning_score=column((n.pruning_score for n in neurons), np.int64),
+            axon_version=info_column("axon_info", "version", np.int64),
+            axon_ip=ip_column("axon_info"),
+            axon_port=info_column("axon_info", "port", np.int64),
+            axon_ip_type=info_column("axon_info", "ip_type", np.int64),
+            prometheus_block=info_column("prometheus_info", "block", np.int64),
+            prometheus_version=info_column("prometheus_info", "version", np.int64),
+            prometheus_ip=ip_column("prometheus_info"),
+            prometheus_port=info_column("prometheus_info", "port", np.int64),
+            prometheus_ip_type=info_column("prometheus_info", "ip_type", np.int64),
+        )
+
+    def changed(self, other: "NeuronInfoLiteColumns") -> np.ndarray:
+        """
+        Compares the columns with the columns of the same neurons at a later block.
+
+        Args:
+            other (NeuronInfoLiteColumns): The neurons at the later block, with the same number of neurons.
+
+        Returns:
+            np.ndarray: The UIDs of the neurons with any different value, including their keys and stakes.
+        """
+        if len(other) != len(self):
+            raise ValueError(
+                f"Cannot compare {len(self)} neurons with {len(other)} neurons."
+            )
+        keys = np.array(self.keys, dtype=object)
+        other_keys = np.array(other.keys, dtype=object)
+        differs = (keys[self.hotkey_index] != other_keys[other.hotkey_index]) | (
+            keys[self.coldkey_index] != other_keys[other.coldkey_index]
+        )
+        for name in _NEURON_LITE_COLUMNS:
+            differs |= getattr(self, name) != getattr(other, name)
+
+        # The stakes by each coldkey are compared for the neurons staked to by as many coldkeys at both blocks.
+        counts = np.diff(self.stake_indptr)
+        differs |= counts != np.diff(other.stake_indptr)
+        rows = np.flatnonzero(~differs & (counts > 0))
+        entries = _stake_entries(self.stake_indptr, rows)
+        other_entries = _stake_entries(other.stake_indptr, rows)
+        entry_differs = (
+            keys[self.stake_coldkey_index[entries]]
+            != other_keys[other.stake_coldkey_index[other_entries]]
+        ) | (self.stake_amounts[entries] != other.stake_amounts[other_entries])
+        differs[np.repeat(rows, counts[rows])[entry_differs]] = True
+        return self.uid[differs]
+
+    def take(self, rows: np.ndarray) -> "NeuronInfoLiteColumns":
+        """
+        Selects some of the neurons.
+
+        Args:
+            rows (np.ndarray): The indices of the neurons, e.g. their UIDs.
+
+        Returns:
+            NeuronInfoLiteColumns: The columns of the selected neurons, sharing the key table of these columns.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        entries = _stake_entries(self.stake_indptr, rows)
+        stake_indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(
+            self.stake_indptr[rows + 1] - self.stake_indptr[rows], out=stake_indptr[1:]
+        )
+        return NeuronInfoLiteColumns(
+            keys=self.keys,
+            hotkey_index=self.hotkey_index[rows],
+            coldkey_index=self.coldkey_index[rows],
+            stake_indptr=stake_indptr,
+            stake_coldkey_index=self.stake_coldkey_index[entries],
+            stake_amounts=self.stake_amounts[entries],
+            **{name: getattr(self, name)[rows] for name in _NEURON_LITE_COLUMNS},
+        )
+
+    def axons(self) -> List[AxonInfo]:
+        """
+        Creates the axon information of the neurons.
+
+        Returns:
+            List[AxonInfo]: The axon of each neuron, as :attr:`NeuronInfoLite.axon_info`.
+        """
+        keys = self.keys
+        return [
+            AxonInfo(
+                version=int(version),
+                ip=net.int_to_ip(int(ip)),
+                port=int(port),
+                ip_type=int(ip_type),
+                hotkey=keys[hotkey],
+                coldkey=keys[coldkey],
+            )
+            for version, ip, port, ip_type, hotkey, coldkey in zip(
+                self.axon_version,
+                self.axon_ip,
+                self.axon_port,
+                self.axon_ip_type,
+                self.hotkey_index,
+                self.coldkey_index,
+            )
+        ]
+
+    def to_neurons(self) -> List["NeuronInfoLite"]:
+        """
+        Creates the neurons of the columns.
+
+        Returns:
+            List[NeuronInfoLite]: The neurons, as returned by :func:`NeuronInfoLite.list_from_vec_u8`.
+        """
+        keys = self.keys
+        neurons = []
+        for i, axon_info in enumerate(self.axons()):
+            start, end = self.stake_indptr[i], self.stake_indptr[i + 1]
+            stake_dict = {
+                keys[coldkey]: Balance.from_rao(int(amount))
+                for coldkey, amount in zip(
+                    self.stake_coldkey_index[start:end], self.stake_amounts[start:end]
+                )
+            }
+            stake = sum(stake_dict.values())
+            neurons.append(
+                NeuronInfoLite(
+                    hotkey=axon_info.hotkey,
+                    coldkey=axon_info.coldkey,
+                    uid=int(self.uid[i]),
+                    netuid=int(self.netuid[i]),
+                    active=bool(self.active[i]),
+                    stake=stake,
+                    stake_dict=stake_dict,
+                    total_stake=stake,
+                    rank=float(self.rank[i]),
+                    emission=float(self.emission[i]),
+                    incentive=float(self.incentive[i]),
+                    consensus=float(self.consensus[i]),
+                    trust=float(self.trust[i]),
+                    validator_trust=float(self.validator_trust[i]),
+                    dividends=float(self.dividends[i]),
+                    last_update=int(self.last_update[i]),
+                    validator_permit=bool(self.validator_permit[i]),
+                    prometheus_info=PrometheusInfo(
+                        block=int(self.prometheus_block[i]),
+                        version=int(self.prometheus_version[i]),
+                        ip=net.int_to_ip(int(self.prometheus_ip[i])),
+                        port=int(self.prometheus_port[i]),
+                        ip_type=int(self.prometheus_ip_type[i]),
+                    ),
+                    axon_info=axon_info,
+                    pruning_score=int(self.pruning_score[i]),
+                )
+            )
+        return neurons
+
+
 @dataclass
 class PrometheusInfo:
     """Dataclass for prometheus info."""
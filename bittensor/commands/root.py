@@ -187,7 +187,13 @@ class RootList:
         )
         table.show_footer = True
 
-        for neuron_data in root_neurons:
+        with subtensor.batch() as batch:
+            total_stakes = [
+                batch.get_total_stake_for_hotkey(neuron_data.hotkey)
+                for neuron_data in root_neurons
+            ]
+
+        for neuron_data, total_stake in zip(root_neurons, total_stakes):
             table.add_row(
                 str(neuron_data.uid),
                 (
@@ -196,9 +202,7 @@ class RootList:
                     else ""
                 ),
                 neuron_data.hotkey,
-                "{:.5f}".format(
-                    float(subtensor.get_total_stake_for_hotkey(neuron_data.hotkey))
-                ),
+                "{:.5f}".format(float(total_stake.value)),
                 "Yes" if neuron_data.hotkey in senate_members else "No",
             )
 
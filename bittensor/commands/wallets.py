@@ -721,6 +721,20 @@ def _get_coldkey_ss58_addresses_for_path(path: str) -> Tuple[List[str], List[str
     return addresses, wallet_names
 
 
+def _get_balances(
+    subtensor: "bittensor.subtensor", coldkeys: List[str]
+) -> Tuple[List["bittensor.Balance"], List["bittensor.Balance"]]:
+    """Get the free and staked balances of the coldkeys in one batch of queries."""
+    with subtensor.batch() as batch:
+        free_balances = [batch.get_balance(coldkey) for coldkey in coldkeys]
+        staked_balances = [
+            batch.get_total_stake_for_coldkey(coldkey) for coldkey in coldkeys
+        ]
+    return [balance.value for balance in free_balances], [
+        balance.value for balance in staked_balances
+    ]
+
+
 class WalletBalanceCommand:
     """
     Executes the ``balance`` command to check the balance of the wallet on the Bittensor network.
@@ -789,14 +803,7 @@ class WalletBalanceCommand:
                 cli.config.wallet.path
             )
 
-            free_balances = [
-                subtensor.get_balance(coldkeys[i]) for i in range(len(coldkeys))
-            ]
-
-            staked_balances = [
-                subtensor.get_total_stake_for_coldkey(coldkeys[i])
-                for i in range(len(coldkeys))
-            ]
+            free_balances, staked_balances = _get_balances(subtensor, coldkeys)
 
             total_free_balance = sum(free_balances)
             total_staked_balance = sum(staked_balances)
@@ -816,14 +823,7 @@ class WalletBalanceCommand:
                 coldkeys = [coldkey_wallet.coldkeypub.ss58_address]
                 wallet_names = [coldkey_wallet.name]
 
-                free_balances = [
-                    subtensor.get_balance(coldkeys[i]) for i in range(len(coldkeys))
-                ]
-
-                staked_balances = [
-                    subtensor.get_total_stake_for_coldkey(coldkeys[i])
-                    for i in range(len(coldkeys))
-                ]
+                free_balances, staked_balances = _get_balances(subtensor, coldkeys)
 
                 total_free_balance = sum(free_balances)
                 total_staked_balance = sum(staked_balances)
@@ -17,4 +17,5 @@
 
 
 ALLOWED_DELTA = 4000000000  # Delta of 4 seconds for nonce validation
+NONCE_MAX_TIMEOUT = 600  # Longest timeout (s) that widens the window a nonce is accepted in
 V_7_2_0 = 7002000
@@ -20,15 +20,283 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import sys
 import uuid
+from types import SimpleNamespace
 import time
 import aiohttp
+import msgpack
 from aiohttp import ClientTimeout
+from pydantic_core import to_jsonable_python
 
 import bittensor
-from typing import Optional, List, Union, AsyncGenerator, Any
+from bittensor.btlogging.format import TRACE_LEVEL_NUM
+from bittensor.latency import LatencyPolicy, LatencyTracker
+from bittensor.synapse import (
+    JSON_CONTENT_TYPE,
+    MSGPACK_CONTENT_TYPE,
+    SynapseHeaderCodec,
+)
+from bittensor.synapse_history import NullSynapseHistory, SynapseHistory
+from bittensor.tensor import binary_transport
+from typing import (
+    Optional,
+    List,
+    Union,
+    AsyncGenerator,
+    Any,
+    ClassVar,
+    Dict,
+    Set,
+    Tuple,
+)
 from bittensor.utils.registration import torch, use_torch
 
+# Status message of the requests cancelled by the caller, e.g. once :func:`dendrite.forward` reached its quorum.
+CANCELLED_STATUS_MESSAGE = "Cancelled before a response was received."
+
+
+@dataclasses.dataclass(frozen=True)
+class ConnectorProfile:
+    """
+    Connection pool settings of the `aiohttp <https://github.com/aio-libs/aiohttp>`_ session of a dendrite.
+
+    The aiohttp defaults (100 connections in total, 15s keep-alive, 10s DNS cache) make a validator querying a
+    whole subnet queue its requests and reconnect to every axon each round. The default profile is sized for
+    one connection to each of ~1000 axons, kept alive between rounds.
+
+    Args:
+        limit (int): The maximum number of simultaneous connections, ``0`` for no limit.
+        limit_per_host (int): The maximum number of simultaneous connections to a single axon, ``0`` for no limit.
+        keepalive_timeout (float): Seconds an idle connection is kept in the pool.
+        use_dns_cache (bool): Whether resolved host names are cached.
+        ttl_dns_cache (int, optional): Seconds a resolved host name is cached, ``None`` caches forever.
+
+    aiohttp disables Nagle's algorithm (``TCP_NODELAY``) on every connection, so small requests are sent immediately.
+
+    An axon closes the connections idle for longer than its ``axon.keepalive_timeout`` (75s by default), which must
+    exceed ``keepalive_timeout`` for the pooled and warmed connections to be reused.
+    """
+
+    limit: int = 1024
+    limit_per_host: int = 16
+    keepalive_timeout: float = 60.0
+    use_dns_cache: bool = True
+    ttl_dns_cache: Optional[int] = 300
+
+    def create_connector(self) -> aiohttp.TCPConnector:
+        """
+        Returns a new connector configured by this profile, to be used by a single session.
+        """
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=self.use_dns_cache,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+
+
+class _PoolTrace:
+    """
+    Counts the connection pool events of a session through the public request tracing of aiohttp.
+    """
+
+    def __init__(self):
+        self.opened = 0
+        self.reused = 0
+        self.in_flight = 0
+        self.waiting = 0
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        callbacks = [
+            (trace_config.on_request_start, self._on_request_start),
+            (trace_config.on_request_end, self._on_request_done),
+            (trace_config.on_request_exception, self._on_request_done),
+            (trace_config.on_connection_queued_start, self._on_queued_start),
+            (trace_config.on_connection_queued_end, self._on_queued_end),
+            (trace_config.on_connection_create_end, self._on_connection_created),
+            (trace_config.on_connection_reuseconn, self._on_connection_reused),
+        ]
+        for signal, callback in callbacks:
+            # The signal annotations of aiohttp do not match the documented (session, context, params) callbacks.
+            signal.append(callback)  # type: ignore
+        return trace_config
+
+    async def _on_request_start(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestStartParams,
+    ) -> None:
+        self.in_flight += 1
+
+    async def _on_request_done(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: Union[
+            aiohttp.TraceRequestEndParams, aiohttp.TraceRequestExceptionParams
+        ],
+    ) -> None:
+        self.in_flight -= 1
+
+    async def _on_queued_start(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceConnectionQueuedStartParams,
+    ) -> None:
+        self.waiting += 1
+
+    async def _on_queued_end(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceConnectionQueuedEndParams,
+    ) -> None:
+        self.waiting -= 1
+
+    async def _on_connection_created(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceConnectionCreateEndParams,
+    ) -> None:
+        self.opened += 1
+        # ``warm_pool`` passes a dict to learn whether its request opened a connection.
+        if isinstance(context.trace_request_ctx, dict):
+            context.trace_request_ctx["opened"] = True
+
+    async def _on_connection_reused(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceConnectionReuseconnParams,
+    ) -> None:
+        self.reused += 1
+
+
+class BroadcastRequest:
+    """
+    Request body and headers shared by every target axon of a single :func:`dendrite.forward` call.
+
+    When the same synapse is sent to many axons, only the ``dendrite`` and ``axon`` terminal information differ
+    between the requests. The body hash, the header sizes and the JSON encoding of every other field are
+    therefore computed once, and each target only pays for signing and encoding its own terminal information.
+    The shared fields are encoded to JSON up front and to msgpack on first use.
+
+    Args:
+        synapse (bittensor.Synapse): The synapse to broadcast, with its timeout already set.
+        body_hash (str): The body hash of ``synapse``.
+
+    Use :func:`from_synapse` to build an instance, as not every synapse can share its body between targets.
+    """
+
+    # Fields filled in per target by :func:`dendrite.preprocess_synapse_for_request`.
+    PER_TARGET_FIELDS: ClassVar[Tuple[str, ...]] = ("dendrite", "axon")
+
+    def __init__(self, synapse: bittensor.Synapse, body_hash: str):
+        self.body_hash = body_hash
+        self.name = synapse.name
+        self.timeout = str(synapse.timeout)
+
+        headers = synapse.to_headers()
+        self.total_size = headers["total_size"]
+        self.input_obj_headers: Dict[str, str] = {
+            key: headers[key]
+            for _, key in synapse.header_codec().input_obj_keys
+            if key in headers
+        }
+
+        # Body without the per target fields, spliced back in by ``body``.
+        self.body_prefix = synapse.model_dump_json(
+            exclude=set(self.PER_TARGET_FIELDS)
+        ).encode()[:-1]
+
+        # Map entries of the shared fields in msgpack bodies, encoded on first use by ``body``.
+        self._msgpack_entries: Optional[Tuple[int, bytes]] = None
+
+    @classmethod
+    def from_synapse(cls, synapse: bittensor.Synapse) -> Optional["BroadcastRequest"]:
+        """
+        Builds the shared request for ``synapse``, or returns ``None`` if its body hash depends on per target fields.
+        """
+        if set(synapse.__class__.required_hash_fields) & set(cls.PER_TARGET_FIELDS):
+            return None
+        return cls(synapse, synapse.body_hash)
+
+    def headers(self, synapse: bittensor.Synapse) -> dict:
+        """
+        Builds the request headers of a preprocessed target synapse, equivalent to :func:`Synapse.to_headers`.
+        """
+        headers = {"name": self.name, "timeout": self.timeout}
+        if synapse.axon:
+            headers.update(
+                SynapseHeaderCodec.terminal_headers(
+                    synapse.axon, SynapseHeaderCodec.AXON_HEADER_KEYS
+                )
+            )
+        if synapse.dendrite:
+            headers.update(
+                SynapseHeaderCodec.terminal_headers(
+                    synapse.dendrite, SynapseHeaderCodec.DENDRITE_HEADER_KEYS
+                )
+            )
+        headers.update(self.input_obj_headers)
+        headers["header_size"] = str(sys.getsizeof(headers))
+        headers["total_size"] = self.total_size
+        headers["computed_body_hash"] = self.body_hash
+        return headers
+
+    def body(
+        self, synapse: bittensor.Synapse, content_type: str = JSON_CONTENT_TYPE
+    ) -> bytes:
+        """
+        Builds the request body of a preprocessed target synapse from the shared pre-encoded fields.
+
+        Args:
+            synapse (bittensor.Synapse): The preprocessed target synapse.
+            content_type (str): :data:`MSGPACK_CONTENT_TYPE` for a msgpack body, equivalent to
+                :func:`Synapse.to_msgpack`, or JSON. Defaults to JSON.
+        """
+        if content_type == MSGPACK_CONTENT_TYPE:
+            return self._msgpack_body(synapse)
+
+        parts = [self.body_prefix]
+        for field in self.PER_TARGET_FIELDS:
+            value = getattr(synapse, field)
+            encoded = value.model_dump_json().encode() if value is not None else b"null"
+            parts.append(b',"%s":%s' % (field.encode(), encoded))
+        parts.append(b"}")
+        return b"".join(parts)
+
+    def _msgpack_body(self, synapse: bittensor.Synapse) -> bytes:
+        packer = msgpack.Packer(default=to_jsonable_python, use_bin_type=True)
+        if self._msgpack_entries is None:
+            # The shared fields are equal in every target synapse, see :func:`Synapse.to_msgpack`.
+            with binary_transport():
+                shared_fields = synapse.model_dump(exclude=set(self.PER_TARGET_FIELDS))
+            self._msgpack_entries = (
+                len(shared_fields),
+                b"".join(
+                    packer.pack(key) + packer.pack(value)
+                    for key, value in shared_fields.items()
+                ),
+            )
+        size, entries = self._msgpack_entries
+        parts = [
+            packer.pack_map_header(size + len(self.PER_TARGET_FIELDS)),
+            entries,
+        ]
+        for field in self.PER_TARGET_FIELDS:
+            value = getattr(synapse, field)
+            parts.append(packer.pack(field))
+            parts.append(packer.pack(value.model_dump() if value is not None else None))
+        return b"".join(parts)
+
 
 class DendriteMixin:
     """
@@ -45,7 +313,8 @@ class DendriteMixin:
     Args:
         keypair: The wallet or keypair used for signing messages.
         external_ip (str): The external IP address of the local system.
-        synapse_history (list): A list of Synapse objects representing the historical responses.
+        synapse_history (bittensor.SynapseHistory): Bounded record of the historical responses, see :class:`bittensor.SynapseHistory`.
+        wire_format (str): The encoding of the synapse bodies, ``"json"``, ``"msgpack"`` or ``"auto"``.
 
     Methods:
         __str__(): Returns a string representation of the Dendrite object.
@@ -56,6 +325,9 @@ class DendriteMixin:
         forward(self, axons, synapse=bittensor.Synapse(), timeout=12, deserialize=True, run_async=True, streaming=False) -> bittensor.Synapse:
             Asynchronously sends requests to one or multiple Axons and collates their responses.
 
+        as_completed(self, axons, synapse=bittensor.Synapse(), timeout=12, deserialize=True, broadcast=False) -> AsyncGenerator[Tuple[bittensor.AxonInfo, bittensor.Synapse], None]:
+            Asynchronously sends requests to multiple Axons and yields each response as soon as it arrives.
+
         call(self, target_axon, synapse=bittensor.Synapse(), timeout=12.0, deserialize=True) -> bittensor.Synapse:
             Asynchronously sends a request to a specified Axon and processes the response.
 
@@ -96,8 +368,15 @@ class DendriteMixin:
         >>> d( bittensor.axon(), bittensor.Synapse )
     """
 
+    WIRE_FORMATS: ClassVar[Tuple[str, ...]] = ("json", "msgpack", "auto")
+
     def __init__(
-        self, wallet: Optional[Union[bittensor.wallet, bittensor.Keypair]] = None
+        self,
+        wallet: Optional[Union[bittensor.wallet, bittensor.Keypair]] = None,
+        synapse_history: Union[str, SynapseHistory, None] = "ring",
+        synapse_history_size: int = 1024,
+        connector_profile: Optional[ConnectorProfile] = None,
+        wire_format: str = "auto",
     ):
         """
         Initializes the Dendrite object, setting up essential properties.
@@ -105,10 +384,29 @@ class DendriteMixin:
         Args:
             wallet (Optional[Union['bittensor.wallet', 'bittensor.keypair']], optional):
                 The user's wallet or keypair used for signing messages. Defaults to ``None``, in which case a new :func:`bittensor.wallet().hotkey` is generated and used.
+            synapse_history (Union[str, bittensor.SynapseHistory, None], optional):
+                How responses are recorded in :attr:`synapse_history`: ``"off"``, ``"ring"`` for the last synapses, or
+                ``"records"`` for a NumPy record array of status, latency, sizes and axon hotkey. Defaults to ``"ring"``.
+            synapse_history_size (int, optional):
+                The number of responses kept by :attr:`synapse_history`. Defaults to ``1024``.
+            connector_profile (ConnectorProfile, optional):
+                Connection pool settings of the session. Defaults to :class:`ConnectorProfile()`.
+            wire_format (str, optional):
+                The encoding of the synapse bodies. ``"json"`` only speaks JSON, like older versions. ``"auto"``
+                sends JSON and accepts msgpack responses, and switches the requests to an axon to msgpack once it
+                answered in msgpack, back to JSON if it stops doing so. ``"msgpack"`` always sends msgpack, for
+                axons known to support it. Defaults to ``"auto"``.
+
+        Raises:
+            ValueError: If ``wire_format`` is not one of the above.
         """
         # Initialize the parent class
         super(DendriteMixin, self).__init__()
 
+        # The session is created on first use, see :attr:`session`
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._pool_trace = _PoolTrace()
+
         # Unique identifier for the instance
         self.uuid = str(uuid.uuid1())
 
@@ -120,9 +418,20 @@ class DendriteMixin:
             wallet.hotkey if isinstance(wallet, bittensor.wallet) else wallet
         ) or bittensor.wallet().hotkey
 
-        self.synapse_history: list = []
+        self.synapse_history: SynapseHistory = SynapseHistory.create(
+            synapse_history, max_size=synapse_history_size
+        )
 
-        self._session: Optional[aiohttp.ClientSession] = None
+        if wire_format not in self.WIRE_FORMATS:
+            raise ValueError(
+                f"Unknown wire format {wire_format!r}, expected one of {self.WIRE_FORMATS}"
+            )
+        self.wire_format = wire_format
+        # ``ip:port`` of the axons that answered in msgpack, see ``wire_format``.
+        self._msgpack_endpoints: Set[str] = set()
+
+        self.connector_profile = connector_profile or ConnectorProfile()
+        self.latency_tracker = LatencyTracker()
 
     @property
     async def session(self) -> aiohttp.ClientSession:
@@ -157,9 +466,80 @@ class DendriteMixin:
 
         """
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            self._pool_trace = _PoolTrace()
+            self._session = aiohttp.ClientSession(
+                connector=self.connector_profile.create_connector(),
+                trace_configs=[self._pool_trace.trace_config()],
+            )
         return self._session
 
+    async def warm_pool(
+        self,
+        axons: List[Union[bittensor.AxonInfo, bittensor.axon]],
+        timeout: float = 5.0,
+    ) -> int:
+        """
+        Opens a pooled connection to every serving axon, so that the next requests to them skip the TCP handshake.
+
+        This is typically called with the axons of the metagraph before a query round, e.g.
+        ``await dendrite.warm_pool(metagraph.axons)``. A ``HEAD`` request is sent to the root path of each serving
+        axon, which answers it without processing or logging a synapse. The connection stays in the pool once the
+        axon answered, whatever the status, so older axons are warmed too. Axons that are not serving or do not
+        answer within ``timeout`` are skipped.
+
+        Args:
+            axons (List[Union[bittensor.AxonInfo, bittensor.axon]]): The axons to connect to.
+            timeout (float, optional): Maximum duration in seconds of the request to a single axon. Defaults to ``5.0``.
+
+        Returns:
+            int: The number of connections opened, not counting the axons that already had an idle pooled connection.
+        """
+        session = await self.session
+        client_timeout = ClientTimeout(total=timeout)
+
+        async def connect(url: str) -> bool:
+            context: Dict[str, bool] = {"opened": False}
+            try:
+                async with session.head(
+                    url, timeout=client_timeout, trace_request_ctx=context
+                ):
+                    pass
+            except Exception as e:
+                bittensor.logging.trace(
+                    f"dendrite | Pool warming failed for {url}: {e}"
+                )
+                return False
+            return context["opened"]
+
+        urls = {
+            self._get_endpoint_url(axon, request_name="")
+            for axon in (
+                axon.info() if isinstance(axon, bittensor.axon) else axon
+                for axon in axons
+            )
+            if axon.is_serving
+        }
+        opened = await asyncio.gather(*(connect(url) for url in urls))
+        return sum(opened)
+
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Returns the activity of the connection pool of the current session.
+
+        Returns:
+            Dict[str, int]: ``limit`` and ``limit_per_host`` of the pool, the number of connections ``opened`` and
+            ``reused`` by the session, of requests ``in_flight`` until their response headers arrive, and of requests
+            ``waiting`` for a free connection. The counts are zero until the session is created.
+        """
+        return {
+            "limit": self.connector_profile.limit,
+            "limit_per_host": self.connector_profile.limit_per_host,
+            "opened": self._pool_trace.opened,
+            "reused": self._pool_trace.reused,
+            "in_flight": self._pool_trace.in_flight,
+            "waiting": self._pool_trace.waiting,
+        }
+
     def close_session(self):
         """
         Closes the internal `aiohttp <https://github.com/aio-libs/aiohttp>`_ client session synchronously.
@@ -271,6 +651,8 @@ class DendriteMixin:
         Args:
             synapse: The synapse object representing the request being sent.
         """
+        if not bittensor.logging.isEnabledFor(TRACE_LEVEL_NUM):
+            return
         bittensor.logging.trace(
             f"dendrite | --> | {synapse.get_total_size()} B | {synapse.name} | {synapse.axon.hotkey} | {synapse.axon.ip}:{str(synapse.axon.port)} | 0 | Success"
         )
@@ -286,10 +668,105 @@ class DendriteMixin:
         Args:
             synapse: The synapse object representing the received response.
         """
+        if not bittensor.logging.isEnabledFor(TRACE_LEVEL_NUM):
+            return
         bittensor.logging.trace(
             f"dendrite | <-- | {synapse.get_total_size()} B | {synapse.name} | {synapse.axon.hotkey} | {synapse.axon.ip}:{str(synapse.axon.port)} | {synapse.dendrite.status_code} | {synapse.dendrite.status_message}"
         )
 
+    def _record_synapse(self, synapse):
+        """
+        Records the response in :attr:`synapse_history`.
+
+        The size of the response is only measured when the history keeps it, it is no longer a side effect of
+        :func:`_log_incoming_response` when trace logging is disabled.
+
+        Args:
+            synapse: The synapse object representing the received response.
+        """
+        if not isinstance(self.synapse_history, NullSynapseHistory):
+            synapse.get_total_size()
+        self.synapse_history.record(synapse)
+
+    def _endpoint_key(self, target_axon: bittensor.AxonInfo) -> str:
+        return f"{target_axon.ip}:{target_axon.port}"
+
+    def _request_content_type(self, target_axon: bittensor.AxonInfo) -> str:
+        """
+        Returns the content type of the requests to ``target_axon``, as negotiated according to :attr:`wire_format`.
+        """
+        if self.wire_format == "msgpack" or (
+            self.wire_format == "auto"
+            and self._endpoint_key(target_axon) in self._msgpack_endpoints
+        ):
+            return MSGPACK_CONTENT_TYPE
+        return JSON_CONTENT_TYPE
+
+    def _build_request_payload(
+        self,
+        synapse: bittensor.Synapse,
+        broadcast_request: Optional[BroadcastRequest] = None,
+        content_type: str = JSON_CONTENT_TYPE,
+    ) -> Dict[str, Any]:
+        """
+        Builds the headers and body keyword arguments of the HTTP request for a preprocessed synapse.
+
+        Args:
+            synapse: The preprocessed synapse to send.
+            broadcast_request: The request shared with other target axons, if any.
+            content_type: The encoding of the body, see :func:`_request_content_type`.
+
+        Returns:
+            dict: Keyword arguments for :func:`aiohttp.ClientSession.post`.
+        """
+        if broadcast_request is None:
+            headers = synapse.to_headers()
+            body = (
+                synapse.to_msgpack() if content_type == MSGPACK_CONTENT_TYPE else None
+            )
+        else:
+            headers = broadcast_request.headers(synapse)
+            body = broadcast_request.body(synapse, content_type)
+
+        if self.wire_format != "json":
+            headers["Accept"] = f"{MSGPACK_CONTENT_TYPE}, {JSON_CONTENT_TYPE}"
+
+        if body is None:
+            return {"headers": headers, "json": synapse.model_dump()}
+        headers["Content-Type"] = content_type
+        return {"headers": headers, "data": body}
+
+    async def _read_response_body(
+        self,
+        response: aiohttp.ClientResponse,
+        target_axon: bittensor.AxonInfo,
+        content_type: str,
+    ) -> dict:
+        """
+        Decodes the body of an axon response according to its content type, and records whether the axon
+        answers in msgpack for the next requests, see :attr:`wire_format`.
+
+        Args:
+            response: The response of the axon.
+            target_axon: The axon the request was sent to.
+            content_type: The content type of the request body.
+
+        Returns:
+            dict: The decoded response body.
+        """
+        endpoint_key = self._endpoint_key(target_axon)
+        if response.content_type == MSGPACK_CONTENT_TYPE:
+            if self.wire_format == "auto":
+                self._msgpack_endpoints.add(endpoint_key)
+            return bittensor.Synapse.decode_body(
+                await response.read(), MSGPACK_CONTENT_TYPE
+            )
+        if content_type == MSGPACK_CONTENT_TYPE and response.status == 200:
+            # Fall back to JSON for axons that stopped answering in msgpack, e.g. downgraded ones.
+            # Error responses are always JSON, so they say nothing about the axon.
+            self._msgpack_endpoints.discard(endpoint_key)
+        return await response.json()
+
     def query(
         self, *args, **kwargs
     ) -> List[
@@ -333,6 +810,8 @@ class DendriteMixin:
         deserialize: bool = True,
         run_async: bool = True,
         streaming: bool = False,
+        broadcast: bool = False,
+        latency_policy: Optional[LatencyPolicy] = None,
     ) -> List[
         Union[AsyncGenerator[Any, Any], bittensor.Synapse, bittensor.StreamingSynapse]
     ]:
@@ -377,6 +856,11 @@ class DendriteMixin:
             deserialize (bool, optional): Determines if the received response should be deserialized. Defaults to ``True``.
             run_async (bool, optional): If ``True``, sends requests concurrently. Otherwise, sends requests sequentially. Defaults to ``True``.
             streaming (bool, optional): Indicates if the response is expected to be in streaming format. Defaults to ``False``.
+            broadcast (bool, optional): If ``True``, the request body and its hash are serialized once and shared by all
+                target Axons, which then only get their own signed headers. See :class:`BroadcastRequest`. Defaults to ``False``.
+            latency_policy (LatencyPolicy, optional): Enables the latency-aware mode for concurrent non-streaming requests:
+                per-Axon timeouts derived from :attr:`latency_tracker`, early return once a quorum of responses arrived,
+                and hedging of slow Axons. See :class:`bittensor.latency.LatencyPolicy`. Defaults to ``None``.
 
         Returns:
             Union[AsyncGenerator, bittensor.Synapse, List[bittensor.Synapse]]: If a single Axon is targeted, returns its response.
@@ -398,6 +882,13 @@ class DendriteMixin:
             )
         streaming = is_streaming_subclass or streaming
 
+        # Serialize the shared part of the request once for all target axons.
+        broadcast_request = None
+        if broadcast:
+            synapse = synapse.model_copy()
+            synapse.timeout = timeout
+            broadcast_request = BroadcastRequest.from_synapse(synapse)
+
         async def query_all_axons(
             is_stream: bool,
         ) -> Union[
@@ -449,6 +940,7 @@ class DendriteMixin:
                         synapse=synapse.model_copy(),  # type: ignore
                         timeout=timeout,
                         deserialize=deserialize,
+                        broadcast_request=broadcast_request,
                     )
                 else:
                     # If not in streaming mode, simply call the axon and get the response.
@@ -457,6 +949,7 @@ class DendriteMixin:
                         synapse=synapse.model_copy(),  # type: ignore
                         timeout=timeout,
                         deserialize=deserialize,
+                        broadcast_request=broadcast_request,
                     )
 
             # If run_async flag is False, get responses one by one.
@@ -470,16 +963,192 @@ class DendriteMixin:
             )  # type: ignore
 
         # Get responses for all axons.
-        responses = await query_all_axons(streaming)
+        responses: Union[
+            List[Any],
+            AsyncGenerator[Any, Any],
+            bittensor.Synapse,
+            bittensor.StreamingSynapse,
+        ]
+        if latency_policy is not None and run_async and not streaming:
+            responses = await self._forward_latency_aware(
+                axons,
+                synapse,
+                timeout,
+                deserialize,
+                broadcast_request,
+                latency_policy,
+            )
+        else:
+            responses = await query_all_axons(streaming)
         # Return the single response if only one axon was targeted, else return all responses
         return responses[0] if len(responses) == 1 and not is_list else responses  # type: ignore
 
+    async def as_completed(
+        self,
+        axons: List[Union[bittensor.AxonInfo, bittensor.axon]],
+        synapse: bittensor.Synapse = bittensor.Synapse(),
+        timeout: float = 12,
+        deserialize: bool = True,
+        broadcast: bool = False,
+    ) -> AsyncGenerator[Tuple[Union[bittensor.AxonInfo, bittensor.axon], Any], None]:
+        """
+        Queries the Axons concurrently and yields each response as soon as it arrives.
+
+        Unlike :func:`forward`, which returns once every Axon responded or timed out, this lets the caller process
+        the fast responses, e.g. score them, while the slow ones are still in flight. Every Axon is yielded exactly
+        once, failed and timed out requests included. Leaving the iteration early cancels the outstanding requests.
+
+        For example::
+
+            >>> async for axon, response in dendrite.as_completed(metagraph.axons, synapse, timeout=12):
+            >>>     scores[axon.hotkey] = score(response)
+
+        Args:
+            axons (List[Union['bittensor.AxonInfo', 'bittensor.axon']]): The target Axons to send requests to.
+            synapse (bittensor.Synapse, optional): The Synapse object encapsulating the data. Defaults to a new :func:`bittensor.Synapse` instance.
+            timeout (float, optional): Maximum duration to wait for a response from an Axon in seconds. Defaults to ``12.0``.
+            deserialize (bool, optional): Determines if the received responses should be deserialized. Defaults to ``True``.
+            broadcast (bool, optional): Serializes the request body once for all Axons, see :func:`forward`. Defaults to ``False``.
+
+        Yields:
+            Tuple[Union['bittensor.AxonInfo', 'bittensor.axon'], Any]: The Axon, as passed in ``axons``, and its response.
+
+        Raises:
+            ValueError: If ``synapse`` is a :class:`bittensor.StreamingSynapse`, use :func:`forward` with ``streaming=True`` instead.
+        """
+        if isinstance(synapse, bittensor.StreamingSynapse):
+            raise ValueError(
+                "as_completed does not support streaming synapses, use forward(..., streaming=True)"
+            )
+
+        broadcast_request = None
+        if broadcast:
+            synapse = synapse.model_copy()
+            synapse.timeout = timeout
+            broadcast_request = BroadcastRequest.from_synapse(synapse)
+
+        queries = {
+            asyncio.ensure_future(
+                self.call(
+                    target_axon=target_axon,
+                    synapse=synapse.model_copy(),  # type: ignore
+                    timeout=timeout,
+                    deserialize=deserialize,
+                    broadcast_request=broadcast_request,
+                )
+            ): target_axon
+            for target_axon in axons
+        }
+        pending = set(queries)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for query in done:
+                    yield queries[query], query.result()
+        finally:
+            for query in pending:
+                query.cancel()
+
+    async def _forward_latency_aware(
+        self,
+        axons: List[Union[bittensor.AxonInfo, bittensor.axon]],
+        synapse: bittensor.Synapse,
+        timeout: float,
+        deserialize: bool,
+        broadcast_request: Optional[BroadcastRequest],
+        policy: LatencyPolicy,
+    ) -> List[Any]:
+        """
+        Queries the axons concurrently with per-axon timeouts, hedging and early return, see :class:`LatencyPolicy`.
+
+        Returns:
+            List[Any]: The responses, in the order of ``axons``. Requests cancelled by the quorum get a 408 status.
+        """
+
+        async def query_axon(target_axon) -> bittensor.Synapse:
+            target_axon = (
+                target_axon.info()
+                if isinstance(target_axon, bittensor.axon)
+                else target_axon
+            )
+            axon_timeout = policy.timeout(
+                self.latency_tracker, target_axon.hotkey, timeout
+            )
+            hedge_delay = policy.hedge_delay(
+                self.latency_tracker, target_axon.hotkey, axon_timeout
+            )
+
+            def send(request_timeout: float) -> "asyncio.Task[bittensor.Synapse]":
+                return asyncio.ensure_future(
+                    self.call(
+                        target_axon=target_axon,
+                        synapse=synapse.model_copy(),  # type: ignore
+                        timeout=request_timeout,
+                        deserialize=False,
+                        broadcast_request=broadcast_request,
+                    )
+                )
+
+            requests = [send(axon_timeout)]
+            try:
+                if hedge_delay is not None:
+                    done, _ = await asyncio.wait(requests, timeout=hedge_delay)
+                    if not done:
+                        requests.append(send(axon_timeout - hedge_delay))
+
+                # Keep the first successful response, or the last one if all failed.
+                pending = set(requests)
+                while True:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for request in done:
+                        if request.result().is_success or not pending:
+                            return request.result()
+            except asyncio.CancelledError:
+                # Cancelled once the quorum is reached, the cancelled calls report a 408.
+                for request in requests:
+                    request.cancel()
+                results = await asyncio.gather(*requests, return_exceptions=True)
+                if isinstance(results[0], bittensor.Synapse):
+                    return results[0]
+                cancelled_synapse = synapse.model_copy()
+                cancelled_synapse.dendrite = bittensor.TerminalInfo(
+                    status_code=408,
+                    status_message=CANCELLED_STATUS_MESSAGE,
+                )
+                return cancelled_synapse
+            finally:
+                for request in requests:
+                    request.cancel()
+
+        queries = [asyncio.ensure_future(query_axon(axon)) for axon in axons]
+        quorum = policy.quorum_size(len(queries))
+        if quorum is not None:
+            successes = 0
+            pending = set(queries)
+            while pending and successes < quorum:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                successes += sum(query.result().is_success for query in done)
+            for query in pending:
+                query.cancel()
+        responses = await asyncio.gather(*queries)
+        return [
+            response.deserialize() if deserialize else response
+            for response in responses
+        ]
+
     async def call(
         self,
         target_axon: Union[bittensor.AxonInfo, bittensor.axon],
         synapse: bittensor.Synapse = bittensor.Synapse(),
         timeout: float = 12.0,
         deserialize: bool = True,
+        broadcast_request: Optional[BroadcastRequest] = None,
     ) -> bittensor.Synapse:
         """
         Asynchronously sends a request to a specified Axon and processes the response.
@@ -493,6 +1162,7 @@ class DendriteMixin:
             synapse (bittensor.Synapse, optional): The Synapse object encapsulating the data. Defaults to a new :func:`bittensor.Synapse` instance.
             timeout (float, optional): Maximum duration to wait for a response from the Axon in seconds. Defaults to ``12.0``.
             deserialize (bool, optional): Determines if the received response should be deserialized. Defaults to ``True``.
+            broadcast_request (BroadcastRequest, optional): Pre-encoded request shared with other target Axons. If ``None``, the request is encoded from the synapse.
 
         Returns:
             bittensor.Synapse: The Synapse object, updated with the response data from the Axon.
@@ -511,7 +1181,14 @@ class DendriteMixin:
         url = self._get_endpoint_url(target_axon, request_name=request_name)
 
         # Preprocess synapse for making a request
-        synapse = self.preprocess_synapse_for_request(target_axon, synapse, timeout)
+        synapse = self.preprocess_synapse_for_request(
+            target_axon,
+            synapse,
+            timeout,
+            body_hash=broadcast_request.body_hash if broadcast_request else None,
+        )
+
+        content_type = self._request_content_type(target_axon)
 
         try:
             # Log outgoing request
@@ -520,28 +1197,40 @@ class DendriteMixin:
             # Make the HTTP POST request
             async with (await self.session).post(
                 url,
-                headers=synapse.to_headers(),
-                json=synapse.model_dump(),
                 timeout=ClientTimeout(total=timeout),
+                **self._build_request_payload(synapse, broadcast_request, content_type),
             ) as response:
-                # Extract the JSON response from the server
-                json_response = await response.json()
+                # Extract the JSON or msgpack response from the server
+                json_response = await self._read_response_body(
+                    response, target_axon, content_type
+                )
                 # Process the server response and fill synapse
                 self.process_server_response(response, json_response, synapse)
 
             # Set process time and log the response
             synapse.dendrite.process_time = str(time.time() - start_time)  # type: ignore
 
+            # Record the latency of the axon, see :class:`LatencyPolicy`
+            if synapse.is_success:
+                self.latency_tracker.observe(
+                    target_axon.hotkey, time.time() - start_time
+                )
+
+        except asyncio.CancelledError:
+            # Cancelled by the caller, e.g. once :func:`forward` reached its quorum
+            synapse.dendrite.status_code = "408"  # type: ignore
+            synapse.dendrite.status_message = CANCELLED_STATUS_MESSAGE  # type: ignore
+
         except Exception as e:
             self._handle_request_errors(synapse, request_name, e)
+            if synapse.is_timeout:
+                self.latency_tracker.observe(target_axon.hotkey, timeout)
 
         finally:
             self._log_incoming_response(synapse)
 
             # Log synapse event history
-            self.synapse_history.append(
-                bittensor.Synapse.from_headers(synapse.to_headers())
-            )
+            self._record_synapse(synapse)
 
             # Return the updated synapse object after deserializing if requested
             if deserialize:
@@ -555,6 +1244,7 @@ class DendriteMixin:
         synapse: bittensor.StreamingSynapse = bittensor.Synapse(),  # type: ignore
         timeout: float = 12.0,
         deserialize: bool = True,
+        broadcast_request: Optional[BroadcastRequest] = None,
     ) -> AsyncGenerator[Any, Any]:
         """
         Sends a request to a specified Axon and yields streaming responses.
@@ -564,11 +1254,16 @@ class DendriteMixin:
         useful for processing large responses piece by piece without waiting for the entire
         data to be transmitted.
 
+        With a :class:`bittensor.FramedStreamingSynapse`, the chunks are the ``bytes`` and ``str`` chunks written by the
+        axon to its :class:`bittensor.FramedStreamWriter`, and the final Synapse holds the fields the axon set while
+        streaming.
+
         Args:
             target_axon (Union['bittensor.AxonInfo', 'bittensor.axon']): The target Axon to send the request to.
             synapse (bittensor.Synapse, optional): The Synapse object encapsulating the data. Defaults to a new :func:`bittensor.Synapse` instance.
             timeout (float, optional): Maximum duration to wait for a response (or a chunk of the response) from the Axon in seconds. Defaults to ``12.0``.
             deserialize (bool, optional): Determines if each received chunk should be deserialized. Defaults to ``True``.
+            broadcast_request (BroadcastRequest, optional): Pre-encoded request shared with other target Axons. If ``None``, the request is encoded from the synapse.
 
         Yields:
             object: Each yielded object contains a chunk of the arbitrary response data from the Axon.
@@ -593,7 +1288,12 @@ class DendriteMixin:
         url = f"http://{endpoint}/{request_name}"
 
         # Preprocess synapse for making a request
-        synapse = self.preprocess_synapse_for_request(target_axon, synapse, timeout)  # type: ignore
+        synapse = self.preprocess_synapse_for_request(
+            target_axon,
+            synapse,
+            timeout,
+            body_hash=broadcast_request.body_hash if broadcast_request else None,
+        )  # type: ignore
 
         try:
             # Log outgoing request
@@ -602,9 +1302,12 @@ class DendriteMixin:
             # Make the HTTP POST request
             async with (await self.session).post(
                 url,
-                headers=synapse.to_headers(),
-                json=synapse.model_dump(),
                 timeout=ClientTimeout(total=timeout),
+                **self._build_request_payload(
+                    synapse,
+                    broadcast_request,
+                    self._request_content_type(target_axon),
+                ),
             ) as response:
                 # Use synapse subclass' process_streaming_response method to yield the response chunks
                 async for chunk in synapse.process_streaming_response(response):  # type: ignore
@@ -624,9 +1327,7 @@ class DendriteMixin:
             self._log_incoming_response(synapse)
 
             # Log synapse event history
-            self.synapse_history.append(
-                bittensor.Synapse.from_headers(synapse.to_headers())
-            )
+            self._record_synapse(synapse)
 
             # Return the updated synapse object after deserializing if requested
             if deserialize:
@@ -639,6 +1340,7 @@ class DendriteMixin:
         target_axon_info: bittensor.AxonInfo,
         synapse: bittensor.Synapse,
         timeout: float = 12.0,
+        body_hash: Optional[str] = None,
     ) -> bittensor.Synapse:
         """
         Preprocesses the synapse for making a request. This includes building
@@ -649,6 +1351,8 @@ class DendriteMixin:
             synapse (bittensor.Synapse): The synapse object to be preprocessed.
             timeout (float, optional): The request timeout duration in seconds.
                 Defaults to ``12.0`` seconds.
+            body_hash (str, optional): Precomputed body hash of the synapse, e.g. shared by a :class:`BroadcastRequest`.
+                Defaults to ``None``, in which case it is computed from the synapse.
 
         Returns:
             bittensor.Synapse: The preprocessed synapse.
@@ -671,7 +1375,9 @@ class DendriteMixin:
         )
 
         # Sign the request using the dendrite, axon info, and the synapse body hash
-        message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{synapse.axon.hotkey}.{synapse.dendrite.uuid}.{synapse.body_hash}"
+        if body_hash is None:
+            body_hash = synapse.body_hash
+        message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{synapse.axon.hotkey}.{synapse.dendrite.uuid}.{body_hash}"
         synapse.dendrite.signature = f"0x{self.keypair.sign(message).hex()}"
 
         return synapse
@@ -823,11 +1529,23 @@ BaseModel: Union["torch.nn.Module", object] = torch.nn.Module if use_torch() els
 
 class dendrite(DendriteMixin, BaseModel):  # type: ignore
     def __init__(
-        self, wallet: Optional[Union[bittensor.wallet, bittensor.Keypair]] = None
+        self,
+        wallet: Optional[Union[bittensor.wallet, bittensor.Keypair]] = None,
+        synapse_history: Union[str, SynapseHistory, None] = "ring",
+        synapse_history_size: int = 1024,
+        connector_profile: Optional[ConnectorProfile] = None,
+        wire_format: str = "auto",
     ):
         if use_torch():
             torch.nn.Module.__init__(self)
-        DendriteMixin.__init__(self, wallet)
+        DendriteMixin.__init__(
+            self,
+            wallet,
+            synapse_history,
+            synapse_history_size,
+            connector_profile,
+            wire_format,
+        )
 
 
 if not use_torch():
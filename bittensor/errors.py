@@ -112,6 +112,12 @@ class MetadataError(ChainTransactionError):
     pass
 
 
+class QueueExpiredError(TimeoutError):
+    r"""This exception is raised when queued work is still waiting to be run once its deadline has passed."""
+
+    pass
+
+
 class InvalidRequestNameError(Exception):
     r"""This exception is raised when the request name is invalid. Ususally indicates a broken URL."""
 
@@ -277,7 +277,7 @@ def get_metadata(self, netuid: int, hotkey: str, block: Optional[int] = None) ->
                 module="Commitments",
                 storage_function="CommitmentOf",
                 params=[netuid, hotkey],
-                block_hash=None if block is None else substrate.get_block_hash(block),
+                block_hash=self._get_block_hash(block),
             )
 
     commit_data = make_substrate_call_with_retry()
@@ -0,0 +1,172 @@
+"""Per-axon latency tracking used by the dendrite to adapt its timeouts."""
+
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import dataclasses
+import threading
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+
+class LatencyTracker:
+    """
+    Keeps a latency histogram per axon hotkey.
+
+    Latencies are counted in logarithmically spaced buckets between 10ms and 2 minutes, so recording a
+    response is a single increment and quantiles are read from the cumulative counts. Once a histogram holds
+    ``window`` samples its counts are halved, so that older samples fade out and the quantiles follow the
+    current behavior of the axon. Requests that timed out are recorded with the timeout as their latency.
+
+    Args:
+        window (int): The number of samples after which the counts of a histogram are halved.
+        max_hotkeys (int): The maximum number of hotkeys tracked, the histograms of the oldest ones are dropped.
+    """
+
+    BUCKET_EDGES = np.geomspace(0.01, 120.0, 64)
+
+    def __init__(self, window: int = 1000, max_hotkeys: int = 4096):
+        self.window = window
+        self.max_hotkeys = max_hotkeys
+        self._histograms: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, hotkey: str, latency: float):
+        """
+        Records the latency of a response of the axon with ``hotkey``.
+
+        Args:
+            hotkey (str): The hotkey of the axon.
+            latency (float): The response time in seconds.
+        """
+        bucket = min(
+            int(np.searchsorted(self.BUCKET_EDGES, latency)),
+            len(self.BUCKET_EDGES) - 1,
+        )
+        with self._lock:
+            histogram = self._histograms.get(hotkey)
+            if histogram is None:
+                if len(self._histograms) >= self.max_hotkeys:
+                    del self._histograms[next(iter(self._histograms))]
+                histogram = self._histograms[hotkey] = np.zeros(
+                    len(self.BUCKET_EDGES), dtype=np.int64
+                )
+            histogram[bucket] += 1
+            if histogram.sum() >= self.window:
+                histogram //= 2
+
+    def count(self, hotkey: str) -> int:
+        """Returns the (decayed) number of samples recorded for ``hotkey``."""
+        histogram = self._histograms.get(hotkey)
+        return 0 if histogram is None else int(histogram.sum())
+
+    def quantile(self, hotkey: str, q: float) -> Optional[float]:
+        """
+        Returns an upper bound of the ``q`` quantile of the latency of ``hotkey``, ``None`` without samples.
+
+        Args:
+            hotkey (str): The hotkey of the axon.
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            Optional[float]: The upper edge in seconds of the bucket containing the quantile.
+        """
+        histogram = self._histograms.get(hotkey)
+        if histogram is None:
+            return None
+        cumulative = np.cumsum(histogram)
+        if cumulative[-1] == 0:
+            return None
+        bucket = int(np.searchsorted(cumulative, q * cumulative[-1]))
+        return float(self.BUCKET_EDGES[min(bucket, len(self.BUCKET_EDGES) - 1)])
+
+    def __len__(self) -> int:
+        return len(self._histograms)
+
+    def __contains__(self, hotkey: str) -> bool:
+        return hotkey in self._histograms
+
+
+@dataclasses.dataclass(frozen=True)
+class LatencyPolicy:
+    """
+    Latency-aware querying mode of :func:`dendrite.forward`.
+
+    Per-axon timeouts are derived from the latency histograms of the dendrite's :class:`LatencyTracker`, the
+    round returns as soon as a quorum of successful responses arrived, and slow axons can be hedged with a
+    second request. The ``timeout`` passed to :func:`dendrite.forward` stays the upper bound of every request.
+
+    Args:
+        quantile (float): The latency quantile an axon timeout is derived from.
+        multiplier (float): The factor applied to that quantile to get the axon timeout.
+        min_timeout (float): The lower bound of an axon timeout, in seconds.
+        min_samples (int): The number of samples of an axon before its timeout is adapted. Axons with fewer
+            samples get the full timeout.
+        quorum (Union[int, float], optional): Return once this many successful responses arrived, or this fraction
+            of the axons when at most ``1.0``. The outstanding requests are cancelled and reported with a 408 status.
+        hedge_quantile (float, optional): Send a second request to an axon that did not respond within this
+            latency quantile, and keep the first response. Disabled if ``None``.
+
+    Raises:
+        ValueError: If ``quorum`` is not positive.
+    """
+
+    quantile: float = 0.95
+    multiplier: float = 1.5
+    min_timeout: float = 1.0
+    min_samples: int = 10
+    quorum: Optional[Union[int, float]] = None
+    hedge_quantile: Optional[float] = None
+
+    def __post_init__(self):
+        if self.quorum is not None and self.quorum <= 0:
+            raise ValueError(f"quorum must be positive, got {self.quorum}")
+
+    def timeout(self, tracker: LatencyTracker, hotkey: str, timeout: float) -> float:
+        """
+        Returns the timeout in seconds of a request to ``hotkey``, at most ``timeout``.
+        """
+        if tracker.count(hotkey) < self.min_samples:
+            return timeout
+        latency = tracker.quantile(hotkey, self.quantile)
+        if latency is None:
+            return timeout
+        return min(timeout, max(self.min_timeout, latency * self.multiplier))
+
+    def hedge_delay(
+        self, tracker: LatencyTracker, hotkey: str, timeout: float
+    ) -> Optional[float]:
+        """
+        Returns after how many seconds a request to ``hotkey`` is hedged, ``None`` if it is not.
+        """
+        if self.hedge_quantile is None or tracker.count(hotkey) < self.min_samples:
+            return None
+        delay = tracker.quantile(hotkey, self.hedge_quantile)
+        if delay is None or delay >= timeout:
+            return None
+        return delay
+
+    def quorum_size(self, num_axons: int) -> Optional[int]:
+        """
+        Returns the number of successful responses after which a round of ``num_axons`` requests returns.
+        """
+        if self.quorum is None:
+            return None
+        if isinstance(self.quorum, float) and self.quorum <= 1.0:
+            return max(1, int(np.ceil(self.quorum * num_axons)))
+        return min(int(self.quorum), num_axons)
@@ -18,17 +18,27 @@
 # DEALINGS IN THE SOFTWARE.
 
 from abc import ABC, abstractmethod
+import json
 import os
 import pickle
+import shutil
+import tempfile
+import time
 import numpy as np
 from numpy.typing import NDArray
 import bittensor
 from os import listdir
 from os.path import join
-from typing import List, Optional, Union, Tuple
-
-from bittensor.chain_data import AxonInfo
+from typing import Any, Dict, List, Optional, Union, Tuple, cast
+
+from bittensor.chain_data import (
+    AxonInfo,
+    NeuronInfo,
+    NeuronInfoLite,
+    NeuronInfoLiteColumns,
+)
 from bittensor.utils.registration import torch, use_torch
+from bittensor.utils.weight_utils import CSRMatrix
 
 METAGRAPH_STATE_DICT_NDARRAY_KEYS = [
     "version",
@@ -49,6 +59,40 @@ METAGRAPH_STATE_DICT_NDARRAY_KEYS = [
     "uids",
 ]
 
+# The metagraph attributes patched by an incremental sync, with the neuron attribute they are read from.
+INCREMENTAL_SYNC_ATTRIBUTES = {
+    "trust": "trust",
+    "consensus": "consensus",
+    "incentive": "incentive",
+    "dividends": "dividends",
+    "ranks": "rank",
+    "emission": "emission",
+    "active": "active",
+    "last_update": "last_update",
+    "validator_permit": "validator_permit",
+    "validator_trust": "validator_trust",
+    "total_stake": "total_stake",
+    "stake": "stake",
+}
+# An incremental sync of the full neurons fetches every changed neuron, with its weights and bonds, with its own
+# request. It falls back to a full sync when more than this many neurons changed, past which the round trips cost more
+# than the single call returning all the neurons.
+INCREMENTAL_SYNC_MAX_FETCHES = 16
+
+SNAPSHOT_FORMAT_VERSION = 1
+# Seconds a snapshot data directory is kept after it was replaced, for the processes loading it meanwhile.
+SNAPSHOT_GRACE_PERIOD = 60
+# The axon attributes stored as integer columns in a snapshot, the others are indices in its string table.
+_SNAPSHOT_AXON_COLUMNS = (
+    "version",
+    "port",
+    "ip_type",
+    "protocol",
+    "placeholder1",
+    "placeholder2",
+)
+_SNAPSHOT_AXON_STRINGS = ("ip", "hotkey", "coldkey")
+
 
 def get_save_dir(network: str, netuid: int) -> str:
     """
@@ -82,7 +126,10 @@ def latest_block_path(dir_path: str) -> str:
         full_path_filename = os.path.expanduser(join(dir_path, filename))
         try:
             block_number = int(filename.split("-")[1].split(".")[0])
-            if block_number > latest_block:
+            # A snapshot directory is preferred to a legacy file of the same block.
+            if block_number > latest_block or (
+                block_number == latest_block and os.path.isdir(full_path_filename)
+            ):
                 latest_block = block_number
                 latest_file_full_path = full_path_filename
         except Exception as e:
@@ -93,6 +140,227 @@ def latest_block_path(dir_path: str) -> str:
         return latest_file_full_path
 
 
+def _snapshot_array(value) -> NDArray:
+    """Returns a state dict value, which may be a torch parameter, as a NumPy array."""
+    if use_torch() and isinstance(value, torch.Tensor):
+        return value.detach().cpu().numpy()
+    return np.asarray(value)
+
+
+def axon_columns(
+    axons: List[AxonInfo], string_indices: Dict[str, int]
+) -> Dict[str, NDArray]:
+    """
+    Converts axons to one ``axon_<attribute>`` column per attribute, the ips, hotkeys and coldkeys as indices in a
+    string table.
+
+    Args:
+        axons (List[AxonInfo]): The axons.
+        string_indices (Dict[str, int]): The index of each string of the string table, new strings are added to it.
+
+    Returns:
+        Dict[str, NDArray]: The columns.
+    """
+    columns = {}
+    for attribute in _SNAPSHOT_AXON_STRINGS:
+        columns[f"axon_{attribute}"] = np.array(
+            [
+                string_indices.setdefault(getattr(axon, attribute), len(string_indices))
+                for axon in axons
+            ],
+            dtype=np.int32,
+        )
+    for attribute in _SNAPSHOT_AXON_COLUMNS:
+        columns[f"axon_{attribute}"] = np.array(
+            [getattr(axon, attribute) for axon in axons], dtype=np.int64
+        )
+    return columns
+
+
+def axons_from_columns(
+    columns: Dict[str, NDArray], strings: List[str]
+) -> List[AxonInfo]:
+    """
+    Creates the axons of the columns of :func:`axon_columns`.
+
+    Args:
+        columns (Dict[str, NDArray]): The columns, other keys are ignored.
+        strings (List[str]): The string table.
+
+    Returns:
+        List[AxonInfo]: The axons.
+    """
+    values = [
+        columns[f"axon_{attribute}"].tolist()
+        for attribute in _SNAPSHOT_AXON_STRINGS + _SNAPSHOT_AXON_COLUMNS
+    ]
+    return [
+        AxonInfo(
+            ip=strings[ip],
+            hotkey=strings[hotkey],
+            coldkey=strings[coldkey],
+            **dict(zip(_SNAPSHOT_AXON_COLUMNS, axon_values)),
+        )
+        for ip, hotkey, coldkey, *axon_values in zip(*values)
+    ]
+
+
+def save_snapshot(dir_path: str, state_dict: dict):
+    """
+    Saves a metagraph state dict as a columnar snapshot directory, which :func:`load_snapshot` memory maps.
+
+    Every array is stored in its own ``.npy`` file. The axons are stored as integer columns, with their ips, hotkeys
+    and coldkeys as indices in the ``strings.json`` string table. ``metadata.json`` lists the arrays.
+
+    The files are written to a hidden data directory next to ``dir_path``, and ``dir_path`` is then created as a
+    symbolic link to it, so a process loading the snapshot never sees a partial one. A snapshot already at
+    ``dir_path`` is kept if it holds the same arrays and strings, and otherwise replaced by atomically swapping the
+    link. The data directory it replaces is deleted by a later save, once it was replaced for
+    ``SNAPSHOT_GRACE_PERIOD`` seconds, so that processes which were loading it meanwhile can finish.
+
+    Args:
+        dir_path (str): The snapshot directory, e.g. ``block-123`` in the save directory of the metagraph.
+        state_dict (dict): The state of the metagraph, as returned by :func:`MetagraphMixin.state_dict`.
+    """
+    arrays = {
+        key: _snapshot_array(state_dict[key])
+        for key in METAGRAPH_STATE_DICT_NDARRAY_KEYS + ["weights", "bonds"]
+        if key != "version" and key in state_dict
+    }
+    string_indices: Dict[str, int] = {}
+    arrays.update(axon_columns(state_dict.get("axons") or [], string_indices))
+    strings = list(string_indices)
+    version = _snapshot_array(state_dict.get("version", 0)).reshape(-1)
+    metadata = {
+        "format": SNAPSHOT_FORMAT_VERSION,
+        "netuid": state_dict.get("netuid"),
+        "network": state_dict.get("network"),
+        "version": int(version[0]) if version.size else 0,
+        "arrays": sorted(arrays),
+    }
+
+    parent_dir, name = os.path.split(os.path.normpath(dir_path))
+    if _snapshot_equals(dir_path, metadata, strings, arrays):
+        return
+
+    # The name of the data directory is not parsed as a block by latest_block_path.
+    temp_dir = tempfile.mkdtemp(prefix=f".snapshot-{name}-", dir=parent_dir)
+    try:
+        for key, array in arrays.items():
+            np.save(join(temp_dir, f"{key}.npy"), array, allow_pickle=False)
+        with open(join(temp_dir, "strings.json"), "w") as strings_file:
+            json.dump(strings, strings_file)
+        with open(join(temp_dir, "metadata.json"), "w") as metadata_file:
+            json.dump(metadata, metadata_file)
+        old_dir = os.path.realpath(dir_path) if os.path.islink(dir_path) else None
+        link = f"{temp_dir}.link"
+        os.symlink(os.path.basename(temp_dir), link)
+        try:
+            # Replaces a previous link in a single step, loaders see either snapshot in full.
+            os.replace(link, dir_path)
+        except BaseException:
+            os.remove(link)
+            raise
+    except BaseException:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+    if old_dir is not None:
+        try:
+            # The grace period of the replaced data directory starts now.
+            os.utime(old_dir)
+        except OSError:
+            pass
+    _remove_replaced_snapshots(parent_dir)
+
+
+def _snapshot_equals(
+    dir_path: str, metadata: dict, strings: List[str], arrays: Dict[str, NDArray]
+) -> bool:
+    """Returns whether the snapshot at ``dir_path`` holds the given data, ``False`` if it cannot be read."""
+    data_dir = os.path.realpath(dir_path)
+    try:
+        with open(join(data_dir, "metadata.json")) as metadata_file:
+            if json.load(metadata_file) != metadata:
+                return False
+        with open(join(data_dir, "strings.json")) as strings_file:
+            if json.load(strings_file) != strings:
+                return False
+        for key, array in arrays.items():
+            saved = np.load(
+                join(data_dir, f"{key}.npy"), mmap_mode="r", allow_pickle=False
+            )
+            if saved.dtype != array.dtype or not np.array_equal(saved, array):
+                return False
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def _remove_replaced_snapshots(dir_path: str):
+    """
+    Deletes the snapshot data directories in ``dir_path`` which no snapshot links to, once their last change is
+    ``SNAPSHOT_GRACE_PERIOD`` seconds old. This includes the data directories of failed saves.
+    """
+    names = listdir(dir_path)
+    linked = {
+        os.path.basename(os.readlink(join(dir_path, name)))
+        for name in names
+        if os.path.islink(join(dir_path, name))
+    }
+    expired = time.time() - SNAPSHOT_GRACE_PERIOD
+    for name in names:
+        path = join(dir_path, name)
+        if not name.startswith(".snapshot-") or name in linked or os.path.islink(path):
+            continue
+        try:
+            if os.stat(path).st_mtime < expired:
+                shutil.rmtree(path, ignore_errors=True)
+        except OSError:
+            pass
+
+
+def load_snapshot(dir_path: str) -> dict:
+    """
+    Loads a snapshot saved by :func:`save_snapshot`.
+
+    The arrays are copy-on-write memory maps of the snapshot files, processes loading the same snapshot share its
+    pages until they modify them.
+
+    Args:
+        dir_path (str): The snapshot directory.
+
+    Returns:
+        dict: The state dict of the metagraph, with its ``axons``.
+
+    Raises:
+        ValueError: If the snapshot was saved in an unsupported format.
+    """
+    # Reads every file from the same data directory, even if the snapshot is replaced meanwhile.
+    data_dir = os.path.realpath(dir_path)
+    with open(join(data_dir, "metadata.json")) as metadata_file:
+        metadata = json.load(metadata_file)
+    if metadata.get("format") != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported metagraph snapshot format {metadata.get('format')} at: {dir_path}"
+        )
+    with open(join(data_dir, "strings.json")) as strings_file:
+        strings = json.load(strings_file)
+
+    arrays = {
+        key: np.load(join(data_dir, f"{key}.npy"), mmap_mode="c", allow_pickle=False)
+        for key in metadata["arrays"]
+    }
+    state_dict = {
+        "netuid": metadata["netuid"],
+        "network": metadata["network"],
+        "axons": axons_from_columns(arrays, strings),
+    }
+    state_dict.update(
+        (key, array) for key, array in arrays.items() if not key.startswith("axon_")
+    )
+    return state_dict
+
+
 class MetagraphMixin(ABC):
     """
     The metagraph class is a core component of the Bittensor network, representing the neural graph that forms the backbone of the decentralized machine learning system.
@@ -123,6 +391,8 @@ class MetagraphMixin(ABC):
         validator_permit: Indicates if a neuron is authorized to act as a validator.
         weights: Inter-neuronal weights set by each neuron, influencing network dynamics.
         bonds: Represents speculative investments by neurons in others, part of the reward mechanism.
+        weights_csr (Optional[CSRMatrix]): The synced weights in sparse form, ``weights`` is only created from them when first accessed.
+        bonds_csr (Optional[CSRMatrix]): The synced bonds in sparse form, ``bonds`` is only created from them when first accessed.
         uids: Unique identifiers for each neuron, essential for network operations.
         axons (List): Details about each neuron's axon, critical for facilitating network communication.
 
@@ -170,7 +440,53 @@ class MetagraphMixin(ABC):
     weights: Union["torch.nn.Parameter", NDArray]
     bonds: Union["torch.nn.Parameter", NDArray]
     uids: Union["torch.nn.Parameter", NDArray]
-    axons: List[AxonInfo]
+    weights_csr: Optional[CSRMatrix] = None
+    bonds_csr: Optional[CSRMatrix] = None
+    _neurons: Optional[List[Union[NeuronInfo, NeuronInfoLite]]] = None
+    _neuron_columns: Optional[NeuronInfoLiteColumns] = None
+    _axons: Optional[List[AxonInfo]] = None
+    _synced_block: Optional[int] = None
+
+    @property
+    def neurons(self) -> List[Union[NeuronInfo, NeuronInfoLite]]:
+        """
+        The neurons the metagraph was synced from.
+
+        A lite sync reads the neurons in columnar form, see :func:`bittensor.subtensor.neurons_lite_columns`, their
+        :class:`bittensor.NeuronInfoLite` objects are only created when this list is first accessed.
+
+        Returns:
+            List[Union[NeuronInfo, NeuronInfoLite]]: The neurons, empty before the first sync.
+        """
+        if self._neurons is None:
+            if self._neuron_columns is None:
+                return []
+            self._neurons = list(self._neuron_columns.to_neurons())
+        return self._neurons
+
+    @neurons.setter
+    def neurons(self, neurons: List[Union[NeuronInfo, NeuronInfoLite]]):
+        self._neurons = neurons
+        self._neuron_columns = None
+
+    @property
+    def axons(self) -> List[AxonInfo]:
+        """
+        Details about each neuron's axon, critical for facilitating network communication.
+
+        Returns:
+            List[AxonInfo]: The axon information of each neuron, created on first access after a lite sync. Empty
+            before the first sync.
+        """
+        if self._axons is None:
+            if self._neuron_columns is None:
+                return []
+            self._axons = self._neuron_columns.axons()
+        return self._axons
+
+    @axons.setter
+    def axons(self, axons: List[AxonInfo]):
+        self._axons = axons
 
     @property
     def S(self) -> Union[NDArray, "torch.nn.Parameter"]:
@@ -330,6 +646,8 @@ class MetagraphMixin(ABC):
         Note:
             While the `NeurIPS paper <https://bittensor.com/pdfs/academia/NeurIPS_DAO_Workshop_2022_3_3.pdf>`_ may not explicitly detail the concept of hotkeys, they are a fundamental  of decentralized networks for secure and authenticated interactions.
         """
+        if self._axons is None and self._neuron_columns is not None:
+            return self._neuron_columns.hotkeys
         return [axon.hotkey for axon in self.axons]
 
     @property
@@ -346,6 +664,8 @@ class MetagraphMixin(ABC):
             The concept of coldkeys, while not explicitly covered in the NeurIPS paper, is a standard practice in
             blockchain and decentralized networks for enhanced security and asset protection.
         """
+        if self._axons is None and self._neuron_columns is not None:
+            return self._neuron_columns.coldkeys
         return [axon.coldkey for axon in self.axons]
 
     @property
@@ -365,6 +685,24 @@ class MetagraphMixin(ABC):
         """
         return [axon.ip_str() for axon in self.axons]
 
+    def __getattr__(self, name: str) -> Any:
+        # ``weights`` and ``bonds`` are only densified from their sparse form when first accessed.
+        matrix = self.__dict__.get("_lazy_dense", {}).pop(name, None)
+        if matrix is not None:
+            setattr(self, name, self._densify(matrix))
+            return getattr(self, name)
+        parent_getattr = getattr(super(), "__getattr__", None)
+        if parent_getattr is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        return parent_getattr(name)
+
+    def __setattr__(self, name: str, value: Any):
+        # Assigning ``weights`` or ``bonds`` replaces a pending densification.
+        self.__dict__.get("_lazy_dense", {}).pop(name, None)
+        super().__setattr__(name, value)
+
     @abstractmethod
     def __init__(
         self, netuid: int, network: str = "finney", lite: bool = True, sync: bool = True
@@ -474,6 +812,7 @@ class MetagraphMixin(ABC):
         block: Optional[int] = None,
         lite: bool = True,
         subtensor: Optional["bittensor.subtensor"] = None,
+        incremental: bool = False,
     ):
         """
         Synchronizes the metagraph with the Bittensor network's current state. It updates the metagraph's attributes
@@ -487,6 +826,10 @@ class MetagraphMixin(ABC):
             subtensor (Optional[bittensor.subtensor]): An instance of the subtensor class from Bittensor, providing an
                                                         interface to the underlying blockchain data. If provided, this
                                                         instance is used for data retrieval during synchronization.
+            incremental (bool): If True and the metagraph was synced before, only the neurons which changed since
+                                then are patched into the existing attributes. Without ``lite``, a full sync is done
+                                instead if an epoch ran in between, the number of neurons changed or more than
+                                ``INCREMENTAL_SYNC_MAX_FETCHES`` neurons changed.
 
         Returns:
             metagraph: The metagraph instance, updated to the state of the specified block or the latest network state.
@@ -500,6 +843,10 @@ class MetagraphMixin(ABC):
 
                 metagraph.sync(block=12345, lite=False, subtensor=subtensor)
 
+            Sync again every few blocks, only fetching the neurons that changed::
+
+                metagraph.sync(subtensor=subtensor, incremental=True)
+
         NOTE:
             If attempting to access data beyond the previous 300 blocks, you **must** use the ``archive`` network for subtensor.
             Light nodes are configured only to store the previous 300 blocks if connecting to finney or test networks.
@@ -522,6 +869,14 @@ class MetagraphMixin(ABC):
                     "Attempting to sync longer than 300 blocks ago on a non-archive node. Please use the 'archive' network for subtensor and retry."
                 )
 
+        if incremental:
+            # Pin the block, so that it is known which changes the synced state includes.
+            if block is None:
+                block = subtensor.get_current_block()  # type: ignore
+            if self._sync_incrementally(block, lite, subtensor):
+                return
+        self._synced_block = block
+
         # Assign neurons based on 'lite' flag
         self._assign_neurons(block, lite, subtensor)
 
@@ -532,7 +887,152 @@ class MetagraphMixin(ABC):
         if not lite:
             self._set_weights_and_bonds(subtensor=subtensor)
 
-    def _initialize_subtensor(self, subtensor):
+    def _sync_incrementally(
+        self, block: int, lite: bool, subtensor: "bittensor.subtensor"
+    ) -> bool:
+        """
+        Patches the metagraph with the neurons which changed since the last sync at a known block.
+
+        The changed neurons are found by comparing the lite neurons, read with a single call to
+        :func:`bittensor.subtensor.neurons_lite_columns`, with the synced ones. A lite sync takes their new values from
+        these columns. Otherwise, the changed neurons are fetched one by one with their weights and bonds, and a full
+        sync is needed if an epoch updated the bonds in between.
+
+        Args:
+            block (int): The block to sync to.
+            lite (bool): Whether the neurons are synced without their weights and bonds.
+            subtensor (bittensor.subtensor): The subtensor to fetch the changes from.
+
+        Returns:
+            bool: ``True`` if the metagraph was patched, ``False`` if it needs a full sync.
+        """
+        previous_block = self._synced_block
+        if previous_block is None or lite != self.lite or block < previous_block:
+            return False
+        if block > previous_block:
+            if not lite:
+                blocks_since_last_step = subtensor.blocks_since_last_step(
+                    self.netuid, block
+                )
+                if (
+                    blocks_since_last_step is None
+                    or block - blocks_since_last_step > previous_block
+                ):
+                    return False
+
+            columns = subtensor.neurons_lite_columns(block=block, netuid=self.netuid)
+            # The full neurons have every attribute of the lite ones.
+            synced = (
+                self._neuron_columns
+                if lite
+                else NeuronInfoLiteColumns.from_neurons(
+                    cast(List[NeuronInfoLite], self.neurons)
+                )
+            )
+            if synced is None or len(columns) != len(synced):
+                if not lite:
+                    return False
+                # The columns are all a full lite sync would fetch.
+                self._neuron_columns = columns
+                self._neurons = None
+                self._set_metagraph_attributes(block, subtensor)
+                self._synced_block = block
+                return True
+
+            changed = synced.changed(columns)
+            if lite:
+                self._patch_columns(changed, columns)
+            elif len(changed) > INCREMENTAL_SYNC_MAX_FETCHES:
+                return False
+            elif len(changed):
+                neurons: List[Union[NeuronInfo, NeuronInfoLite]] = []
+                for uid in changed:
+                    neuron = subtensor.neuron_for_uid(
+                        uid=int(uid), netuid=self.netuid, block=block
+                    )
+                    if neuron is None:
+                        return False
+                    neurons.append(neuron)
+                self._patch_neurons(changed, neurons, subtensor)
+
+        self.block = self._create_tensor(block, dtype=self.block.dtype)
+        self._synced_block = block
+        return True
+
+    def _patch_columns(self, uids: NDArray[np.int64], columns: NeuronInfoLiteColumns):
+        """
+        Replaces the columns of a lite sync, and the values of the neurons which changed in the metagraph attributes.
+
+        Args:
+            uids (NDArray[np.int64]): The UIDs of the neurons which changed.
+            columns (NeuronInfoLiteColumns): The new columns of all the neurons.
+        """
+        self._neuron_columns = columns
+        if len(uids) and (self._neurons is not None or self._axons is not None):
+            for uid, neuron in zip(uids, columns.take(uids).to_neurons()):
+                if self._neurons is not None:
+                    self._neurons[uid] = neuron
+                if self._axons is not None:
+                    self._axons[uid] = cast(AxonInfo, neuron.axon_info)
+
+        for name, attribute in INCREMENTAL_SYNC_ATTRIBUTES.items():
+            tensor = getattr(self, name)
+            tensor[uids] = self._create_tensor(
+                getattr(columns, attribute)[uids], dtype=tensor.dtype
+            )
+
+    def _patch_neurons(
+        self,
+        uids: NDArray[np.int64],
+        neurons: List[Union[NeuronInfo, NeuronInfoLite]],
+        subtensor: "bittensor.subtensor",
+    ):
+        """
+        Replaces some of the neurons of a full sync, and their values in the metagraph attributes.
+
+        Args:
+            uids (NDArray[np.int64]): The UIDs of the neurons.
+            neurons (List[Union[NeuronInfo, NeuronInfoLite]]): The new neurons, in the order of ``uids``.
+            subtensor (bittensor.subtensor): The subtensor the neurons were fetched from.
+        """
+        for uid, neuron in zip(uids, neurons):
+            if self._neurons is not None:
+                self._neurons[uid] = neuron
+            if self._axons is not None:
+                self._axons[uid] = cast(AxonInfo, neuron.axon_info)
+
+        for name, attribute in INCREMENTAL_SYNC_ATTRIBUTES.items():
+            tensor = getattr(self, name)
+            tensor[uids] = self._create_tensor(
+                self._neuron_values(attribute, neurons), dtype=tensor.dtype
+            )
+
+        if self.netuid == 0:
+            self._set_weights_and_bonds(subtensor=subtensor)
+        else:
+            weight_utils = bittensor.utils.weight_utils
+            n = len(self._neuron_values("uid"))
+            full_neurons = cast(List[NeuronInfo], neurons)
+            self._set_sparse(
+                "weights",
+                self.weights_csr.replace_rows(  # type: ignore
+                    uids,
+                    weight_utils.convert_weight_uids_and_vals_to_csr(
+                        n, [neuron.weights for neuron in full_neurons]
+                    ),
+                ),
+            )
+            self._set_sparse(
+                "bonds",
+                self.bonds_csr.replace_rows(  # type: ignore
+                    uids,
+                    weight_utils.convert_bond_uids_and_vals_to_csr(
+                        n, [neuron.bonds for neuron in full_neurons]
+                    ),
+                ),
+            )
+
+    def _initialize_subtensor(self, subtensor) -> "bittensor.subtensor":
         """
         Initializes the subtensor to be used for syncing the metagraph.
 
@@ -574,11 +1074,45 @@ class MetagraphMixin(ABC):
         """
         # TODO: Check and test the conditions for assigning neurons
         if lite:
-            self.neurons = subtensor.neurons_lite(block=block, netuid=self.netuid)
+            self._neurons = None
+            self._neuron_columns = subtensor.neurons_lite_columns(
+                block=block, netuid=self.netuid
+            )
         else:
             self.neurons = subtensor.neurons(block=block, netuid=self.netuid)
         self.lite = lite
 
+    def _neuron_values(
+        self,
+        attribute: str,
+        neurons: Optional[List[Union[NeuronInfo, NeuronInfoLite]]] = None,
+    ) -> Union[NDArray, List[Any]]:
+        """
+        Returns an attribute of every neuron, read from the columns of a lite sync when available.
+
+        Args:
+            attribute: The name of the :class:`bittensor.NeuronInfoLite` attribute, e.g. ``trust``. ``total_stake`` is
+                returned in tao.
+            neurons: The neurons to read the attribute of instead of the synced neurons.
+
+        Returns:
+            The values of the attribute, in the order of the neurons.
+        """
+        if neurons is None:
+            if self._neuron_columns is not None:
+                return getattr(self._neuron_columns, attribute)
+            neurons = self.neurons
+        if attribute == "total_stake":
+            return [neuron.total_stake.tao for neuron in neurons]
+        return [getattr(neuron, attribute) for neuron in neurons]
+
+    def _set_axons(self):
+        """Sets the axons of the synced neurons, they are created on first access after a lite sync."""
+        if self._neuron_columns is not None:
+            self._axons = None
+        else:
+            self.axons = [n.axon_info for n in self.neurons]
+
     @staticmethod
     def _create_tensor(data, dtype) -> Union[NDArray, "torch.nn.Parameter"]:
         """
@@ -615,81 +1149,100 @@ class MetagraphMixin(ABC):
 
                 self._set_weights_and_bonds(subtensor=subtensor)
         """
+        # Weights and bonds are only set by full syncs, whose neurons are NeuronInfo.
+        neurons = cast(List[NeuronInfo], self.neurons)
         # TODO: Check and test the computation of weights and bonds
         if self.netuid == 0:
-            self.weights = self._process_root_weights(
-                [neuron.weights for neuron in self.neurons],
+            self._set_sparse(
                 "weights",
-                subtensor,  # type: ignore
+                self._process_root_weights(
+                    [neuron.weights for neuron in neurons],
+                    "weights",
+                    subtensor,  # type: ignore
+                ),
             )
         else:
-            self.weights = self._process_weights_or_bonds(
-                [neuron.weights for neuron in self.neurons], "weights"
+            self._set_sparse(
+                "weights",
+                self._process_weights_or_bonds(
+                    [neuron.weights for neuron in neurons], "weights"
+                ),
             )
-            self.bonds = self._process_weights_or_bonds(
-                [neuron.bonds for neuron in self.neurons], "bonds"
+            self._set_sparse(
+                "bonds",
+                self._process_weights_or_bonds(
+                    [neuron.bonds for neuron in neurons], "bonds"
+                ),
             )
 
-    def _process_weights_or_bonds(
-        self, data, attribute: str
-    ) -> Union[NDArray, "torch.nn.Parameter"]:
+    def _set_sparse(self, attribute: str, matrix: CSRMatrix):
+        """
+        Sets the sparse form of the ``weights`` or ``bonds``, the dense matrix is created when the attribute is first
+        accessed.
+
+        Args:
+            attribute (str): ``weights`` or ``bonds``.
+            matrix (CSRMatrix): The synced matrix.
+        """
+        setattr(self, f"{attribute}_csr", matrix)
+        try:
+            delattr(self, attribute)
+        except AttributeError:
+            pass
+        if "_lazy_dense" not in self.__dict__:
+            self._lazy_dense = {}
+        self._lazy_dense[attribute] = matrix
+
+    @staticmethod
+    def _densify(matrix: CSRMatrix) -> Union[NDArray, "torch.nn.Parameter"]:
         """
-        Processes the raw weights or bonds data and converts it into a structured tensor format. This method handles the transformation of neuron connection data (``weights`` or ``bonds``) from a list or other unstructured format into a tensor that can be utilized within the metagraph model.
+        Creates the dense ``weights`` or ``bonds`` tensor from their sparse form.
+
+        Args:
+            matrix (CSRMatrix): The sparse matrix.
+
+        Returns:
+            A float32 tensor parameter, empty if the matrix has no rows.
+        """
+        if use_torch():
+            if matrix.shape[0] == 0:
+                return torch.nn.Parameter()
+            return torch.nn.Parameter(
+                torch.from_numpy(matrix.todense(np.float32)), requires_grad=False
+            )
+        if matrix.shape[0] == 0:
+            return np.array([], dtype=np.float32)
+        return matrix.todense(np.float32)
+
+    def _process_weights_or_bonds(self, data, attribute: str) -> CSRMatrix:
+        """
+        Processes the raw weights or bonds data and converts it into a sparse matrix. This method handles the transformation of neuron connection data (``weights`` or ``bonds``) from a list of ``(uid, value)`` pairs per neuron into a :class:`CSRMatrix`, in a single pass over all neurons.
 
         Args:
             data: The raw weights or bonds data to be processed. This data typically comes from the subtensor.
             attribute: A string indicating whether the data is ``weights`` or ``bonds``, which determines the specific processing steps to be applied.
 
         Returns:
-            A tensor parameter encapsulating the processed weights or bonds data.
+            A sparse matrix of the processed weights or bonds data, with a row and a column per neuron.
 
         Internal Usage:
             Used internally to process and set weights or bonds for the neurons::
 
-                self.weights = self._process_weights_or_bonds(raw_weights_data, "weights")
+                self.weights_csr = self._process_weights_or_bonds(raw_weights_data, "weights")
         """
-        data_array = []
-        for item in data:
-            if len(item) == 0:
-                if use_torch():
-                    data_array.append(torch.zeros(len(self.neurons)))  # type: ignore
-                else:
-                    data_array.append(np.zeros(len(self.neurons), dtype=np.float32))  # type: ignore
-            else:
-                uids, values = zip(*item)
-                # TODO: Validate and test the conversion of uids and values to tensor
-                if attribute == "weights":
-                    data_array.append(
-                        bittensor.utils.weight_utils.convert_weight_uids_and_vals_to_tensor(
-                            len(self.neurons),
-                            list(uids),
-                            list(values),  # type: ignore
-                        )
-                    )
-                else:
-                    data_array.append(
-                        bittensor.utils.weight_utils.convert_bond_uids_and_vals_to_tensor(  # type: ignore
-                            len(self.neurons), list(uids), list(values)
-                        ).astype(np.float32)
-                    )
-        tensor_param: Union["torch.nn.Parameter", NDArray] = (
-            (
-                torch.nn.Parameter(torch.stack(data_array), requires_grad=False)
-                if len(data_array)
-                else torch.nn.Parameter()
+        if attribute == "weights":
+            matrix = bittensor.utils.weight_utils.convert_weight_uids_and_vals_to_csr(
+                len(self.neurons), data
             )
-            if use_torch()
-            else (
-                np.stack(data_array)
-                if len(data_array)
-                else np.array([], dtype=np.float32)
+        else:
+            matrix = bittensor.utils.weight_utils.convert_bond_uids_and_vals_to_csr(
+                len(self.neurons), data
             )
-        )
-        if len(data_array) == 0:
+        if len(data) == 0:
             bittensor.logging.warning(
                 f"Empty {attribute}_array on metagraph.sync(). The '{attribute}' tensor is empty."
             )
-        return tensor_param
+        return matrix
 
     @abstractmethod
     def _set_metagraph_attributes(self, block, subtensor):
@@ -697,7 +1250,7 @@ class MetagraphMixin(ABC):
 
     def _process_root_weights(
         self, data, attribute: str, subtensor: bittensor.subtensor
-    ) -> Union[NDArray, "torch.nn.Parameter"]:
+    ) -> CSRMatrix:
         """
         Specifically processes the root weights data for the metagraph. This method is similar to :func:`_process_weights_or_bonds` but is tailored for processing root weights, which have a different structure and significance in the network.
 
@@ -707,57 +1260,33 @@ class MetagraphMixin(ABC):
             subtensor: The subtensor instance used for additional data and context needed in processing.
 
         Returns:
-            A tensor parameter encapsulating the processed root weights data.
+            A sparse matrix of the processed root weights data, with a row per neuron and a column per subnet.
 
         Internal Usage:
             Used internally to process and set root weights for the metagraph::
 
-                self.root_weights = self._process_root_weights(
+                self.weights_csr = self._process_root_weights(
                     raw_root_weights_data, "weights", subtensor
                     )
 
         """
-        data_array = []
         n_subnets = subtensor.get_total_subnets() or 0
         subnets = subtensor.get_subnets()
-        for item in data:
-            if len(item) == 0:
-                if use_torch():
-                    data_array.append(torch.zeros(n_subnets))
-                else:
-                    data_array.append(np.zeros(n_subnets, dtype=np.float32))  # type: ignore
-            else:
-                uids, values = zip(*item)
-                # TODO: Validate and test the conversion of uids and values to tensor
-                data_array.append(
-                    bittensor.utils.weight_utils.convert_root_weight_uids_and_vals_to_tensor(  # type: ignore
-                        n_subnets, list(uids), list(values), subnets
-                    )
-                )
-
-        tensor_param: Union[NDArray, "torch.nn.Parameter"] = (
-            (
-                torch.nn.Parameter(torch.stack(data_array), requires_grad=False)
-                if len(data_array)
-                else torch.nn.Parameter()
-            )
-            if use_torch()
-            else (
-                np.stack(data_array)
-                if len(data_array)
-                else np.array([], dtype=np.float32)
-            )
+        matrix = bittensor.utils.weight_utils.convert_root_weight_uids_and_vals_to_csr(
+            n_subnets, data, subnets
         )
-        if len(data_array) == 0:
+        if len(data) == 0:
             bittensor.logging.warning(
                 f"Empty {attribute}_array on metagraph.sync(). The '{attribute}' tensor is empty."
             )
-        return tensor_param
+        return matrix
 
     def save(self) -> "metagraph":  # type: ignore
         """
         Saves the current state of the metagraph to a file on disk. This function is crucial for persisting the current state of the network's metagraph, which can later be reloaded or analyzed. The save operation includes all neuron attributes and parameters, ensuring a complete snapshot of the metagraph's state.
 
+        The state is saved as a columnar snapshot directory, see :func:`save_snapshot`. Loading it memory maps the arrays, so that processes loading the same snapshot share one copy of them.
+
         Returns:
             metagraph: The metagraph instance after saving its state.
 
@@ -778,19 +1307,9 @@ class MetagraphMixin(ABC):
         """
         save_directory = get_save_dir(self.network, self.netuid)
         os.makedirs(save_directory, exist_ok=True)
-        if use_torch():
-            graph_filename = f"{save_directory}/block-{self.block.item()}.pt"
-            state_dict = self.state_dict()
-            state_dict["axons"] = self.axons
-            torch.save(state_dict, graph_filename)
-            state_dict = torch.load(
-                graph_filename
-            )  # verifies that the file can be loaded correctly
-        else:
-            graph_filename = f"{save_directory}/block-{self.block.item()}.pt"
-            state_dict = self.state_dict()
-            with open(graph_filename, "wb") as graph_file:
-                pickle.dump(state_dict, graph_file)
+        save_snapshot(
+            join(save_directory, f"block-{self.block.item()}"), self.state_dict()
+        )
         return self
 
     def load(self):
@@ -818,6 +1337,19 @@ class MetagraphMixin(ABC):
         """
         self.load_from_path(get_save_dir(self.network, self.netuid))
 
+    @abstractmethod
+    def _load_state(self, state_dict: dict) -> "metagraph":  # type: ignore
+        """
+        Sets the metagraph parameters from a state dict, as loaded by :func:`load_from_path`.
+
+        Args:
+            state_dict (dict): The state of the metagraph, with its ``axons``. ``weights`` and ``bonds`` are optional.
+
+        Returns:
+            metagraph: The metagraph instance.
+        """
+        pass
+
     @abstractmethod
     def load_from_path(self, dir_path: str) -> "metagraph":  # type: ignore
         """
@@ -947,57 +1479,65 @@ class TorchMetaGraph(MetagraphMixin, BaseClass):  # type: ignore
 
                 self._set_metagraph_attributes(block, subtensor)
         """
-        self.n = self._create_tensor(len(self.neurons), dtype=torch.int64)
+        self.n = self._create_tensor(len(self._neuron_values("uid")), dtype=torch.int64)
         self.version = self._create_tensor(
             [bittensor.__version_as_int__], dtype=torch.int64
         )
         self.block = self._create_tensor(
             block if block else subtensor.block, dtype=torch.int64
         )
-        self.uids = self._create_tensor(
-            [neuron.uid for neuron in self.neurons], dtype=torch.int64
-        )
+        self.uids = self._create_tensor(self._neuron_values("uid"), dtype=torch.int64)
         self.trust = self._create_tensor(
-            [neuron.trust for neuron in self.neurons], dtype=torch.float32
+            self._neuron_values("trust"), dtype=torch.float32
         )
         self.consensus = self._create_tensor(
-            [neuron.consensus for neuron in self.neurons], dtype=torch.float32
+            self._neuron_values("consensus"), dtype=torch.float32
         )
         self.incentive = self._create_tensor(
-            [neuron.incentive for neuron in self.neurons], dtype=torch.float32
+            self._neuron_values("incentive"), dtype=torch.float32
         )
         self.dividends = self._create_tensor(
-            [neuron.dividends for neuron in self.neurons], dtype=torch.float32
+            self._neuron_values("dividends"), dtype=torch.float32
         )
         self.ranks = self._create_tensor(
-            [neuron.rank for neuron in self.neurons], dtype=torch.float32
+            self._neuron_values("rank"), dtype=torch.float32
         )
         self.emission = self._create_tensor(
-            [neuron.emission for neuron in self.neurons], dtype=torch.float32
+            self._neuron_values("emission"), dtype=torch.float32
         )
         self.active = self._create_tensor(
-            [neuron.active for neuron in self.neurons], dtype=torch.int64
+            self._neuron_values("active"), dtype=torch.int64
         )
         self.last_update = self._create_tensor(
-            [neuron.last_update for neuron in self.neurons], dtype=torch.int64
+            self._neuron_values("last_update"), dtype=torch.int64
         )
         self.validator_permit = self._create_tensor(
-            [neuron.validator_permit for neuron in self.neurons], dtype=torch.bool
+            self._neuron_values("validator_permit"), dtype=torch.bool
         )
         self.validator_trust = self._create_tensor(
-            [neuron.validator_trust for neuron in self.neurons], dtype=torch.float32
+            self._neuron_values("validator_trust"), dtype=torch.float32
         )
         self.total_stake = self._create_tensor(
-            [neuron.total_stake.tao for neuron in self.neurons], dtype=torch.float32
+            self._neuron_values("total_stake"), dtype=torch.float32
         )
         self.stake = self._create_tensor(
-            [neuron.stake for neuron in self.neurons], dtype=torch.float32
+            self._neuron_values("stake"), dtype=torch.float32
         )
-        self.axons = [n.axon_info for n in self.neurons]
+        self._set_axons()
 
     def load_from_path(self, dir_path: str) -> "metagraph":  # type: ignore
         graph_file = latest_block_path(dir_path)
-        state_dict = torch.load(graph_file)
+        if os.path.isdir(graph_file):
+            state_dict = load_snapshot(graph_file)
+        else:
+            state_dict = torch.load(graph_file)
+        return self._load_state(state_dict)
+
+    def _load_state(self, state_dict: dict) -> "metagraph":  # type: ignore
+        state_dict = {
+            key: torch.from_numpy(value) if isinstance(value, np.ndarray) else value
+            for key, value in state_dict.items()
+        }
         self.n = torch.nn.Parameter(state_dict["n"], requires_grad=False)
         self.block = torch.nn.Parameter(state_dict["block"], requires_grad=False)
         self.uids = torch.nn.Parameter(state_dict["uids"], requires_grad=False)
@@ -1029,6 +1569,8 @@ class TorchMetaGraph(MetagraphMixin, BaseClass):  # type: ignore
         )
         self.uids = torch.nn.Parameter(state_dict["uids"], requires_grad=False)
         self.axons = state_dict["axons"]
+        self.weights_csr = self.bonds_csr = None
+        self._synced_block = None
         if "weights" in state_dict:
             self.weights = torch.nn.Parameter(
                 state_dict["weights"], requires_grad=False
@@ -1085,59 +1627,52 @@ class NonTorchMetagraph(MetagraphMixin):
                 self._set_metagraph_attributes(block, subtensor)
         """
         # TODO: Check and test the setting of each attribute
-        self.n = self._create_tensor(len(self.neurons), dtype=np.int64)
+        self.n = self._create_tensor(len(self._neuron_values("uid")), dtype=np.int64)
         self.version = self._create_tensor(
             [bittensor.__version_as_int__], dtype=np.int64
         )
         self.block = self._create_tensor(
             block if block else subtensor.block, dtype=np.int64
         )
-        self.uids = self._create_tensor(
-            [neuron.uid for neuron in self.neurons], dtype=np.int64
-        )
-        self.trust = self._create_tensor(
-            [neuron.trust for neuron in self.neurons], dtype=np.float32
-        )
+        self.uids = self._create_tensor(self._neuron_values("uid"), dtype=np.int64)
+        self.trust = self._create_tensor(self._neuron_values("trust"), dtype=np.float32)
         self.consensus = self._create_tensor(
-            [neuron.consensus for neuron in self.neurons], dtype=np.float32
+            self._neuron_values("consensus"), dtype=np.float32
         )
         self.incentive = self._create_tensor(
-            [neuron.incentive for neuron in self.neurons], dtype=np.float32
+            self._neuron_values("incentive"), dtype=np.float32
         )
         self.dividends = self._create_tensor(
-            [neuron.dividends for neuron in self.neurons], dtype=np.float32
-        )
-        self.ranks = self._create_tensor(
-            [neuron.rank for neuron in self.neurons], dtype=np.float32
+            self._neuron_values("dividends"), dtype=np.float32
         )
+        self.ranks = self._create_tensor(self._neuron_values("rank"), dtype=np.float32)
         self.emission = self._create_tensor(
-            [neuron.emission for neuron in self.neurons], dtype=np.float32
-        )
-        self.active = self._create_tensor(
-            [neuron.active for neuron in self.neurons], dtype=np.int64
+            self._neuron_values("emission"), dtype=np.float32
         )
+        self.active = self._create_tensor(self._neuron_values("active"), dtype=np.int64)
         self.last_update = self._create_tensor(
-            [neuron.last_update for neuron in self.neurons], dtype=np.int64
+            self._neuron_values("last_update"), dtype=np.int64
         )
         self.validator_permit = self._create_tensor(
-            [neuron.validator_permit for neuron in self.neurons], dtype=bool
+            self._neuron_values("validator_permit"), dtype=bool
         )
         self.validator_trust = self._create_tensor(
-            [neuron.validator_trust for neuron in self.neurons], dtype=np.float32
+            self._neuron_values("validator_trust"), dtype=np.float32
         )
         self.total_stake = self._create_tensor(
-            [neuron.total_stake.tao for neuron in self.neurons], dtype=np.float32
+            self._neuron_values("total_stake"), dtype=np.float32
         )
-        self.stake = self._create_tensor(
-            [neuron.stake for neuron in self.neurons], dtype=np.float32
-        )
-        self.axons = [n.axon_info for n in self.neurons]
+        self.stake = self._create_tensor(self._neuron_values("stake"), dtype=np.float32)
+        self._set_axons()
 
     def load_from_path(self, dir_path: str) -> "metagraph":  # type: ignore
         graph_filename = latest_block_path(dir_path)
         try:
-            with open(graph_filename, "rb") as graph_file:
-                state_dict = pickle.load(graph_file)
+            if os.path.isdir(graph_filename):
+                state_dict = load_snapshot(graph_filename)
+            else:
+                with open(graph_filename, "rb") as graph_file:
+                    state_dict = pickle.load(graph_file)
         except pickle.UnpicklingError:
             bittensor.__console__.print(
                 "Unable to load file. Attempting to restore metagraph using torch."
@@ -1156,7 +1691,9 @@ class NonTorchMetagraph(MetagraphMixin):
             except (RuntimeError, ImportError):
                 bittensor.__console__.print("Unable to load file. It may be corrupted.")
                 raise
+        return self._load_state(state_dict)
 
+    def _load_state(self, state_dict: dict) -> "metagraph":  # type: ignore
         self.n = state_dict["n"]
         self.block = state_dict["block"]
         self.uids = state_dict["uids"]
@@ -1173,6 +1710,8 @@ class NonTorchMetagraph(MetagraphMixin):
         self.last_update = state_dict["last_update"]
         self.validator_permit = state_dict["validator_permit"]
         self.axons = state_dict["axons"]
+        self.weights_csr = self.bonds_csr = None
+        self._synced_block = None
         if "weights" in state_dict:
             self.weights = state_dict["weights"]
         if "bonds" in state_dict:
@@ -0,0 +1,376 @@
+"""Append-only history of the states of a metagraph."""
+
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import json
+import os
+import struct
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+import bittensor
+from bittensor.metagraph import (
+    _snapshot_array,
+    axon_columns,
+    axons_from_columns,
+    get_save_dir,
+)
+
+# The per-neuron parameters of the metagraph stored by the history, besides its axons.
+HISTORY_COLUMNS = (
+    "uids",
+    "stake",
+    "total_stake",
+    "ranks",
+    "trust",
+    "consensus",
+    "validator_trust",
+    "incentive",
+    "emission",
+    "dividends",
+    "active",
+    "last_update",
+    "validator_permit",
+)
+
+# Magic, kind, block, metadata size and payload size of a record.
+_RECORD_HEADER = struct.Struct("<4sBQIQ")
+_RECORD_MAGIC = b"BTMH"
+_KEYFRAME = 0
+_DELTA = 1
+_ALIGNMENT = 8
+
+BlockRange = Union[range, Tuple[int, int]]
+
+
+class MetagraphHistory:
+    """
+    Append-only store of the states of a metagraph at successive blocks.
+
+    Every :func:`append` adds a record to a single log file. A keyframe record holds every column of the metagraph, a
+    delta record only the values which changed since the previous record, with their uids. A keyframe is written
+    every ``keyframe_interval`` records and whenever the number of neurons changes, so rebuilding a state reads at
+    most that many records. The columns are the per-neuron parameters of :data:`HISTORY_COLUMNS` and the axons, the
+    weights and bonds are not stored.
+
+    The log is memory mapped when it is read. Records appended by another process are read by :func:`refresh`, a
+    record torn by a crash while appending is dropped. Only one process may append to a history.
+
+    Example::
+
+        history = bittensor.MetagraphHistory(netuid=1)
+        history.append(metagraph)
+
+        blocks, stake = history.stake(uid=0, block_range=range(1000, 2000))
+        metagraph = history.at(1500)
+
+    Args:
+        netuid (int): The subnet of the metagraph.
+        network (str): The network of the metagraph.
+        path (Optional[str]): The log file, ``history.bin`` in the save directory of the metagraph by default.
+        keyframe_interval (int): The number of records from a keyframe to the next.
+
+    Raises:
+        ValueError: If ``keyframe_interval`` is not positive.
+    """
+
+    def __init__(
+        self,
+        netuid: int,
+        network: str = "finney",
+        path: Optional[str] = None,
+        keyframe_interval: int = 100,
+    ):
+        if keyframe_interval < 1:
+            raise ValueError(
+                f"keyframe_interval must be positive, got {keyframe_interval}"
+            )
+        self.netuid = netuid
+        self.network = network
+        self.path = path or os.path.join(get_save_dir(network, netuid), "history.bin")
+        self.keyframe_interval = keyframe_interval
+        self._blocks: List[int] = []
+        self._kinds: List[int] = []
+        self._keyframes: List[int] = []
+        # The dtype, file offset and length of each array of each record.
+        self._arrays: List[Dict[str, Tuple[str, int, int]]] = []
+        self._string_indices: Dict[str, int] = {}
+        self._strings: List[str] = []
+        self._end = 0
+        self._map: Optional[np.memmap] = None
+        self._last_state: Optional[Dict[str, NDArray]] = None
+        self.refresh()
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    @property
+    def blocks(self) -> NDArray[np.int64]:
+        """The block of each record, in increasing order."""
+        return np.array(self._blocks, dtype=np.int64)
+
+    def refresh(self):
+        """Reads the records appended to the log since it was last read."""
+        if not os.path.exists(self.path):
+            return
+        end = self._end
+        with open(self.path, "rb") as log:
+            size = os.fstat(log.fileno()).st_size
+            log.seek(self._end)
+            while self._end + _RECORD_HEADER.size <= size:
+                magic, kind, block, metadata_size, payload_size = _RECORD_HEADER.unpack(
+                    log.read(_RECORD_HEADER.size)
+                )
+                if magic != _RECORD_MAGIC:
+                    raise ValueError(
+                        f"Invalid metagraph history record at offset {self._end} of: {self.path}"
+                    )
+                payload_offset = self._end + _RECORD_HEADER.size + metadata_size
+                if payload_offset + payload_size > size:
+                    break
+                metadata = json.loads(log.read(metadata_size))
+                log.seek(payload_size, os.SEEK_CUR)
+                self._add_record(kind, block, metadata, payload_offset)
+                self._end = payload_offset + payload_size
+        if self._end != end:
+            self._map = None
+            self._last_state = None
+
+    def append(self, metagraph: "bittensor.metagraph"):
+        """
+        Records the state of a synced metagraph.
+
+        Args:
+            metagraph (bittensor.metagraph): The metagraph, synced at a block after the last recorded block.
+
+        Raises:
+            ValueError: If the block of the metagraph is not after the last recorded block.
+        """
+        self.refresh()
+        block = int(_snapshot_array(metagraph.block))
+        if self._blocks and block <= self._blocks[-1]:
+            raise ValueError(
+                f"Block {block} is not after the last block {self._blocks[-1]} of the history"
+            )
+        columns = {
+            name: np.array(_snapshot_array(getattr(metagraph, name)))
+            for name in HISTORY_COLUMNS
+        }
+        string_indices = dict(self._string_indices)
+        columns.update(axon_columns(metagraph.axons, string_indices))
+        strings = list(string_indices)[len(self._strings) :]
+
+        previous = self._last_state
+        if previous is None and self._blocks:
+            previous = self._state(len(self._blocks) - 1)
+        if (
+            previous is None
+            or len(self._blocks) - self._keyframes[-1] >= self.keyframe_interval
+            or any(
+                previous[key].shape != column.shape for key, column in columns.items()
+            )
+        ):
+            self._write(_KEYFRAME, block, columns, strings)
+        else:
+            arrays = {}
+            for key, column in columns.items():
+                changed = np.flatnonzero(column != previous[key])
+                if len(changed):
+                    arrays[f"{key}.uids"] = changed.astype(np.int32)
+                    arrays[key] = column[changed]
+            self._write(_DELTA, block, arrays, strings)
+        self._last_state = columns
+
+    def at(self, block: int) -> "bittensor.metagraph":
+        """
+        Rebuilds the metagraph at a block.
+
+        Args:
+            block (int): The block.
+
+        Returns:
+            bittensor.metagraph: The metagraph of the last record at or before ``block``, without weights and bonds.
+
+        Raises:
+            KeyError: If no record is at or before ``block``.
+        """
+        index = bisect_right(self._blocks, block) - 1
+        if index < 0:
+            raise KeyError(f"No metagraph history at or before block {block}")
+        state = self._state(index)
+        state_dict = {name: state[name] for name in HISTORY_COLUMNS}
+        state_dict["n"] = np.array(len(state["uids"]), dtype=np.int64)
+        state_dict["block"] = np.array(self._blocks[index], dtype=np.int64)
+        state_dict["axons"] = axons_from_columns(state, self._strings)
+        metagraph = bittensor.metagraph(
+            netuid=self.netuid, network=self.network, sync=False
+        )
+        return metagraph._load_state(state_dict)
+
+    def series(
+        self, name: str, uid: int, block_range: Optional[BlockRange] = None
+    ) -> Tuple[NDArray[np.int64], NDArray]:
+        """
+        Returns the values of a column for one neuron at each recorded block of a range.
+
+        Args:
+            name (str): The column, one of :data:`HISTORY_COLUMNS`.
+            uid (int): The uid of the neuron.
+            block_range (Optional[BlockRange]): The blocks, a ``range`` or ``(start, stop)`` with ``stop`` excluded.
+                Every recorded block by default.
+
+        Returns:
+            Tuple[NDArray[np.int64], NDArray]: The recorded blocks of the range at which the uid existed, and the value
+                at each of them.
+
+        Raises:
+            ValueError: If ``name`` is not a column of the history.
+        """
+        if name not in HISTORY_COLUMNS:
+            raise ValueError(
+                f"Unknown metagraph history column {name!r}, expected one of {HISTORY_COLUMNS}"
+            )
+        if block_range is None:
+            first, last = 0, len(self._blocks)
+        else:
+            start, stop = (
+                (block_range.start, block_range.stop)
+                if isinstance(block_range, range)
+                else block_range
+            )
+            first = bisect_left(self._blocks, start)
+            last = bisect_left(self._blocks, stop)
+
+        blocks: List[int] = []
+        values: List = []
+        if first < last:
+            value = None
+            for index in range(self._keyframe_index(first), last):
+                if self._kinds[index] == _KEYFRAME:
+                    column = self._array(index, name)
+                    value = column[uid] if uid < len(column) else None
+                elif value is not None and name in self._arrays[index]:
+                    uids = self._array(index, f"{name}.uids")
+                    position = np.searchsorted(uids, uid)
+                    if position < len(uids) and uids[position] == uid:
+                        value = self._array(index, name)[position]
+                if index >= first and value is not None:
+                    blocks.append(self._blocks[index])
+                    values.append(value)
+        return np.array(blocks, dtype=np.int64), np.array(values)
+
+    def stake(
+        self, uid: int, block_range: Optional[BlockRange] = None
+    ) -> Tuple[NDArray[np.int64], NDArray[np.float32]]:
+        """Returns the stake of a neuron at each recorded block of a range, see :func:`series`."""
+        return self.series("stake", uid, block_range)
+
+    def incentive(
+        self, uid: int, block_range: Optional[BlockRange] = None
+    ) -> Tuple[NDArray[np.int64], NDArray[np.float32]]:
+        """Returns the incentive of a neuron at each recorded block of a range, see :func:`series`."""
+        return self.series("incentive", uid, block_range)
+
+    def emission(
+        self, uid: int, block_range: Optional[BlockRange] = None
+    ) -> Tuple[NDArray[np.int64], NDArray[np.float32]]:
+        """Returns the emission of a neuron at each recorded block of a range, see :func:`series`."""
+        return self.series("emission", uid, block_range)
+
+    def dividends(
+        self, uid: int, block_range: Optional[BlockRange] = None
+    ) -> Tuple[NDArray[np.int64], NDArray[np.float32]]:
+        """Returns the dividends of a neuron at each recorded block of a range, see :func:`series`."""
+        return self.series("dividends", uid, block_range)
+
+    def _add_record(self, kind: int, block: int, metadata: dict, payload_offset: int):
+        if kind == _KEYFRAME:
+            self._keyframes.append(len(self._blocks))
+        self._blocks.append(block)
+        self._kinds.append(kind)
+        self._arrays.append(
+            {
+                key: (dtype, payload_offset + offset, length)
+                for key, (dtype, offset, length) in metadata["arrays"].items()
+            }
+        )
+        for string in metadata["strings"]:
+            if string not in self._string_indices:
+                self._string_indices[string] = len(self._strings)
+                self._strings.append(string)
+
+    def _write(
+        self, kind: int, block: int, arrays: Dict[str, NDArray], strings: List[str]
+    ):
+        payload = bytearray()
+        layout = {}
+        for key, array in arrays.items():
+            payload += bytes(-len(payload) % _ALIGNMENT)
+            layout[key] = (array.dtype.str, len(payload), len(array))
+            payload += np.ascontiguousarray(array).tobytes()
+        metadata = json.dumps({"arrays": layout, "strings": strings}).encode()
+        # Pad the metadata, so that the arrays of the payload are aligned in the memory map.
+        metadata += b" " * (
+            -(self._end + _RECORD_HEADER.size + len(metadata)) % _ALIGNMENT
+        )
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path, "r+b" if os.path.exists(self.path) else "wb") as log:
+            # Drop a record torn by a crash while appending.
+            log.seek(self._end)
+            log.truncate()
+            log.write(
+                _RECORD_HEADER.pack(
+                    _RECORD_MAGIC, kind, block, len(metadata), len(payload)
+                )
+            )
+            log.write(metadata)
+            log.write(payload)
+        payload_offset = self._end + _RECORD_HEADER.size + len(metadata)
+        self._add_record(kind, block, json.loads(metadata), payload_offset)
+        self._end = payload_offset + len(payload)
+        self._map = None
+
+    def _keyframe_index(self, index: int) -> int:
+        return self._keyframes[bisect_right(self._keyframes, index) - 1]
+
+    def _array(self, index: int, key: str) -> NDArray:
+        if self._map is None:
+            self._map = np.memmap(
+                self.path, dtype=np.uint8, mode="r", shape=(self._end,)
+            )
+        dtype, offset, length = self._arrays[index][key]
+        return np.frombuffer(
+            self._map, dtype=np.dtype(dtype), count=length, offset=offset
+        )
+
+    def _state(self, index: int) -> Dict[str, NDArray]:
+        keyframe = self._keyframe_index(index)
+        state = {
+            key: self._array(keyframe, key).copy() for key in self._arrays[keyframe]
+        }
+        for delta in range(keyframe + 1, index + 1):
+            for key in self._arrays[delta]:
+                if not key.endswith(".uids"):
+                    state[key][self._array(delta, f"{key}.uids")] = self._array(
+                        delta, key
+                    )
+        return state
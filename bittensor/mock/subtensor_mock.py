@@ -29,6 +29,7 @@ from ..wallet import wallet
 from ..chain_data import (
     NeuronInfo,
     NeuronInfoLite,
+    NeuronInfoLiteColumns,
     PrometheusInfo,
     DelegateInfo,
     SubnetInfo,
@@ -290,6 +291,11 @@ class MockSubtensor(Subtensor):
     def get_block_hash(self, block_id: int) -> str:
         return "0x" + sha256(str(block_id).encode()).hexdigest()[:64]
 
+    def _get_block_hash(self, block: Optional[int]) -> Optional[str]:
+        if block is None:
+            return self._pinned_block_hash()
+        return self.get_block_hash(block)
+
     def create_subnet(self, netuid: int) -> None:
         subtensor_state = self.chain_state["SubtensorModule"]
         if netuid not in subtensor_state["NetworksAdded"]:
@@ -710,6 +716,22 @@ class MockSubtensor(Subtensor):
         else:
             return None
 
+    def query_multi(
+        self, queries: List[Tuple[str, str, list]], block: Optional[int] = None
+    ) -> List[object]:
+        values = []
+        for module, name, params in queries:
+            if (module, name) == ("System", "Account"):
+                balance = self.get_balance(params[0], block)
+                values.append({"data": {"free": balance.rao}})
+            elif module == "SubtensorModule":
+                values.append(self.query_subtensor(name, block, list(params)).value)
+            else:
+                raise NotImplementedError(
+                    f"Mock storage {module}.{name} is not supported"
+                )
+        return values
+
     def get_current_block(self) -> int:
         return self.block_number
 
@@ -790,6 +812,17 @@ class MockSubtensor(Subtensor):
 
         return neurons
 
+    def blocks_since_last_step(
+        self, netuid: int, block: Optional[int] = None
+    ) -> Optional[int]:
+        subtensor_state = self.chain_state["SubtensorModule"]
+        if netuid not in subtensor_state["NetworksAdded"]:
+            return None
+
+        return self._get_most_recent_storage(
+            subtensor_state["BlocksSinceLastStep"][netuid], block
+        )
+
     @staticmethod
     def _get_most_recent_storage(
         storage: Dict[BlockNumber, Any], block_number: Optional[int] = None
@@ -928,7 +961,10 @@ class MockSubtensor(Subtensor):
         trust = U16_NORMALIZED_FLOAT(trust)
         validator_trust = U16_NORMALIZED_FLOAT(validator_trust)
         dividends = U16_NORMALIZED_FLOAT(dividends)
-        prometheus_info = PrometheusInfo.fix_decoded_values(prometheus_info)
+        # fix_decoded_values converts the ip in place, the stored info must keep its integer ip.
+        prometheus_info = PrometheusInfo.fix_decoded_values(
+            {key: prometheus_info[key] for key in prometheus_info}
+        )
         axon_info_ = AxonInfo.from_neuron_info(
             {"hotkey": hotkey, "coldkey": coldkey, "axon_info": axon_info_}
         )
@@ -1004,6 +1040,11 @@ class MockSubtensor(Subtensor):
 
         return neurons
 
+    def neurons_lite_columns(
+        self, netuid: int, block: Optional[int] = None
+    ) -> NeuronInfoLiteColumns:
+        return NeuronInfoLiteColumns.from_neurons(self.neurons_lite(netuid, block))
+
     # Extrinsics
     def _do_delegation(
         self,
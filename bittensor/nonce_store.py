@@ -0,0 +1,289 @@
+"""Nonce stores used by the axon to protect against replayed requests."""
+
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import heapq
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+from bittensor.constants import ALLOWED_DELTA, NONCE_MAX_TIMEOUT
+
+
+def nonce_window(timeout: Optional[float]) -> int:
+    """
+    Returns how long (in ns) after its creation a nonce is accepted by an axon that has no nonce stored for it.
+
+    The timeout is chosen by the sender, so it is clamped to :data:`NONCE_MAX_TIMEOUT` seconds.
+
+    Args:
+        timeout (float, optional): The synapse timeout, in seconds.
+
+    Returns:
+        int: The length of the window, in ns.
+    """
+    return ALLOWED_DELTA + int(min(timeout or 0, NONCE_MAX_TIMEOUT) * 1e9)
+
+
+def nonce_expiry(nonce: int, now: Optional[int] = None) -> int:
+    """
+    Returns the time (in ns) after which a stored nonce no longer needs to be remembered.
+
+    Requests without a stored nonce are only accepted if their nonce is newer than
+    ``time.time_ns() - nonce_window(timeout)``. Once that window has moved past a stored nonce, a replay
+    of it is rejected by the window check alone, so the entry can be evicted safely.
+
+    The timeout is not signed, so a replay may claim any timeout: entries are kept for the widest window,
+    that of a :data:`NONCE_MAX_TIMEOUT` timeout. The nonce is clamped to ``now + ALLOWED_DELTA``, as the axon
+    rejects nonces further in the future.
+
+    Args:
+        nonce (int): The nonce of the request, a unix timestamp in ns.
+        now (int, optional): Current time in ns. Defaults to :func:`time.time_ns`.
+
+    Returns:
+        int: The expiry time of the entry, a unix timestamp in ns.
+    """
+    now = now or time.time_ns()
+    return min(nonce, now + ALLOWED_DELTA) + nonce_window(NONCE_MAX_TIMEOUT)
+
+
+class NonceStore(ABC):
+    """
+    Keeps the last accepted nonce of every ``hotkey:uuid`` endpoint key seen by an axon.
+
+    Entries are stored with an expiry time (see :func:`nonce_expiry`) and are evicted once it has passed.
+    The axon stores the nonces of legacy dendrites, which are not subject to the time window check, without
+    expiry. Forgetting one would make every request captured from that dendrite replayable, so these entries
+    are never evicted, and keep no expiry when they are updated. A bounded backend refuses new ones once full.
+    """
+
+    @abstractmethod
+    def get(self, endpoint_key: str) -> Optional[int]:
+        """
+        Returns the last accepted nonce for ``endpoint_key``, or ``None`` if unknown or expired.
+        """
+
+    @abstractmethod
+    def update(
+        self, endpoint_key: str, nonce: int, expires_at: Optional[int] = None
+    ) -> bool:
+        """
+        Atomically stores ``nonce`` if it is larger than the stored nonce for ``endpoint_key``.
+
+        Args:
+            endpoint_key (str): The ``hotkey:uuid`` key of the dendrite.
+            nonce (int): The nonce of the request.
+            expires_at (int, optional): Time in ns after which the entry may be evicted. ``None`` never expires.
+
+        Returns:
+            bool: ``True`` if the nonce was stored, ``False`` if it is not larger than the stored one, or if the
+            store has no room left for a new entry.
+        """
+
+    @abstractmethod
+    def prune(self, now: Optional[int] = None) -> int:
+        """
+        Evicts expired entries.
+
+        Args:
+            now (int, optional): Current time in ns. Defaults to :func:`time.time_ns`.
+
+        Returns:
+            int: The number of evicted entries.
+        """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    def __contains__(self, endpoint_key: str) -> bool:
+        return self.get(endpoint_key) is not None
+
+
+class MemoryNonceStore(NonceStore):
+    """
+    In-process nonce store, bounded in both time and size.
+
+    Expiry times are kept in a heap, so expired entries are evicted in order of expiry on every update, whatever
+    order they were stored in. Live entries are never evicted, as their nonces could be replayed: once ``max_size``
+    live entries with an expiry are stored, new endpoint keys are refused until some of them expire.
+
+    Entries without expiry are bounded separately by ``max_legacy_size``, and refused likewise.
+
+    Args:
+        max_size (int): The maximum number of entries with an expiry kept.
+        max_legacy_size (int): The maximum number of entries without expiry kept.
+    """
+
+    def __init__(self, max_size: int = 100_000, max_legacy_size: int = 100_000):
+        self.max_size = max_size
+        self.max_legacy_size = max_legacy_size
+        self._entries: Dict[str, Tuple[int, Optional[int]]] = {}
+        self._legacy_entries = 0
+        # ``(expires_at, endpoint_key)`` of the entries with an expiry, including outdated ones of updated entries.
+        self._expiries: List[Tuple[int, str]] = []
+        self._lock = threading.Lock()
+
+    def get(self, endpoint_key: str) -> Optional[int]:
+        entry = self._entries.get(endpoint_key)
+        if entry is None:
+            return None
+        nonce, expires_at = entry
+        if expires_at is not None and expires_at < time.time_ns():
+            return None
+        return nonce
+
+    def update(
+        self, endpoint_key: str, nonce: int, expires_at: Optional[int] = None
+    ) -> bool:
+        """
+        Atomically stores ``nonce`` if it is larger than the stored nonce for ``endpoint_key``.
+
+        Returns:
+            bool: ``True`` if the nonce was stored, ``False`` if it is not larger than the stored one, or if
+            ``max_size`` entries with an expiry (``max_legacy_size`` without) are stored already.
+        """
+        with self._lock:
+            self._evict(time.time_ns())
+            stored = self.get(endpoint_key)
+            if stored is not None and nonce <= stored:
+                return False
+            entry = self._entries.get(endpoint_key)
+            if entry is not None and entry[1] is None:
+                # An entry without expiry keeps none.
+                expires_at = None
+            elif expires_at is None:
+                if self._legacy_entries >= self.max_legacy_size:
+                    return False
+                self._legacy_entries += 1
+            elif (
+                entry is None
+                and len(self._entries) - self._legacy_entries >= self.max_size
+            ):
+                return False
+            self._entries[endpoint_key] = (nonce, expires_at)
+            if expires_at is not None:
+                heapq.heappush(self._expiries, (expires_at, endpoint_key))
+            return True
+
+    def _evict(self, now: int) -> int:
+        expiries, entries = self._expiries, self._entries
+        evicted = 0
+        while expiries and expiries[0][0] < now:
+            expires_at, endpoint_key = heapq.heappop(expiries)
+            # Skip the outdated expiries of entries that were updated since.
+            entry = entries.get(endpoint_key)
+            if entry is not None and entry[1] == expires_at:
+                del entries[endpoint_key]
+                evicted += 1
+        if len(expiries) > 2 * len(entries) + 1024:
+            expiries[:] = [
+                (expires_at, endpoint_key)
+                for endpoint_key, (_, expires_at) in entries.items()
+                if expires_at is not None
+            ]
+            heapq.heapify(expiries)
+        return evicted
+
+    def prune(self, now: Optional[int] = None) -> int:
+        with self._lock:
+            return self._evict(now or time.time_ns())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteNonceStore(NonceStore):
+    """
+    Nonce store backed by a SQLite database file, shared by every process that opens the same path.
+
+    This lets several axon worker processes serving the same port enforce replay protection together: the
+    compare-and-set of :func:`update` is a single SQL statement, so a replayed request is only accepted by one
+    of them. Expired entries are deleted every ``prune_interval`` updates. Entries without expiry are kept in the
+    file without bound, like the in-memory dictionary the axon used to keep.
+
+    Args:
+        path (str): Path of the database file, created if it does not exist.
+        prune_interval (int): Number of updates between two deletions of expired entries.
+    """
+
+    def __init__(self, path: str, prune_interval: int = 1000):
+        self.path = os.path.expanduser(path)
+        self.prune_interval = prune_interval
+        self._updates = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, timeout=10.0, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS nonces "
+            "(endpoint_key TEXT PRIMARY KEY, nonce INTEGER NOT NULL, expires_at INTEGER)"
+        )
+
+    def get(self, endpoint_key: str) -> Optional[int]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT nonce FROM nonces WHERE endpoint_key = ? "
+                "AND (expires_at IS NULL OR expires_at >= ?)",
+                (endpoint_key, time.time_ns()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def update(
+        self, endpoint_key: str, nonce: int, expires_at: Optional[int] = None
+    ) -> bool:
+        with self._lock:
+            # Expired rows are overwritten regardless of their nonce, like a missing entry.
+            cursor = self._connection.execute(
+                "INSERT INTO nonces (endpoint_key, nonce, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(endpoint_key) DO UPDATE SET nonce = excluded.nonce, "
+                "expires_at = CASE WHEN nonces.expires_at IS NULL THEN NULL ELSE excluded.expires_at END "
+                "WHERE excluded.nonce > nonces.nonce "
+                "OR (nonces.expires_at IS NOT NULL AND nonces.expires_at < ?)",
+                (endpoint_key, nonce, expires_at, time.time_ns()),
+            )
+            stored = cursor.rowcount == 1
+            self._updates += 1
+            should_prune = self._updates % self.prune_interval == 0
+        if should_prune:
+            self.prune()
+        return stored
+
+    def prune(self, now: Optional[int] = None) -> int:
+        now = now or time.time_ns()
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM nonces WHERE expires_at IS NOT NULL AND expires_at < ?",
+                (now,),
+            )
+        return cursor.rowcount
+
+    def close(self):
+        """Closes the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM nonces").fetchone()[0]
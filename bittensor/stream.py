@@ -1,12 +1,207 @@
+import asyncio
+import enum
+import json
+import struct
 from aiohttp import ClientResponse
 import bittensor
 
 from starlette.responses import StreamingResponse as _StreamingResponse
 from starlette.types import Send, Receive, Scope
-from typing import Callable, Awaitable
-from pydantic import ConfigDict, BaseModel
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    Optional,
+    Tuple,
+    Union,
+)
+from pydantic import ConfigDict, BaseModel, PrivateAttr
 from abc import ABC, abstractmethod
 
+# Content type of the responses of :class:`FramedStreamingSynapse`.
+FRAMED_STREAM_CONTENT_TYPE = "application/x-bittensor-frames"
+
+
+class FrameType(enum.IntEnum):
+    """
+    The type of the payload of a frame of a :class:`FramedStreamingSynapse` response.
+    """
+
+    BYTES = 0
+    TEXT = 1
+    # The JSON encoded fields of the synapse once the stream is over, see :func:`FramedStreamWriter.close`.
+    SYNAPSE = 2
+
+
+# A frame is its type and payload length, followed by the payload.
+FRAME_HEADER = struct.Struct(">BI")
+
+
+def encode_frame(kind: FrameType, payload: bytes) -> bytes:
+    """
+    Encodes a frame of a :class:`FramedStreamingSynapse` response.
+
+    Args:
+        kind (FrameType): The type of the payload.
+        payload (bytes): The payload.
+
+    Returns:
+        bytes: The frame header followed by the payload.
+    """
+    return FRAME_HEADER.pack(kind, len(payload)) + payload
+
+
+async def iter_frames(
+    response: ClientResponse, max_frame_size: int = 16 * 1024 * 1024
+) -> AsyncIterator[Tuple[FrameType, bytes]]:
+    """
+    Yields the frames of a framed streaming response as they arrive.
+
+    The body is read in the chunks received from the network, which usually hold several coalesced frames, and
+    every complete frame of a chunk is yielded without waiting for the next one.
+
+    Args:
+        response (aiohttp.ClientResponse): The streaming response.
+        max_frame_size (int): The largest accepted payload, in bytes.
+
+    Yields:
+        Tuple[FrameType, bytes]: The type and payload of each frame.
+
+    Raises:
+        ValueError: If a frame is larger than ``max_frame_size``, or the stream ends within a frame.
+    """
+    buffer = bytearray()
+    async for chunk in response.content.iter_any():
+        buffer += chunk
+        offset = 0
+        while len(buffer) - offset >= FRAME_HEADER.size:
+            kind, length = FRAME_HEADER.unpack_from(buffer, offset)
+            if length > max_frame_size:
+                raise ValueError(
+                    f"Frame of {length} B is larger than the maximum of {max_frame_size} B"
+                )
+            start = offset + FRAME_HEADER.size
+            if start + length > len(buffer):
+                break
+            offset = start + length
+            yield FrameType(kind), bytes(buffer[start:offset])
+        del buffer[:offset]
+    if buffer:
+        raise ValueError("The stream ended within a frame")
+
+
+class FramedStreamWriter:
+    """
+    Writes frames to the ASGI ``send`` callable of a streaming response, coalescing them into few body messages.
+
+    Frames are buffered, and the buffer is sent once it holds ``max_buffered_bytes``, or ``flush_interval``
+    seconds after the first buffered frame was written. A full buffer is sent before :func:`write` returns, so
+    a token streamer producing faster than the network accepts waits for it instead of buffering without bound.
+
+    Args:
+        send (Send): The ASGI send callable of the response.
+        flush_interval (float): The longest time in seconds a frame waits in the buffer, ``0`` sends every frame
+            immediately.
+        max_buffered_bytes (int): The size of the buffer, in bytes, from which it is sent.
+    """
+
+    def __init__(
+        self,
+        send: Send,
+        flush_interval: float = 0.05,
+        max_buffered_bytes: int = 64 * 1024,
+    ):
+        self.flush_interval = flush_interval
+        self.max_buffered_bytes = max_buffered_bytes
+        self.frames = 0
+        self.messages = 0
+        self._send = send
+        self._buffer = bytearray()
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    async def write(self, data: Union[bytes, str]):
+        """
+        Writes a ``bytes`` or ``str`` frame, received as such by :func:`FramedStreamingSynapse.process_streaming_response`.
+        """
+        if isinstance(data, str):
+            await self.write_frame(FrameType.TEXT, data.encode("utf-8"))
+        else:
+            await self.write_frame(FrameType.BYTES, bytes(data))
+
+    async def write_frame(self, kind: FrameType, payload: bytes):
+        """
+        Writes a frame of the given type.
+
+        Raises:
+            RuntimeError: If the writer is closed.
+        """
+        if self._closed:
+            raise RuntimeError("Cannot write to a closed stream")
+        self._buffer += encode_frame(kind, payload)
+        self.frames += 1
+        if len(self._buffer) >= self.max_buffered_bytes or self.flush_interval <= 0:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.flush_interval, self._flush_later
+            )
+
+    def _flush_later(self):
+        self._timer = None
+        self._flush_task = asyncio.ensure_future(self.flush())
+
+    async def flush(self):
+        """
+        Sends the buffered frames.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        async with self._lock:
+            if not self._buffer:
+                return
+            body = bytes(self._buffer)
+            self._buffer.clear()
+            await self._send(
+                {"type": "http.response.body", "body": body, "more_body": True}
+            )
+            self.messages += 1
+
+    async def close(self, synapse: Optional[bittensor.Synapse] = None):
+        """
+        Sends the buffered frames, preceded by the final state of ``synapse`` if given, and closes the writer.
+        """
+        if self._closed:
+            return
+        if synapse is not None:
+            await self.write_frame(
+                FrameType.SYNAPSE,
+                synapse.model_dump_json(exclude={"axon", "dendrite"}).encode(),
+            )
+        self._closed = True
+        if self._flush_task is not None:
+            await self._flush_task
+        await self.flush()
+
+    def abort(self):
+        """
+        Discards the buffered frames and closes the writer, cancelling a pending flush. Does nothing once the
+        writer is closed and flushed.
+        """
+        self._closed = True
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        self._buffer.clear()
+
 
 class BTStreamingResponseModel(BaseModel):
     """
@@ -49,16 +244,23 @@ class StreamingSynapse(bittensor.Synapse, ABC):
         provided by the subclass.
         """
 
-        def __init__(self, model: BTStreamingResponseModel, **kwargs):
+        def __init__(
+            self,
+            model: BTStreamingResponseModel,
+            content_type: str = "text/event-stream",
+            **kwargs,
+        ):
             """
             Initializes the BTStreamingResponse with the given token streamer model.
 
             Args:
                 model: A BTStreamingResponseModel instance containing the token streamer callable, which is responsible for generating the content of the response.
+                content_type: The content type of the response. Defaults to ``text/event-stream``.
                 **kwargs: Additional keyword arguments passed to the parent StreamingResponse class.
             """
             super().__init__(content=iter(()), **kwargs)
             self.token_streamer = model.token_streamer
+            self.content_type = content_type
 
         async def stream_response(self, send: Send):
             """
@@ -71,7 +273,7 @@ class StreamingSynapse(bittensor.Synapse, ABC):
             Args:
                 send: A callable to send the response, provided by the ASGI server.
             """
-            headers = [(b"content-type", b"text/event-stream")] + self.raw_headers
+            headers = [(b"content-type", self.content_type.encode())] + self.raw_headers
 
             await send(
                 {"type": "http.response.start", "status": 200, "headers": headers}
@@ -140,3 +342,114 @@ class StreamingSynapse(bittensor.Synapse, ABC):
         model_instance = BTStreamingResponseModel(token_streamer=token_streamer)
 
         return self.BTStreamingResponse(model_instance)
+
+
+class FramedStreamingSynapse(StreamingSynapse):
+    """
+    A :class:`StreamingSynapse` with a built-in framed streaming protocol, so that subclasses implement neither
+    :func:`process_streaming_response` nor :func:`extract_response_json`.
+
+    On the axon, the forward function returns :func:`create_framed_streaming_response`, whose token streamer writes
+    ``bytes`` or ``str`` chunks to a :class:`FramedStreamWriter`. Chunks are sent as length-prefixed frames,
+    coalesced into few body messages according to :attr:`flush_interval` and :attr:`max_buffered_bytes`, and
+    followed by the final fields of the synapse. On the dendrite, :func:`bittensor.dendrite.call_stream` yields every
+    chunk as it arrives, then the synapse updated with the final fields.
+
+    Example::
+
+        class Completion(bittensor.FramedStreamingSynapse):
+            prompt: str
+            completion: str = ""
+
+        async def forward(synapse: Completion) -> bittensor.StreamingSynapse.BTStreamingResponse:
+            async def token_streamer(writer: bittensor.FramedStreamWriter):
+                for token in generate(synapse.prompt):
+                    synapse.completion += token
+                    await writer.write(token)
+
+            return synapse.create_framed_streaming_response(token_streamer)
+    """
+
+    # Defaults of :func:`create_framed_streaming_response`, see :class:`FramedStreamWriter`.
+    flush_interval: ClassVar[float] = 0.05
+    max_buffered_bytes: ClassVar[int] = 64 * 1024
+    # The largest frame accepted by :func:`process_streaming_response`, in bytes.
+    max_frame_size: ClassVar[int] = 16 * 1024 * 1024
+
+    # The final fields sent by the axon, see :func:`extract_response_json`.
+    _final_fields: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    async def process_streaming_response(
+        self, response: ClientResponse
+    ) -> AsyncIterator[Union[bytes, str]]:
+        """
+        Yields the ``bytes`` and ``str`` chunks written by the axon as they arrive, and keeps the final fields of the
+        synapse for :func:`extract_response_json`.
+
+        Args:
+            response: The streaming response of the axon.
+        """
+        if response.content_type != FRAMED_STREAM_CONTENT_TYPE:
+            # Error responses of the axon are not streamed.
+            if response.content_type == "application/json":
+                self._final_fields = await response.json()
+            return
+        async for kind, payload in iter_frames(response, self.max_frame_size):
+            if kind == FrameType.SYNAPSE:
+                self._final_fields = json.loads(payload)
+            elif kind == FrameType.TEXT:
+                yield payload.decode("utf-8")
+            else:
+                yield payload
+
+    def extract_response_json(self, response: ClientResponse) -> dict:
+        """
+        Returns the final fields of the synapse sent by the axon, or the local ones if the stream did not include them.
+        For error responses, returns their JSON body.
+
+        The terminal information is not part of them, it is merged from the response headers.
+        """
+        if self._final_fields is not None:
+            return self._final_fields
+        return self.model_dump(exclude={"axon", "dendrite"})
+
+    def create_framed_streaming_response(
+        self,
+        token_streamer: Callable[[FramedStreamWriter], Awaitable[None]],
+        flush_interval: Optional[float] = None,
+        max_buffered_bytes: Optional[int] = None,
+    ) -> StreamingSynapse.BTStreamingResponse:
+        """
+        Creates a framed streaming response, to be returned by the forward function of the axon.
+
+        Args:
+            token_streamer: A callable writing the chunks of the response to the given :class:`FramedStreamWriter`.
+            flush_interval: The longest time in seconds a chunk is buffered. Defaults to :attr:`flush_interval`.
+            max_buffered_bytes: The buffered size from which chunks are sent. Defaults to :attr:`max_buffered_bytes`.
+
+        Returns:
+            BTStreamingResponse: The streaming response object, ready to be sent to the client.
+        """
+        flush_interval = (
+            self.flush_interval if flush_interval is None else flush_interval
+        )
+        max_buffered_bytes = (
+            self.max_buffered_bytes
+            if max_buffered_bytes is None
+            else max_buffered_bytes
+        )
+
+        async def framed_token_streamer(send: Send):
+            writer = FramedStreamWriter(send, flush_interval, max_buffered_bytes)
+            try:
+                await token_streamer(writer)
+                await writer.close(self)
+            finally:
+                # The token streamer or the client failed, no flush may run after the response.
+                writer.abort()
+
+        model_instance = BTStreamingResponseModel(token_streamer=framed_token_streamer)
+
+        return self.BTStreamingResponse(
+            model_instance, content_type=FRAMED_STREAM_CONTENT_TYPE
+        )
@@ -22,21 +22,24 @@ blockchain, facilitating a range of operations essential for the decentralized m
 """
 
 import argparse
+import contextlib
+import contextvars
 import copy
 import socket
+import threading
 import time
+from collections import OrderedDict
 from typing import List, Dict, Union, Optional, Tuple, TypedDict, Any
 
 import numpy as np
 import scalecodec
 from numpy.typing import NDArray
 from retry import retry
-from scalecodec.base import RuntimeConfiguration
 from scalecodec.exceptions import RemainingScaleBytesNotEmptyException
-from scalecodec.type_registry import load_type_registry_preset
 from scalecodec.types import GenericCall, ScaleType
 from substrateinterface.base import QueryMapResult, SubstrateInterface, ExtrinsicReceipt
 from substrateinterface.exceptions import SubstrateRequestException
+from substrateinterface.storage import StorageKey
 
 import bittensor
 from bittensor.btlogging import logging as _logger
@@ -50,10 +53,11 @@ from .chain_data import (
     SubnetHyperparameters,
     StakeInfo,
     NeuronInfoLite,
+    NeuronInfoLiteColumns,
     AxonInfo,
     ProposalVoteData,
     IPInfo,
-    custom_rpc_type_registry,
+    create_rpc_scale_object,
 )
 from .errors import IdentityError, NominationError, StakeError, TakeError
 from .extrinsics.commit_weights import (
@@ -94,6 +98,7 @@ from .extrinsics.set_weights import set_weights_extrinsic
 from .extrinsics.staking import add_stake_extrinsic, add_stake_multiple_extrinsic
 from .extrinsics.transfer import transfer_extrinsic
 from .extrinsics.unstaking import unstake_extrinsic, unstake_multiple_extrinsic
+from .subtensor_batch import SubtensorBatch
 from .types import AxonServeCallParams, PrometheusServeCallParams
 from .utils import (
     U16_NORMALIZED_FLOAT,
@@ -108,6 +113,11 @@ from .utils.subtensor import get_subtensor_errors
 
 KEY_NONCE: Dict[str, int] = {}
 
+# The blocks pinned by :func:`Subtensor.at_block` in the current thread or asyncio task, innermost last.
+_PINNED_BLOCKS: contextvars.ContextVar[Tuple[Tuple["Subtensor", int, str], ...]] = (
+    contextvars.ContextVar("pinned_blocks", default=())
+)
+
 
 class ParamWithTypes(TypedDict):
     name: str  # Name of the parameter.
@@ -167,6 +177,17 @@ class Subtensor:
     <https://bittensor.com/pdfs/academia/NeurIPS_DAO_Workshop_2022_3_3.pdf>`_. paper.
     """
 
+    #: Number of finalized block hashes kept by the block hash cache.
+    BLOCK_HASH_CACHE_SIZE = 1024
+    #: Number of storage keys read per ``state_queryStorageAt`` request by :func:`query_multi`.
+    QUERY_MULTI_CHUNK_SIZE = 256
+
+    _block_hashes: Optional["OrderedDict[int, str]"] = None
+    # Guards the block hash cache of all the instances, it is never held during a request.
+    _block_hashes_lock = threading.Lock()
+    _finalized_block: int = -1
+    _finalized_block_checked: float = 0.0
+
     def __init__(
         self,
         network: Optional[str] = None,
@@ -2788,9 +2809,7 @@ class Subtensor:
                 module="Registry",
                 storage_function="IdentityOf",
                 params=[key],
-                block_hash=(
-                    None if block is None else self.substrate.get_block_hash(block)
-                ),
+                block_hash=self._get_block_hash(block),
             )
 
         identity_info = make_substrate_call_with_retry()
@@ -2930,9 +2949,7 @@ class Subtensor:
                 module="SubtensorModule",
                 storage_function=name,
                 params=params,
-                block_hash=(
-                    None if block is None else self.substrate.get_block_hash(block)
-                ),
+                block_hash=self._get_block_hash(block),
             )
 
         return make_substrate_call_with_retry()
@@ -2967,9 +2984,7 @@ class Subtensor:
                 module="SubtensorModule",
                 storage_function=name,
                 params=params,
-                block_hash=(
-                    None if block is None else self.substrate.get_block_hash(block)
-                ),
+                block_hash=self._get_block_hash(block),
             )
 
         return make_substrate_call_with_retry()
@@ -3000,9 +3015,7 @@ class Subtensor:
             return self.substrate.get_constant(
                 module_name=module_name,
                 constant_name=constant_name,
-                block_hash=(
-                    None if block is None else self.substrate.get_block_hash(block)
-                ),
+                block_hash=self._get_block_hash(block),
             )
 
         return make_substrate_call_with_retry()
@@ -3039,13 +3052,59 @@ class Subtensor:
                 module=module,
                 storage_function=name,
                 params=params,
-                block_hash=(
-                    None if block is None else self.substrate.get_block_hash(block)
-                ),
+                block_hash=self._get_block_hash(block),
             )
 
         return make_substrate_call_with_retry()
 
+    # Queries many storage entries with params at one block.
+    def query_multi(
+        self,
+        queries: List[Tuple[str, str, list]],
+        block: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Reads many storage entries of any module at once. The storage keys are sent
+        ``QUERY_MULTI_CHUNK_SIZE`` at a time in ``state_queryStorageAt`` requests, so reading N entries takes a
+        handful of round trips instead of N.
+
+        Args:
+            queries (List[Tuple[str, str, list]]): The ``(module, name, params)`` of the storage entries to read.
+            block (Optional[int]): The blockchain block number at which to perform the queries. All the entries
+                are read at the same block, the chain head if not specified.
+
+        Returns:
+            List[Any]: The values of the storage entries, in the order of ``queries``.
+
+        See :func:`batch` for collecting the queries of a command and decoding their results.
+        """
+        if not queries:
+            return []
+        block_hash = self._get_block_hash(block) or self.substrate.get_chain_head()
+        # Build the keys from the metadata at once, `create_storage_key` reloads the runtime for every key.
+        self.substrate.init_runtime(block_hash=block_hash)
+        storage_keys = [
+            StorageKey.create_from_storage_function(
+                module,
+                name,
+                params,
+                runtime_config=self.substrate.runtime_config,
+                metadata=self.substrate.metadata,
+            )
+            for module, name, params in queries
+        ]
+
+        @retry(delay=1, tries=3, backoff=2, max_delay=4, logger=_logger)
+        def make_substrate_call_with_retry(chunk: List[StorageKey]) -> list:
+            return self.substrate.query_multi(chunk, block_hash=block_hash)
+
+        values: Dict[str, Any] = {}
+        for start in range(0, len(storage_keys), self.QUERY_MULTI_CHUNK_SIZE):
+            chunk = storage_keys[start : start + self.QUERY_MULTI_CHUNK_SIZE]
+            for storage_key, result in make_substrate_call_with_retry(chunk):
+                values[storage_key.to_hex()] = getattr(result, "value", None)
+        return [values.get(storage_key.to_hex()) for storage_key in storage_keys]
+
     # Queries any module map storage with params and block.
     def query_map(
         self,
@@ -3078,9 +3137,7 @@ class Subtensor:
                 module=module,
                 storage_function=name,
                 params=params,
-                block_hash=(
-                    None if block is None else self.substrate.get_block_hash(block)
-                ),
+                block_hash=self._get_block_hash(block),
             )
 
         return make_substrate_call_with_retry()
@@ -3109,7 +3166,7 @@ class Subtensor:
 
         @retry(delay=1, tries=3, backoff=2, max_delay=4, logger=_logger)
         def make_substrate_call_with_retry() -> Dict[Any, Any]:
-            block_hash = None if block is None else self.substrate.get_block_hash(block)
+            block_hash = self._get_block_hash(block)
 
             return self.substrate.rpc_request(
                 method="state_call",
@@ -3163,11 +3220,7 @@ class Subtensor:
 
         as_scale_bytes = scalecodec.ScaleBytes(json_result["result"])  # type: ignore
 
-        rpc_runtime_config = RuntimeConfiguration()
-        rpc_runtime_config.update_type_registry(load_type_registry_preset("legacy"))
-        rpc_runtime_config.update_type_registry(custom_rpc_type_registry)
-
-        obj = rpc_runtime_config.create_scale_object(return_type, as_scale_bytes)
+        obj = create_rpc_scale_object(return_type, as_scale_bytes)
         if obj.data.to_hex() == "0x0400":  # RPC returned None result
             return None
 
@@ -3679,6 +3732,26 @@ class Subtensor:
         call = self._get_hyperparameter(param_name="LastUpdate", netuid=netuid)
         return None if call is None else self.get_current_block() - int(call[uid])
 
+    def blocks_since_last_step(
+        self, netuid: int, block: Optional[int] = None
+    ) -> Optional[int]:
+        """
+        Returns the number of blocks since the last epoch of the subnetwork, after which the consensus values, e.g.
+        ranks, incentives and bonds, of all its neurons are updated.
+
+        Args:
+            netuid (int): The unique identifier of the subnetwork.
+            block (Optional[int], optional): The block number to retrieve the parameter from. If ``None``, the latest
+                block is used. Default is ``None``.
+
+        Returns:
+            Optional[int]: The number of blocks since the last epoch, or ``None`` if the subnetwork does not exist.
+        """
+        call = self._get_hyperparameter(
+            param_name="BlocksSinceLastStep", netuid=netuid, block=block
+        )
+        return None if call is None else int(call)
+
     def weights_rate_limit(self, netuid: int) -> Optional[int]:
         """
         Returns network WeightsSetRateLimit hyperparameter.
@@ -4167,7 +4240,7 @@ class Subtensor:
 
         @retry(delay=1, tries=3, backoff=2, max_delay=4, logger=_logger)
         def make_substrate_call_with_retry():
-            block_hash = None if block is None else self.substrate.get_block_hash(block)
+            block_hash = self._get_block_hash(block)
 
             return self.substrate.rpc_request(
                 method="subnetInfo_getSubnetsInfo",  # custom rpc method
@@ -4201,7 +4274,7 @@ class Subtensor:
 
         @retry(delay=1, tries=3, backoff=2, max_delay=4, logger=_logger)
         def make_substrate_call_with_retry():
-            block_hash = None if block is None else self.substrate.get_block_hash(block)
+            block_hash = self._get_block_hash(block)
 
             return self.substrate.rpc_request(
                 method="subnetInfo_getSubnetInfo",  # custom rpc method
@@ -4359,7 +4432,7 @@ class Subtensor:
 
         @retry(delay=1, tries=3, backoff=2, max_delay=4, logger=_logger)
         def make_substrate_call_with_retry(encoded_hotkey_: List[int]):
-            block_hash = None if block is None else self.substrate.get_block_hash(block)
+            block_hash = self._get_block_hash(block)
 
             return self.substrate.rpc_request(
                 method="delegateInfo_getDelegate",  # custom rpc method
@@ -4396,7 +4469,7 @@ class Subtensor:
 
         @retry(delay=1, tries=3, backoff=2, max_delay=4, logger=_logger)
         def make_substrate_call_with_retry():
-            block_hash = None if block is None else self.substrate.get_block_hash(block)
+            block_hash = self._get_block_hash(block)
 
             return self.substrate.rpc_request(
                 method="delegateInfo_getDelegatesLite",  # custom rpc method
@@ -4428,7 +4501,7 @@ class Subtensor:
 
         @retry(delay=1, tries=3, backoff=2, max_delay=4, logger=_logger)
         def make_substrate_call_with_retry():
-            block_hash = None if block is None else self.substrate.get_block_hash(block)
+            block_hash = self._get_block_hash(block)
 
             return self.substrate.rpc_request(
                 method="delegateInfo_getDelegates",  # custom rpc method
@@ -4463,7 +4536,7 @@ class Subtensor:
 
         @retry(delay=1, tries=3, backoff=2, max_delay=4, logger=_logger)
         def make_substrate_call_with_retry(encoded_coldkey_: List[int]):
-            block_hash = None if block is None else self.substrate.get_block_hash(block)
+            block_hash = self._get_block_hash(block)
 
             return self.substrate.rpc_request(
                 method="delegateInfo_getDelegated",
@@ -4835,7 +4908,7 @@ class Subtensor:
 
         @retry(delay=1, tries=3, backoff=2, max_delay=4, logger=_logger)
         def make_substrate_call_with_retry():
-            block_hash = None if block is None else self.substrate.get_block_hash(block)
+            block_hash = self._get_block_hash(block)
             params = [netuid, uid]
             if block_hash:
                 params = params + [block_hash]
@@ -4942,6 +5015,38 @@ class Subtensor:
         This function offers a quick overview of the neuron population within a subnet, facilitating
         efficient analysis of the network's decentralized structure and neuron dynamics.
         """
+        bytes_result = self._neurons_lite_bytes(netuid, block)
+        if bytes_result is None:
+            return []
+
+        return NeuronInfoLite.list_from_vec_u8(bytes_result)  # type: ignore
+
+    def neurons_lite_columns(
+        self, netuid: int, block: Optional[int] = None
+    ) -> NeuronInfoLiteColumns:
+        """
+        Retrieves the neurons of :func:`neurons_lite` in columnar form, one NumPy array per attribute.
+
+        The SCALE encoded neurons are parsed straight into the arrays, which is much faster than creating the
+        :class:`NeuronInfoLite` of every neuron on large subnets. The metagraph is synced from these columns.
+
+        Args:
+            netuid (int): The unique identifier of the subnet.
+            block (Optional[int], optional): The blockchain block number for the query.
+
+        Returns:
+            NeuronInfoLiteColumns: The columns of the neurons of the subnet.
+        """
+        bytes_result = self._neurons_lite_bytes(netuid, block)
+        if bytes_result is None:
+            return NeuronInfoLiteColumns.from_neurons([])
+
+        return NeuronInfoLiteColumns.from_vec_u8(bytes_result)
+
+    def _neurons_lite_bytes(
+        self, netuid: int, block: Optional[int] = None
+    ) -> Optional[bytes]:
+        """Returns the SCALE encoded result of the ``get_neurons_lite`` runtime API call, or ``None``."""
         hex_bytes_result = self.query_runtime_api(
             runtime_api="NeuronInfoRuntimeApi",
             method="get_neurons_lite",
@@ -4950,14 +5055,11 @@ class Subtensor:
         )
 
         if hex_bytes_result is None:
-            return []
+            return None
 
         if hex_bytes_result.startswith("0x"):
-            bytes_result = bytes.fromhex(hex_bytes_result[2:])
-        else:
-            bytes_result = bytes.fromhex(hex_bytes_result)
-
-        return NeuronInfoLite.list_from_vec_u8(bytes_result)  # type: ignore
+            return bytes.fromhex(hex_bytes_result[2:])
+        return bytes.fromhex(hex_bytes_result)
 
     def metagraph(
         self,
@@ -5427,9 +5529,7 @@ class Subtensor:
                     module="System",
                     storage_function="Account",
                     params=[address],
-                    block_hash=(
-                        None if block is None else self.substrate.get_block_hash(block)
-                    ),
+                    block_hash=self._get_block_hash(block),
                 )
 
             result = make_substrate_call_with_retry()
@@ -5450,6 +5550,7 @@ class Subtensor:
 
         Knowing the current block number is essential for querying real-time data and performing time-sensitive
         operations on the blockchain. It serves as a reference point for network activities and data synchronization.
+        It is not affected by :func:`at_block`, extrinsics rely on it to build their mortal era.
         """
 
         @retry(delay=1, tries=3, backoff=2, max_delay=4, logger=_logger)
@@ -5478,9 +5579,7 @@ class Subtensor:
             return self.substrate.query_map(
                 module="System",
                 storage_function="Account",
-                block_hash=(
-                    None if block is None else self.substrate.get_block_hash(block)
-                ),
+                block_hash=self._get_block_hash(block),
             )
 
         result = make_substrate_call_with_retry()
@@ -5517,7 +5616,7 @@ class Subtensor:
         )  # type: ignore
         return neuron
 
-    def get_block_hash(self, block_id: int) -> str:
+    def get_block_hash(self, block_id: int) -> Optional[str]:
         """
         Retrieves the hash of a specific block on the Bittensor blockchain. The block hash is a unique
         identifier representing the cryptographic hash of the block's content, ensuring its integrity and
@@ -5527,13 +5626,118 @@ class Subtensor:
             block_id (int): The block number for which the hash is to be retrieved.
 
         Returns:
-            str: The cryptographic hash of the specified block.
+            Optional[str]: The cryptographic hash of the specified block, or ``None`` if the chain has no such block.
 
         The block hash is a fundamental aspect of blockchain technology, providing a secure reference to
         each block's data. It is crucial for verifying transactions, ensuring data consistency, and
         maintaining the trustworthiness of the blockchain.
+
+        The hashes of finalized blocks never change, so the last ``BLOCK_HASH_CACHE_SIZE`` of them are cached.
+        """
+        return self._get_block_hash(block_id)
+
+    def _get_block_hash(self, block: Optional[int]) -> Optional[str]:
+        """
+        Resolves the hash of ``block`` for a query, reusing the cached hashes of finalized blocks.
+
+        Args:
+            block (Optional[int]): The block number, or ``None`` for the block pinned by :func:`at_block`.
+
+        Returns:
+            Optional[str]: The block hash, or ``None`` to query the chain head.
+        """
+        if block is None:
+            return self._pinned_block_hash()
+        with self._block_hashes_lock:
+            if self._block_hashes is None:
+                self._block_hashes = OrderedDict()
+            block_hash = self._block_hashes.get(block)
+            if block_hash is not None:
+                self._block_hashes.move_to_end(block)
+                return block_hash
+
+        block_hash = self.substrate.get_block_hash(block)
+        # Blocks after the finalized head can still be reorganized away, so their hashes are not cached.
+        if block_hash is not None and self._is_finalized(block):
+            with self._block_hashes_lock:
+                self._block_hashes[block] = block_hash
+                while len(self._block_hashes) > self.BLOCK_HASH_CACHE_SIZE:
+                    self._block_hashes.popitem(last=False)
+        return block_hash
+
+    def _pinned_block_hash(self) -> Optional[str]:
+        """Returns the hash of the block pinned by :func:`at_block` in the current thread or task, if any."""
+        for subtensor, _, block_hash in reversed(_PINNED_BLOCKS.get()):
+            if subtensor is self:
+                return block_hash
+        return None
+
+    def _is_finalized(self, block: int) -> bool:
+        """Returns ``True`` if ``block`` is finalized, fetching the finalized head at most once per block time."""
+        if (
+            block > self._finalized_block
+            and time.time() - self._finalized_block_checked >= bittensor.__blocktime__
+        ):
+            self._finalized_block_checked = time.time()
+            self._finalized_block = self.substrate.get_block_number(
+                self.substrate.get_chain_finalised_head()
+            )
+        return block <= self._finalized_block
+
+    @contextlib.contextmanager
+    def at_block(self, block: int):
+        """
+        Pins the queries made inside the context to ``block``.
+
+        The hash of ``block`` is resolved once, and every query made without an explicit ``block`` reads the chain
+        state at that hash instead of the chain head. The pin only applies to the current thread or asyncio task, and
+        to the tasks it creates inside the context. Contexts can be nested.
+
+        :func:`get_current_block` and :attr:`block` still return the chain head, which extrinsics rely on. Pass the
+        block explicitly to the functions recording it, e.g. ``metagraph.sync(block=block, subtensor=subtensor)``.
+
+        Args:
+            block (int): The block number to pin.
+
+        Returns:
+            Subtensor: This subtensor, for use in a ``with`` statement.
+
+        Raises:
+            ValueError: If the chain has no block ``block``.
+
+        Example::
+
+            with subtensor.at_block(3_000_000):
+                balance = subtensor.get_balance(coldkey_ss58)
+                stake = subtensor.get_total_stake_for_coldkey(coldkey_ss58)
+        """
+        block_hash = self._get_block_hash(block)
+        if block_hash is None:
+            raise ValueError(f"Block {block} does not exist on the chain")
+        token = _PINNED_BLOCKS.set(_PINNED_BLOCKS.get() + ((self, block, block_hash),))
+        try:
+            yield self
+        finally:
+            _PINNED_BLOCKS.reset(token)
+
+    def batch(self, block: Optional[int] = None) -> "SubtensorBatch":
+        """
+        Returns a :class:`SubtensorBatch` collecting storage queries, which are read together with
+        :func:`query_multi` when its ``with`` block exits.
+
+        Args:
+            block (Optional[int]): The blockchain block number at which to perform the queries.
+
+        Returns:
+            SubtensorBatch: The batch of queries.
+
+        Example::
+
+            with subtensor.batch() as batch:
+                stakes = [batch.get_total_stake_for_hotkey(hotkey) for hotkey in hotkeys]
+            stakes = [stake.value for stake in stakes]
         """
-        return self.substrate.get_block_hash(block_id=block_id)
+        return SubtensorBatch(self, block=block)
 
     def get_error_info_by_index(self, error_index: int) -> Tuple[str, str]:
         """
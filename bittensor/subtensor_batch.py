@@ -0,0 +1,167 @@
+"""Batched storage queries against the Bittensor blockchain."""
+
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+
+from .utils.balance import Balance
+
+if TYPE_CHECKING:
+    import bittensor
+
+
+class BatchResult:
+    """
+    The pending result of a query added to a :class:`SubtensorBatch`.
+
+    Its ``value`` is available once the batch has been executed.
+    """
+
+    _PENDING = object()
+
+    def __init__(self, decode: Callable[[Any], Any]):
+        self._decode = decode
+        self._value = BatchResult._PENDING
+
+    @property
+    def done(self) -> bool:
+        """``True`` once the batch holding the query has been executed."""
+        return self._value is not BatchResult._PENDING
+
+    @property
+    def value(self) -> Any:
+        """
+        The decoded result of the query.
+
+        Raises:
+            RuntimeError: If the batch holding the query has not been executed yet.
+        """
+        if not self.done:
+            raise RuntimeError("The batch holding this query has not been executed")
+        return self._value
+
+    def _set(self, result: Any):
+        self._value = self._decode(result)
+
+    def __repr__(self) -> str:
+        return f"BatchResult({self._value if self.done else 'pending'})"
+
+
+class SubtensorBatch:
+    """
+    Collects storage queries and reads them with :func:`Subtensor.query_multi`, which fetches up to
+    ``Subtensor.QUERY_MULTI_CHUNK_SIZE`` storage keys per ``state_queryStorageAt`` request, instead of one
+    websocket round trip per query.
+
+    Queries return a :class:`BatchResult` immediately. The batch is executed when the ``with`` block exits
+    without an exception, or by calling :func:`execute`. All the queries of an execution read the same block.
+
+    Args:
+        subtensor (bittensor.subtensor): The subtensor to query.
+        block (Optional[int]): The block to read, defaults to the chain head (or the block pinned by
+            :func:`Subtensor.at_block`).
+
+    Example::
+
+        with subtensor.batch() as batch:
+            free = [batch.get_balance(coldkey) for coldkey in coldkeys]
+            staked = [batch.get_total_stake_for_coldkey(coldkey) for coldkey in coldkeys]
+        total_free = sum(result.value for result in free)
+    """
+
+    def __init__(self, subtensor: "bittensor.subtensor", block: Optional[int] = None):
+        self.subtensor = subtensor
+        self.block = block
+        self._queries: List[Tuple[str, str, list]] = []
+        self._results: List[BatchResult] = []
+
+    def query_module(
+        self,
+        module: str,
+        name: str,
+        params: Optional[list] = None,
+        decode: Optional[Callable[[Any], Any]] = None,
+    ) -> BatchResult:
+        """
+        Adds a storage query to the batch.
+
+        Args:
+            module (str): The name of the module holding the storage.
+            name (str): The name of the storage function.
+            params (Optional[list]): The keys of the storage entry.
+            decode (Optional[Callable[[Any], Any]]): Converts the value of the storage entry into the result.
+                Defaults to the plain value.
+
+        Returns:
+            BatchResult: The pending result of the query.
+        """
+        result = BatchResult(decode or (lambda value: value))
+        self._queries.append((module, name, list(params or [])))
+        self._results.append(result)
+        return result
+
+    def query_subtensor(
+        self,
+        name: str,
+        params: Optional[list] = None,
+        decode: Optional[Callable[[Any], Any]] = None,
+    ) -> BatchResult:
+        """Adds a query of the ``SubtensorModule`` storage to the batch, see :func:`query_module`."""
+        return self.query_module("SubtensorModule", name, params, decode)
+
+    def get_balance(self, address: str) -> BatchResult:
+        """Batched :func:`Subtensor.get_balance`."""
+        return self.query_module(
+            "System",
+            "Account",
+            [address],
+            lambda value: Balance(value["data"]["free"]),
+        )
+
+    def get_total_stake_for_hotkey(self, ss58_address: str) -> BatchResult:
+        """Batched :func:`Subtensor.get_total_stake_for_hotkey`."""
+        return self.query_subtensor("TotalHotkeyStake", [ss58_address], _to_balance)
+
+    def get_total_stake_for_coldkey(self, ss58_address: str) -> BatchResult:
+        """Batched :func:`Subtensor.get_total_stake_for_coldkey`."""
+        return self.query_subtensor("TotalColdkeyStake", [ss58_address], _to_balance)
+
+    def execute(self):
+        """Reads the pending queries of the batch and sets their results."""
+        if not self._queries:
+            return
+        queries, results = self._queries, self._results
+        self._queries, self._results = [], []
+        for result, value in zip(
+            results, self.subtensor.query_multi(queries, block=self.block)
+        ):
+            result._set(value)
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def __enter__(self) -> "SubtensorBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.execute()
+
+
+def _to_balance(value: Optional[int]) -> Optional[Balance]:
+    return None if value is None else Balance.from_rao(value)
@@ -18,10 +18,12 @@
 
 
 import base64
+import dataclasses
 import json
 import sys
 import warnings
 
+import msgpack
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -29,8 +31,14 @@ from pydantic import (
     field_validator,
     model_validator,
 )
+from pydantic_core import to_jsonable_python
 import bittensor
-from typing import Optional, Any, Dict, ClassVar, Tuple
+from bittensor.tensor import binary_transport
+from typing import Optional, Any, Dict, ClassVar, Tuple, Type
+
+# Content types of synapse bodies, see :func:`Synapse.to_msgpack` and :func:`Synapse.from_body_and_headers`.
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
 
 
 def get_size(obj, seen=None) -> int:
@@ -258,6 +266,92 @@ class TerminalInfo(BaseModel):
     _extract_status_code = field_validator("status_code", mode="before")(cast_int)
 
 
+class SynapseHeaderCodec:
+    """
+    Precompiled header encoding plan for a single :class:`Synapse` subclass.
+
+    Building headers used to regenerate the model JSON schema once per field on every call. The codec resolves
+    everything that only depends on the class (required fields, header key names, encoded placeholder values)
+    once, so that :func:`Synapse.to_headers` only does per-field string work on each request.
+
+    The codec is built lazily by :func:`Synapse.header_codec` and cached on the subclass itself.
+
+    Args:
+        synapse_cls (Type[Synapse]): The Synapse subclass to compile the codec for.
+    """
+
+    # Fields always sent as plain headers, never as ``bt_header_input_obj_*``.
+    RESERVED_FIELDS: ClassVar[Tuple[str, ...]] = ("name", "timeout")
+
+    # ``(field, header key)`` pairs for the terminal information headers.
+    AXON_HEADER_KEYS: ClassVar[Tuple[Tuple[str, str], ...]] = tuple(
+        (field, f"bt_header_axon_{field}") for field in TerminalInfo.model_fields
+    )
+    DENDRITE_HEADER_KEYS: ClassVar[Tuple[Tuple[str, str], ...]] = tuple(
+        (field, f"bt_header_dendrite_{field}") for field in TerminalInfo.model_fields
+    )
+
+    def __init__(self, synapse_cls: Type["Synapse"]):
+        self.synapse_cls = synapse_cls
+
+        # Required fields, in definition order, along with their precomputed header key.
+        self.input_obj_keys: Tuple[Tuple[str, str], ...] = tuple(
+            (field, f"bt_header_input_obj_{field}")
+            for field, info in synapse_cls.model_fields.items()
+            if info.is_required() and field not in self.RESERVED_FIELDS
+        )
+        self.required_fields: Tuple[str, ...] = tuple(
+            field for field, _ in self.input_obj_keys
+        )
+
+        # Encoded empty (dummy) values keyed by ``(field, value type)``.
+        self._encoded_defaults: Dict[Tuple[str, type], str] = {}
+
+    def encoded_default(self, field: str, value: Any) -> str:
+        """
+        Returns the base64 encoded JSON of an empty instance of ``type(value)``.
+
+        Only the type is sent so that the axon can pass pydantic validation on headers alone. The encoding is
+        memoized per ``(field, type)`` pair, as it does not depend on the value itself.
+
+        Raises:
+            ValueError: If an empty instance of the value type is not JSON serializable.
+        """
+        # Nested models and dataclasses are represented as dicts in the serialized synapse.
+        value_type = (
+            dict
+            if isinstance(value, BaseModel) or dataclasses.is_dataclass(value)
+            else value.__class__
+        )
+        key = (field, value_type)
+        encoded_value = self._encoded_defaults.get(key)
+        if encoded_value is None:
+            try:
+                # create an empty (dummy) instance of type(value) to pass pydantic validation on the axon side
+                serialized_value = json.dumps(value_type())
+            except TypeError as e:
+                raise ValueError(
+                    f"Error serializing {field} with value {value}. Objects must be json serializable."
+                ) from e
+            encoded_value = base64.b64encode(serialized_value.encode()).decode("utf-8")
+            self._encoded_defaults[key] = encoded_value
+        return encoded_value
+
+    @classmethod
+    def terminal_headers(
+        cls, terminal: TerminalInfo, header_keys: Tuple[Tuple[str, str], ...]
+    ) -> Dict[str, str]:
+        """
+        Encodes the non ``None`` values of a :class:`TerminalInfo` into headers using precomputed keys.
+        """
+        values = terminal.__dict__
+        return {
+            key: str(values[field])
+            for field, key in header_keys
+            if values.get(field) is not None
+        }
+
+
 class Synapse(BaseModel):
     """
     Represents a Synapse in the Bittensor network, serving as a communication schema between neurons (nodes).
@@ -483,6 +577,9 @@ class Synapse(BaseModel):
 
     required_hash_fields: ClassVar[Tuple[str, ...]] = ()
 
+    # Set on each subclass by :func:`header_codec`.
+    _bt_header_codec: ClassVar[Optional[SynapseHeaderCodec]] = None
+
     _extract_total_size = field_validator("total_size", mode="before")(cast_int)
 
     _extract_header_size = field_validator("header_size", mode="before")(cast_int)
@@ -587,6 +684,20 @@ class Synapse(BaseModel):
         schema = self.__class__.model_json_schema()
         return schema.get("required", [])
 
+    @classmethod
+    def header_codec(cls) -> SynapseHeaderCodec:
+        """
+        Returns the :class:`SynapseHeaderCodec` of this Synapse subclass, compiling it on first use.
+
+        The codec is stored on the class itself (not inherited by subclasses), so the compilation cost is
+        paid once per Synapse type rather than on every request.
+        """
+        codec = cls.__dict__.get("_bt_header_codec")
+        if codec is None:
+            codec = SynapseHeaderCodec(cls)
+            cls._bt_header_codec = codec
+        return codec
+
     def to_headers(self) -> dict:
         """
         Converts the state of a Synapse instance into a dictionary of HTTP headers.
@@ -602,6 +713,9 @@ class Synapse(BaseModel):
         3. Encoding: Non-optional complex objects are serialized and encoded in base64, making them safe for HTTP transport.
         4. Size Metrics: The method calculates and adds the size of headers and the total object size, providing valuable information for network bandwidth management.
 
+        The header key names, required fields and encoded placeholder values are taken from the class'
+        :func:`header_codec`, so no schema generation happens per call.
+
         Example Usage::
 
             synapse = Synapse(name="ExampleSynapse", timeout=30)
@@ -611,51 +725,26 @@ class Synapse(BaseModel):
         Returns:
             dict: A dictionary containing key-value pairs representing the Synapse's properties, suitable for HTTP communication.
         """
+        codec = self.header_codec()
+
         # Initializing headers with 'name' and 'timeout'
         headers = {"name": self.name, "timeout": str(self.timeout)}
 
         # Adding headers for 'axon' and 'dendrite' if they are not None
         if self.axon:
-            headers.update(
-                {
-                    f"bt_header_axon_{k}": str(v)
-                    for k, v in self.axon.model_dump().items()
-                    if v is not None
-                }
-            )
+            headers.update(codec.terminal_headers(self.axon, codec.AXON_HEADER_KEYS))
         if self.dendrite:
             headers.update(
-                {
-                    f"bt_header_dendrite_{k}": str(v)
-                    for k, v in self.dendrite.model_dump().items()
-                    if v is not None
-                }
+                codec.terminal_headers(self.dendrite, codec.DENDRITE_HEADER_KEYS)
             )
 
-        # Getting the fields of the instance
-        instance_fields = self.model_dump()
-
-        # Iterating over the fields of the instance
-        for field, value in instance_fields.items():
-            # If the object is not optional, serializing it, encoding it, and adding it to the headers
-            required = self.get_required_fields()
-
-            # Skipping the field if it's already in the headers or its value is None
-            if field in headers or value is None:
+        # Required objects are sent as an encoded empty instance of their type, skipping None values
+        instance_fields = self.__dict__
+        for field, key in codec.input_obj_keys:
+            value = instance_fields.get(field)
+            if value is None:
                 continue
-
-            elif required and field in required:
-                try:
-                    # create an empty (dummy) instance of type(value) to pass pydantic validation on the axon side
-                    serialized_value = json.dumps(value.__class__.__call__())
-                    encoded_value = base64.b64encode(serialized_value.encode()).decode(
-                        "utf-8"
-                    )
-                    headers[f"bt_header_input_obj_{field}"] = encoded_value
-                except TypeError as e:
-                    raise ValueError(
-                        f"Error serializing {field} with value {value}. Objects must be json serializable."
-                    ) from e
+            headers[key] = codec.encoded_default(field, value)
 
         # Adding the size of the headers and the total size to the headers
         headers["header_size"] = str(sys.getsizeof(headers))
@@ -715,7 +804,9 @@ class Synapse(BaseModel):
             required_hash_fields = self.__class__.required_hash_fields
 
         if required_hash_fields:
-            instance_fields = instance_fields or self.model_dump()
+            instance_fields = instance_fields or self.model_dump(
+                include=set(required_hash_fields)
+            )
             for field in required_hash_fields:
                 hashes.append(bittensor.utils.hash(str(instance_fields[field])))
 
@@ -846,3 +937,86 @@ class Synapse(BaseModel):
         synapse = cls(**input_dict)
 
         return synapse
+
+    def to_msgpack(self) -> bytes:
+        """
+        Encodes the fields of the synapse as a msgpack map, the binary counterpart of the JSON body.
+
+        The map holds the same values as :func:`model_dump`, so a synapse decoded from it by
+        :func:`from_body_and_headers` has the same :attr:`body_hash` as one decoded from the JSON body. The
+        buffers of :class:`bittensor.Tensor` fields are encoded as raw bytes, see
+        :func:`bittensor.tensor.binary_transport`. Values msgpack cannot represent natively are encoded as their
+        JSON compatible form.
+
+        Returns:
+            bytes: The msgpack encoded body.
+        """
+        with binary_transport():
+            fields = self.model_dump()
+        return msgpack.packb(fields, default=to_jsonable_python, use_bin_type=True)
+
+    @staticmethod
+    def decode_body(body: bytes, content_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Decodes a synapse body encoded as ``content_type`` into a dictionary of fields.
+
+        Args:
+            body (bytes): The encoded body. An empty body is read as ``{}``.
+            content_type (str, optional): The content type of the body, :data:`MSGPACK_CONTENT_TYPE` or JSON.
+                Defaults to ``None``, which is read as JSON.
+
+        Returns:
+            Dict[str, Any]: The decoded fields.
+        """
+        if not body:
+            return {}
+        if content_type and content_type.startswith(MSGPACK_CONTENT_TYPE):
+            # Unlike JSON, msgpack keeps non-string keys such as those of ``Dict[int, float]`` fields.
+            return msgpack.unpackb(body, raw=False, strict_map_key=False)
+        return json.loads(body)
+
+    @classmethod
+    def from_body_and_headers(cls, body: bytes, headers: dict) -> "Synapse":
+        """
+        Constructs a Synapse instance from the body and headers of a received request, parsing each only once.
+
+        The body is decoded and validated straight into the synapse class, and the terminal information and
+        header fields (``timeout``, ``name``, sizes and ``computed_body_hash``) are then taken from the headers.
+        Unlike :func:`from_headers`, the ``input_obj`` headers are not decoded, as the body already carries
+        those fields.
+
+        Args:
+            body (bytes): The request body, msgpack encoded if the ``content-type`` header is
+                :data:`MSGPACK_CONTENT_TYPE` and JSON encoded otherwise. An empty body is read as ``{}``.
+            headers (dict): The dictionary of headers containing serialized Synapse information.
+
+        Returns:
+            Synapse: A new instance of Synapse holding the request body and the header information.
+
+        Raises:
+            pydantic.ValidationError: If the body is not a valid encoding of the synapse class.
+        """
+        content_type = headers.get("content-type") or ""
+        if content_type.startswith(MSGPACK_CONTENT_TYPE):
+            synapse = cls.model_validate(cls.decode_body(body, content_type))
+        else:
+            synapse = cls.model_validate_json(body or b"{}")
+
+        axon_inputs: Dict[str, Any] = {}
+        dendrite_inputs: Dict[str, Any] = {}
+        for key, value in headers.items():
+            if key.startswith("bt_header_axon_"):
+                axon_inputs[key[len("bt_header_axon_") :]] = value
+            elif key.startswith("bt_header_dendrite_"):
+                dendrite_inputs[key[len("bt_header_dendrite_") :]] = value
+        synapse.axon = TerminalInfo(**axon_inputs)
+        synapse.dendrite = TerminalInfo(**dendrite_inputs)
+
+        for field in ("timeout", "name", "header_size", "total_size"):
+            value = headers.get(field)
+            if value is not None:
+                setattr(synapse, field, value)
+        # The field is frozen, the signed hash of the headers replaces the one of the body.
+        synapse.__dict__["computed_body_hash"] = headers.get("computed_body_hash", "")
+
+        return synapse
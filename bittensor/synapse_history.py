@@ -0,0 +1,279 @@
+"""Bounded records of the requests sent by a dendrite."""
+
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+import bittensor
+
+
+class SynapseHistory(ABC):
+    """
+    Record of the requests sent by a dendrite, see :attr:`dendrite.synapse_history`.
+
+    The history is filled by :func:`dendrite.call` and :func:`dendrite.call_stream` after every request. Use
+    :func:`SynapseHistory.create` to build one of the available modes:
+
+    - ``"off"``: :class:`NullSynapseHistory`, nothing is recorded.
+    - ``"ring"``: :class:`RingSynapseHistory`, the header fields of the last ``max_size`` synapses.
+    - ``"records"``: :class:`RecordSynapseHistory`, the status, latency, sizes and axon hotkey of the last
+      ``max_size`` requests in a preallocated NumPy record array.
+    """
+
+    @abstractmethod
+    def record(self, synapse: bittensor.Synapse):
+        """
+        Records a processed request.
+
+        Args:
+            synapse (bittensor.Synapse): The synapse of the request, filled with the response terminal information.
+        """
+
+    @abstractmethod
+    def clear(self):
+        """Forgets every recorded request."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """
+        Returns the recorded request at ``index``, the oldest first, or the requests in a slice like a list.
+        """
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self[index]
+
+    @classmethod
+    def create(
+        cls, mode: Union[str, "SynapseHistory", None] = "ring", max_size: int = 1024
+    ) -> "SynapseHistory":
+        """
+        Builds a synapse history.
+
+        Args:
+            mode (Union[str, SynapseHistory, None]): One of ``"off"``, ``"ring"`` or ``"records"``. ``None`` is
+                the same as ``"off"``, and a :class:`SynapseHistory` instance is returned as is.
+            max_size (int): The number of requests kept by the bounded modes.
+
+        Returns:
+            SynapseHistory: The history.
+
+        Raises:
+            ValueError: If ``mode`` is unknown.
+        """
+        if isinstance(mode, SynapseHistory):
+            return mode
+        if mode is None or mode == "off":
+            return NullSynapseHistory()
+        if mode == "ring":
+            return RingSynapseHistory(max_size=max_size)
+        if mode == "records":
+            return RecordSynapseHistory(max_size=max_size)
+        raise ValueError(
+            f"Unknown synapse history mode {mode!r}, expected one of 'off', 'ring' or 'records'"
+        )
+
+
+class NullSynapseHistory(SynapseHistory):
+    """Synapse history that records nothing."""
+
+    def record(self, synapse: bittensor.Synapse):
+        pass
+
+    def clear(self):
+        pass
+
+    def __len__(self) -> int:
+        return 0
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return []
+        raise IndexError("synapse history is disabled")
+
+
+class RingSynapseHistory(SynapseHistory):
+    """
+    Keeps the header fields of the last ``max_size`` synapses, the oldest first.
+
+    Each entry is a :class:`bittensor.Synapse` holding the name, timeout, sizes, body hash and copies of the
+    dendrite and axon terminal information of the request, i.e. what ``Synapse.from_headers(synapse.to_headers())``
+    used to store, without encoding and parsing the headers.
+
+    Args:
+        max_size (int): The maximum number of synapses kept.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._synapses: Deque[bittensor.Synapse] = deque(maxlen=max_size)
+
+    def record(self, synapse: bittensor.Synapse):
+        self._synapses.append(
+            bittensor.Synapse.model_construct(
+                name=synapse.name,
+                timeout=synapse.timeout,
+                total_size=synapse.total_size,
+                header_size=synapse.header_size,
+                computed_body_hash=synapse.computed_body_hash,
+                dendrite=(
+                    synapse.dendrite.model_copy()
+                    if synapse.dendrite is not None
+                    else None
+                ),
+                axon=synapse.axon.model_copy() if synapse.axon is not None else None,
+            )
+        )
+
+    def clear(self):
+        self._synapses.clear()
+
+    def __len__(self) -> int:
+        return len(self._synapses)
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[bittensor.Synapse, List[bittensor.Synapse]]:
+        if isinstance(index, slice):
+            return list(self._synapses)[index]
+        return self._synapses[index]
+
+
+class RecordSynapseHistory(SynapseHistory):
+    """
+    Keeps a compact record of the last ``max_size`` requests in a preallocated NumPy record array.
+
+    Recording a request writes one row of :attr:`DTYPE` in place, no object is allocated per request. The
+    records, oldest first, are returned by :func:`records`, and :func:`latency_stats` aggregates them per axon.
+
+    Args:
+        max_size (int): The maximum number of requests kept.
+    """
+
+    DTYPE = np.dtype(
+        [
+            ("timestamp", np.float64),
+            ("status_code", np.int16),
+            ("process_time", np.float32),
+            ("header_size", np.int32),
+            ("total_size", np.int32),
+            # ss58 addresses are 48 characters long.
+            ("hotkey", "U48"),
+        ]
+    )
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._records = np.zeros(max_size, dtype=self.DTYPE)
+        self._count = 0
+
+    def record(self, synapse: bittensor.Synapse):
+        dendrite, axon = synapse.dendrite, synapse.axon
+        row = self._records[self._count % self.max_size]
+        row["timestamp"] = time.time()
+        row["status_code"] = _to_int(dendrite.status_code if dendrite else None, -1)
+        row["process_time"] = _to_float(dendrite.process_time if dendrite else None)
+        row["header_size"] = _to_int(synapse.header_size)
+        row["total_size"] = _to_int(synapse.total_size)
+        row["hotkey"] = (axon.hotkey if axon else None) or ""
+        self._count += 1
+
+    def clear(self):
+        self._count = 0
+
+    def records(self) -> np.ndarray:
+        """
+        Returns a copy of the recorded requests, the oldest first.
+
+        Returns:
+            np.ndarray: Record array of :attr:`DTYPE`, with at most ``max_size`` rows.
+        """
+        if self._count <= self.max_size:
+            return self._records[: self._count].copy()
+        start = self._count % self.max_size
+        return np.concatenate((self._records[start:], self._records[:start]))
+
+    def latency_stats(
+        self, hotkey: Optional[str] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Aggregates the recorded latencies per axon hotkey.
+
+        Args:
+            hotkey (str, optional): Only aggregate the requests sent to this axon hotkey.
+
+        Returns:
+            Dict[str, Dict[str, float]]: For every hotkey, the ``count`` of requests, the ``success_rate`` (status
+            code 200), and the ``mean``, ``median`` and ``p95`` process time in seconds of the successful ones.
+        """
+        records = self.records()
+        if hotkey is not None:
+            records = records[records["hotkey"] == hotkey]
+        stats = {}
+        for key in np.unique(records["hotkey"]):
+            rows = records[records["hotkey"] == key]
+            latencies = rows["process_time"][rows["status_code"] == 200]
+            stats[str(key)] = {
+                "count": float(len(rows)),
+                "success_rate": float(len(latencies) / len(rows)),
+                "mean": float(latencies.mean()) if len(latencies) else float("nan"),
+                "median": (
+                    float(np.median(latencies)) if len(latencies) else float("nan")
+                ),
+                "p95": (
+                    float(np.percentile(latencies, 95))
+                    if len(latencies)
+                    else float("nan")
+                ),
+            }
+        return stats
+
+    def __len__(self) -> int:
+        return min(self._count, self.max_size)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[np.void, np.ndarray]:
+        if isinstance(index, slice):
+            return self.records()[index]
+        length = len(self)
+        if not -length <= index < length:
+            raise IndexError("synapse history index out of range")
+        start = self._count - length
+        return self._records[(start + index % length) % self.max_size].copy()
+
+
+def _to_int(value: Any, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
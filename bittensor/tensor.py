@@ -16,13 +16,42 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import contextlib
+import contextvars
 import numpy as np
 import base64
 import msgpack
 import msgpack_numpy
-from typing import Optional, Union, List
+from typing import Iterator, Optional, Union, List
 from bittensor.utils.registration import torch, use_torch
-from pydantic import ConfigDict, BaseModel, Field, field_validator
+from pydantic import (
+    ConfigDict,
+    BaseModel,
+    Field,
+    PrivateAttr,
+    field_serializer,
+    field_validator,
+)
+
+# Whether :class:`Tensor` buffers are dumped as raw bytes, see :func:`binary_transport`.
+_binary_transport: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "binary_transport", default=False
+)
+
+
+@contextlib.contextmanager
+def binary_transport() -> Iterator[None]:
+    """
+    Dumps the :class:`Tensor` buffers as raw bytes within the context, for encodings with a binary type such as msgpack.
+
+    Outside of it, raw buffers are dumped in their base64 form, which keeps JSON bodies and body hashes
+    compatible with peers that only know that form.
+    """
+    token = _binary_transport.set(True)
+    try:
+        yield
+    finally:
+        _binary_transport.reset(token)
 
 
 class DTypes(dict):
@@ -134,6 +163,21 @@ def cast_shape(raw: Union[None, List[int], str]) -> Optional[Union[str, list]]:
         )
 
 
+def _numpy_dtype(dtype: str) -> np.dtype:
+    """
+    Returns the little-endian numpy data type of raw buffers for a numpy or torch data type string.
+    """
+    if dtype.startswith("torch."):
+        dtype = dtype[len("torch.") :]
+    return np.dtype(dtype).newbyteorder("<")
+
+
+def _encode_base64(array: np.ndarray) -> str:
+    return base64.b64encode(msgpack.packb(array, default=msgpack_numpy.encode)).decode(
+        "utf-8"
+    )
+
+
 class tensor:
     def __new__(cls, tensor: Union[list, np.ndarray, "torch.Tensor"]):
         if isinstance(tensor, list) or isinstance(tensor, np.ndarray):
@@ -145,14 +189,34 @@ class Tensor(BaseModel):
     """
     Represents a Tensor object.
 
+    The buffer holds either the raw little-endian bytes of the array, as created by :func:`serialize` and received
+    over a binary transport, or the base64 encoded msgpack form of older versions, as received in JSON bodies.
+    Raw buffers are decoded without copying by :func:`deserialize`, and are dumped in their base64 form except
+    within :func:`binary_transport`, so that both forms have the same JSON encoding and body hash.
+
     Args:
-        buffer (Optional[str]): Tensor buffer data.
+        buffer (Optional[Union[str, bytes]]): Tensor buffer data.
         dtype (str): Tensor data type.
         shape (List[int]): Tensor shape.
     """
 
     model_config = ConfigDict(validate_assignment=True)
 
+    # The base64 form of a raw buffer, computed on first use.
+    _base64_buffer: Optional[str] = PrivateAttr(default=None)
+    # The decoded read-only array, decoded on first use by :func:`deserialize`.
+    _array: Optional[np.ndarray] = PrivateAttr(default=None)
+
+    def __eq__(self, other: object) -> bool:
+        # The decoded caches are left out of the comparison.
+        if not isinstance(other, Tensor):
+            return NotImplemented
+        return (self.buffer, self.dtype, self.shape) == (
+            other.buffer,
+            other.dtype,
+            other.shape,
+        )
+
     def tensor(self) -> Union[np.ndarray, "torch.Tensor"]:
         return self.deserialize()
 
@@ -160,36 +224,72 @@ class Tensor(BaseModel):
         return self.deserialize().tolist()
 
     def numpy(self) -> "numpy.ndarray":
+        array = self._numpy_array()
+        # Only the zero-copy view of a raw buffer is read-only, arrays decoded from base64 are writable copies.
+        return array if isinstance(self.buffer, bytes) else array.copy()
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The size in bytes of the decoded array, computed from the data type and shape without decoding the buffer.
+
+        Validators can check it to reject oversized tensors before decoding them. Tensors with the shape ``[0]``,
+        used for both scalars and empty arrays, count as one item.
+        """
+        count = 1
+        for dim in self.shape:
+            count *= dim
         return (
-            self.deserialize().detach().numpy() if use_torch() else self.deserialize()
+            max(count, 1 if self.shape == [0] else 0)
+            * _numpy_dtype(self.dtype).itemsize
         )
 
     def deserialize(self) -> Union["np.ndarray", "torch.Tensor"]:
         """
         Deserializes the Tensor object.
 
+        The buffer is decoded on first use only. A raw buffer is returned as a read-only numpy view of its bytes,
+        the same object on every call, copy it before modifying it in place. Buffers in the base64 form, and all
+        buffers under torch, are returned as a new writable array or tensor on every call, like in older versions.
+
         Returns:
             np.array or torch.Tensor: The deserialized tensor object.
 
         Raises:
             Exception: If the deserialization process encounters an error.
         """
-        shape = tuple(self.shape)
-        buffer_bytes = base64.b64decode(self.buffer.encode("utf-8"))
-        numpy_object = msgpack.unpackb(
-            buffer_bytes, object_hook=msgpack_numpy.decode
-        ).copy()
         if use_torch():
-            torch_object = torch.as_tensor(numpy_object)
-            # Reshape does not work for (0) or [0]
-            if not (len(shape) == 1 and shape[0] == 0):
-                torch_object = torch_object.reshape(shape)
-            return torch_object.type(dtypes[self.dtype])
+            # Torch does not support read-only memory, the array is copied.
+            return torch.from_numpy(np.array(self._numpy_array())).type(
+                dtypes[self.dtype]
+            )
+        return self.numpy()
+
+    def _numpy_array(self) -> np.ndarray:
+        """
+        Returns the decoded read-only array, decoding the buffer on first use.
+        """
+        if self._array is not None:
+            return self._array
+
+        if isinstance(self.buffer, bytes):
+            numpy_object = self._frombuffer()
         else:
+            shape = tuple(self.shape)
+            buffer_bytes = base64.b64decode(self.buffer.encode("utf-8"))
+            numpy_object = msgpack.unpackb(
+                buffer_bytes, object_hook=msgpack_numpy.decode
+            )
             # Reshape does not work for (0) or [0]
             if not (len(shape) == 1 and shape[0] == 0):
                 numpy_object = numpy_object.reshape(shape)
-            return numpy_object.astype(dtypes[self.dtype])
+            numpy_object = numpy_object.astype(
+                _numpy_dtype(self.dtype).newbyteorder("="), copy=False
+            )
+            numpy_object.setflags(write=False)
+
+        self._array = numpy_object
+        return numpy_object
 
     @staticmethod
     def serialize(tensor_: Union["np.ndarray", "torch.Tensor"]) -> "Tensor":
@@ -209,17 +309,42 @@ class Tensor(BaseModel):
         shape = list(tensor_.shape)
         if len(shape) == 0:
             shape = [0]
-        tensor__ = tensor_.cpu().detach().numpy().copy() if use_torch() else tensor_
-        data_buffer = base64.b64encode(
-            msgpack.packb(tensor__, default=msgpack_numpy.encode)
-        ).decode("utf-8")
+        tensor__ = tensor_.cpu().detach().numpy() if use_torch() else tensor_
+        data_buffer = np.ascontiguousarray(
+            tensor__, dtype=tensor__.dtype.newbyteorder("<")
+        ).tobytes()
         return Tensor(buffer=data_buffer, shape=shape, dtype=dtype)
 
+    def _frombuffer(self) -> np.ndarray:
+        """
+        Returns a read-only array viewing the raw buffer.
+        """
+        shape = tuple(self.shape)
+        if len(self.buffer) != self.nbytes and not (shape == (0,) and not self.buffer):
+            raise ValueError(
+                f"Tensor buffer of {len(self.buffer)} B does not match its dtype {self.dtype} and shape {self.shape}"
+            )
+        array = np.frombuffer(self.buffer, dtype=_numpy_dtype(self.dtype))
+        # Scalars are serialized with the shape [0], like empty arrays.
+        if shape == (0,):
+            return array.reshape(()) if array.size == 1 else array
+        return array.reshape(shape)
+
+    @field_serializer("buffer")
+    def _serialize_buffer(
+        self, buffer: Optional[Union[str, bytes]]
+    ) -> Optional[Union[str, bytes]]:
+        if isinstance(buffer, bytes) and not _binary_transport.get():
+            if self._base64_buffer is None:
+                self._base64_buffer = _encode_base64(self._numpy_array())
+            return self._base64_buffer
+        return buffer
+
     # Represents the tensor buffer data.
-    buffer: Optional[str] = Field(
+    buffer: Optional[Union[str, bytes]] = Field(
         default=None,
         title="buffer",
-        description="Tensor buffer data. This field stores the serialized representation of the tensor data.",
+        description="Tensor buffer data. This field stores the raw bytes or the base64 encoded msgpack representation of the tensor data.",
         examples=["0x321e13edqwds231231231232131"],
         frozen=True,
         repr=False,
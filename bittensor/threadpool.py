@@ -7,20 +7,25 @@ __author__ = "Brian Quinlan (brian@sweetapp.com)"
 
 import os
 import sys
+import math
 import time
+import heapq
 import queue
 import random
+import asyncio
 import weakref
 import logging
 import argparse
 import bittensor
 import itertools
 import threading
+import contextlib
 
-from typing import Callable
+from typing import AsyncIterator, Callable, List, Optional
 from concurrent.futures import _base
 
 from bittensor.btlogging.defines import BITTENSOR_LOGGER_NAME
+from bittensor.errors import QueueExpiredError
 
 # Workers are created as daemon threads. This is done to allow the interpreter
 # to exit when there are still idle threads in a ThreadPoolExecutor's thread
@@ -43,19 +48,34 @@ _shutdown = False
 
 
 class _WorkItem(object):
-    def __init__(self, future, fn, start_time, args, kwargs):
+    def __init__(self, future, fn, start_time, args, kwargs, deadline=None):
         self.future = future
         self.fn = fn
         self.start_time = start_time
         self.args = args
         self.kwargs = kwargs
+        self.deadline = deadline
+
+    def __lt__(self, other: "_WorkItem") -> bool:
+        # Work items of equal priority run earliest deadline first.
+        self_deadline = math.inf if self.deadline is None else self.deadline
+        other_deadline = math.inf if other.deadline is None else other.deadline
+        return (self_deadline, self.start_time) < (other_deadline, other.start_time)
 
     def run(self):
         """Run the given work item"""
-        # Checks if future is canceled or if work item is stale
-        if (not self.future.set_running_or_notify_cancel()) or (
-            time.time() - self.start_time > bittensor.__blocktime__
+        # Checks if future is canceled
+        if not self.future.set_running_or_notify_cancel():
+            return
+
+        # Checks if work item is stale, the caller is not waiting for its result anymore
+        now = time.time()
+        if (self.deadline is not None and now > self.deadline) or (
+            now - self.start_time > bittensor.__blocktime__
         ):
+            self.future.set_exception(
+                QueueExpiredError("Work item expired before it could be run")
+            )
             return
 
         try:
@@ -211,6 +231,16 @@ class PriorityThreadPoolExecutor(_base.Executor):
         return self._work_queue.empty()
 
     def submit(self, fn: Callable, *args, **kwargs) -> _base.Future:
+        """Submits a callable to be executed with the given arguments.
+
+        Work items are run highest ``priority`` first. Without an explicit ``deadline`` a random jitter is added
+        to the priority, and a missing or zero priority is replaced by a random one. With a ``deadline`` (a unix
+        timestamp in seconds) the priority is used as given, work items of equal priority are run earliest
+        deadline first, and a work item still queued after its deadline fails with a ``QueueExpiredError``.
+
+        Returns:
+            A Future representing the given call.
+        """
         with self._shutdown_lock:
             if self._broken:
                 raise BrokenThreadPool(self._broken)
@@ -222,22 +252,25 @@ class PriorityThreadPoolExecutor(_base.Executor):
                     "cannot schedule new futures after " "interpreter shutdown"
                 )
 
-            priority = kwargs.get("priority", random.randint(0, 1000000))
-            if priority == 0:
-                priority = random.randint(1, 100)
-            epsilon = random.uniform(0, 0.01) * priority
+            deadline = kwargs.pop("deadline", None)
+            if deadline is None:
+                priority = kwargs.get("priority", random.randint(0, 1000000))
+                if priority == 0:
+                    priority = random.randint(1, 100)
+                epsilon = random.uniform(0, 0.01) * priority
+            else:
+                priority = kwargs.get("priority", 0)
+                epsilon = 0
             start_time = time.time()
             if "priority" in kwargs:
                 del kwargs["priority"]
 
             f = _base.Future()
-            w = _WorkItem(f, fn, start_time, args, kwargs)
+            w = _WorkItem(f, fn, start_time, args, kwargs, deadline=deadline)
             self._work_queue.put((-float(priority + epsilon), w), block=False)
             self._adjust_thread_count()
             return f
 
-    submit.__doc__ = _base.Executor.submit.__doc__
-
     def _adjust_thread_count(self):
         # if idle threads are available, don't spin new threads
         if self._idle_semaphore.acquire(timeout=0):
@@ -293,3 +326,92 @@ class PriorityThreadPoolExecutor(_base.Executor):
                     pass
 
     shutdown.__doc__ = _base.Executor.shutdown.__doc__
+
+
+class PrioritySemaphore:
+    """
+    An asyncio semaphore that grants its slots by priority instead of in arrival order.
+
+    Waiters are woken highest ``priority`` first, and among equal priorities earliest ``deadline`` first. A waiter
+    that is still queued when its deadline (a unix timestamp in seconds) passes gives up with a
+    ``QueueExpiredError``.
+    This is the coroutine counterpart of the :class:`PriorityThreadPoolExecutor` queue, used to schedule async
+    work that runs on the event loop.
+
+    Args:
+        value (int): The number of slots, i.e. the maximum number of concurrent holders.
+    """
+
+    def __init__(self, value: int = 1):
+        if value <= 0:
+            raise ValueError("value must be greater than 0")
+        self._value = value
+        self._waiters: List[list] = []
+        self._counter = itertools.count()
+
+    @property
+    def available(self) -> int:
+        """The number of free slots."""
+        return self._value
+
+    @property
+    def waiting(self) -> int:
+        """The number of queued waiters."""
+        return len(self._waiters)
+
+    async def acquire(self, priority: float = 0.0, deadline: Optional[float] = None):
+        """
+        Waits for a free slot.
+
+        Args:
+            priority (float): Waiters with a higher priority acquire a slot first.
+            deadline (float, optional): Unix timestamp after which the waiter gives up.
+
+        Raises:
+            QueueExpiredError: If no slot was free before ``deadline``.
+        """
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        entry = [
+            -priority,
+            math.inf if deadline is None else deadline,
+            next(self._counter),
+            future,
+        ]
+        heapq.heappush(self._waiters, entry)
+        timeout = None if deadline is None else max(deadline - time.time(), 0)
+        try:
+            await asyncio.wait_for(future, timeout)
+        except BaseException as e:
+            if entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            elif future.done() and not future.cancelled():
+                # The slot was granted concurrently with the timeout, hand it on.
+                self.release()
+            if isinstance(e, asyncio.TimeoutError):
+                raise QueueExpiredError("No slot was free before the deadline") from e
+            raise
+
+    def release(self):
+        """Frees a slot, handing it to the highest priority waiter if there is one."""
+        while self._waiters:
+            future = heapq.heappop(self._waiters)[-1]
+            if not future.done():
+                future.set_result(None)
+                return
+        self._value += 1
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self, priority: float = 0.0, deadline: Optional[float] = None
+    ) -> AsyncIterator[None]:
+        """Holds a slot for the duration of the ``async with`` block, see :func:`acquire`."""
+        await self.acquire(priority, deadline)
+        try:
+            yield
+        finally:
+            self.release()
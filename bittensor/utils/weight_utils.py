@@ -21,7 +21,9 @@ Conversion for weight between chain representation and np.array or torch.Tensor
 
 import hashlib
 import logging
-from typing import Tuple, List, Union
+from dataclasses import dataclass
+from itertools import chain
+from typing import Tuple, List, Sequence, Union
 
 import numpy as np
 from numpy.typing import NDArray
@@ -180,6 +182,221 @@ def convert_bond_uids_and_vals_to_tensor(
     return row_bonds
 
 
+def _flatten_rows(
+    rows: Sequence[Sequence[Sequence[int]]],
+) -> Tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.float64]]:
+    """Flattens the ``(column, value)`` pairs of each row into the ``indptr``, columns and values of a CSR matrix."""
+    lengths = np.fromiter(map(len, rows), dtype=np.int64, count=len(rows))
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=indptr[1:])
+    pairs = np.array(list(chain.from_iterable(rows)), dtype=np.float64).reshape(-1, 2)
+    return indptr, pairs[:, 0].astype(np.int64), pairs[:, 1]
+
+
+@dataclass
+class CSRMatrix:
+    """
+    Sparse matrix in compressed sparse row (CSR) form.
+
+    The non-zero values of row ``i`` are ``data[indptr[i]:indptr[i + 1]]``, in the columns
+    ``indices[indptr[i]:indptr[i + 1]]``. The weights and bonds set on chain are very sparse, a metagraph keeps them
+    in this form and only creates the dense matrix when it is accessed.
+
+    Args:
+        indptr (NDArray[np.int64]): The offsets of the rows in ``indices`` and ``data``, of length ``shape[0] + 1``.
+        indices (NDArray[np.int64]): The column of each value.
+        data (NDArray): The values.
+        shape (Tuple[int, int]): The number of rows and columns of the matrix.
+    """
+
+    indptr: NDArray[np.int64]
+    indices: NDArray[np.int64]
+    data: NDArray
+    shape: Tuple[int, int]
+
+    @classmethod
+    def from_rows(
+        cls, rows: Sequence[Sequence[Sequence[int]]], n_cols: int, dtype=np.int64
+    ) -> "CSRMatrix":
+        """
+        Builds the matrix from the ``(column, value)`` pairs of each row, e.g. the weights of each neuron.
+
+        Args:
+            rows (Sequence[Sequence[Sequence[int]]]): The ``(column, value)`` pairs of each row.
+            n_cols (int): The number of columns.
+            dtype: The NumPy type of the values.
+
+        Returns:
+            CSRMatrix: The matrix.
+
+        Raises:
+            IndexError: If a column is not in ``[0, n_cols)``.
+        """
+        indptr, indices, values = _flatten_rows(rows)
+        if len(indices) and (indices.min() < 0 or indices.max() >= n_cols):
+            raise IndexError(f"Column index out of bounds for {n_cols} columns")
+        return cls(indptr, indices, values.astype(dtype), (len(rows), n_cols))
+
+    @property
+    def nnz(self) -> int:
+        """The number of stored values."""
+        return len(self.data)
+
+    def row_ids(self) -> NDArray[np.int64]:
+        """Returns the row of each stored value."""
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    def row(self, index: int) -> Tuple[NDArray[np.int64], NDArray]:
+        """
+        Returns the columns and values of a row.
+
+        Args:
+            index (int): The row.
+
+        Returns:
+            Tuple[NDArray[np.int64], NDArray]: The columns and the values of the row.
+        """
+        start, end = self.indptr[index], self.indptr[index + 1]
+        return self.indices[start:end], self.data[start:end]
+
+    def replace_rows(
+        self, rows: Union[Sequence[int], NDArray[np.int64]], other: "CSRMatrix"
+    ) -> "CSRMatrix":
+        """
+        Returns the matrix with some of its rows replaced, e.g. by the weights of the neurons which set them again.
+
+        Args:
+            rows (Union[Sequence[int], NDArray[np.int64]]): The rows to replace.
+            other (CSRMatrix): The new rows, one per row of ``rows`` and in the same order.
+
+        Returns:
+            CSRMatrix: The matrix with the new rows.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        kept = np.ones(self.shape[0], dtype=bool)
+        kept[rows] = False
+        row_ids = self.row_ids()
+        kept_values = kept[row_ids]
+        row_ids = np.concatenate([row_ids[kept_values], rows[other.row_ids()]])
+        # A stable sort keeps the values of each row in their order.
+        order = np.argsort(row_ids, kind="stable")
+        indptr = np.zeros_like(self.indptr)
+        np.cumsum(np.bincount(row_ids, minlength=self.shape[0]), out=indptr[1:])
+        return CSRMatrix(
+            indptr,
+            np.concatenate([self.indices[kept_values], other.indices])[order],
+            np.concatenate([self.data[kept_values], other.data])[order],
+            self.shape,
+        )
+
+    def normalize_rows(self) -> "CSRMatrix":
+        """
+        Returns the matrix with each row divided by its sum, as float32. Rows summing to zero are kept as they are.
+
+        Returns:
+            CSRMatrix: The normalized matrix.
+        """
+        sums = np.bincount(
+            self.row_ids(), weights=self.data, minlength=self.shape[0]
+        ).astype(np.float32)
+        sums[sums == 0] = 1
+        data = self.data.astype(np.float32) / sums[self.row_ids()]
+        return CSRMatrix(self.indptr, self.indices, data, self.shape)
+
+    def todense(self, dtype=None) -> NDArray:
+        """
+        Creates the dense matrix.
+
+        Args:
+            dtype: The NumPy type of the dense matrix, the type of the values by default.
+
+        Returns:
+            NDArray: The dense matrix.
+        """
+        dense = np.zeros(self.shape, dtype=dtype or self.data.dtype)
+        dense[self.row_ids(), self.indices] = self.data
+        return dense
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CSRMatrix):
+            return NotImplemented
+        return (
+            self.shape == other.shape
+            and np.array_equal(self.indptr, other.indptr)
+            and np.array_equal(self.indices, other.indices)
+            and np.array_equal(self.data, other.data)
+        )
+
+
+def convert_weight_uids_and_vals_to_csr(
+    n: int, rows: Sequence[Sequence[Sequence[int]]]
+) -> CSRMatrix:
+    r"""Converts the weights of every neuron from chain representation into a normalized sparse matrix.
+    Row ``i`` holds the values :func:`convert_weight_uids_and_vals_to_tensor` returns for the weights of neuron ``i``.
+    Args:
+        n: int:
+            number of neurons on network.
+        rows (:obj:`Sequence[Sequence[Sequence[int]]]`):
+            ``(uid, weight)`` pairs set by each neuron.
+    Returns:
+        weights (CSRMatrix):
+            Converted float32 weights, each row summing to 1 or 0.
+    """
+    return CSRMatrix.from_rows(rows, n, dtype=np.float32).normalize_rows()
+
+
+def convert_root_weight_uids_and_vals_to_csr(
+    n: int, rows: Sequence[Sequence[Sequence[int]]], subnets: List[int]
+) -> CSRMatrix:
+    r"""Converts the root weights of every neuron from chain representation into a normalized sparse matrix.
+    Row ``i`` holds the values :func:`convert_root_weight_uids_and_vals_to_tensor` returns for the weights of neuron
+    ``i``: the columns are the positions of the netuids in ``subnets``, weights of other netuids are dropped.
+    Args:
+        n: int:
+            number of subnets on network.
+        rows (:obj:`Sequence[Sequence[Sequence[int]]]`):
+            ``(netuid, weight)`` pairs set by each neuron.
+        subnets (:obj:`List[int],`):
+            list of subnets on the network
+    Returns:
+        weights (CSRMatrix):
+            Converted float32 weights, each row summing to 1 or 0.
+    """
+    indptr, netuids, values = _flatten_rows(rows)
+    # Position of each netuid in ``subnets``, -1 for the netuids not in it.
+    positions = np.full(
+        max(max(subnets, default=0), netuids.max(initial=0)) + 1, -1, dtype=np.int64
+    )
+    positions[np.asarray(subnets, dtype=np.int64)[::-1]] = np.arange(len(subnets))[::-1]
+    columns = positions[netuids] if len(netuids) else netuids
+    known = (columns >= 0) & (columns < n)
+    for uid_j in np.unique(netuids[~known]):
+        logging.warning(
+            f"Incorrect Subnet uid {uid_j} in Subnets {subnets}. The subnet is unavailable at the moment."
+        )
+    row_ids = np.repeat(np.arange(len(rows)), np.diff(indptr))
+    np.cumsum(np.bincount(row_ids[known], minlength=len(rows)), out=indptr[1:])
+    return CSRMatrix(
+        indptr, columns[known], values[known].astype(np.float32), (len(rows), n)
+    ).normalize_rows()
+
+
+def convert_bond_uids_and_vals_to_csr(
+    n: int, rows: Sequence[Sequence[Sequence[int]]]
+) -> CSRMatrix:
+    r"""Converts the bonds of every neuron from chain representation into a sparse matrix.
+    Args:
+        n: int:
+            number of neurons on network.
+        rows (:obj:`Sequence[Sequence[Sequence[int]]]`):
+            ``(uid, bond)`` pairs of each neuron.
+    Returns:
+        bonds (CSRMatrix):
+            Converted int64 bonds.
+    """
+    return CSRMatrix.from_rows(rows, n)
+
+
 def convert_weights_and_uids_for_emit(
     uids: Union[NDArray[np.int64], "torch.LongTensor"],
     weights: Union[NDArray[np.float32], "torch.FloatTensor"],
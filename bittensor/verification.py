@@ -0,0 +1,153 @@
+"""Caches and worker pools used by the axon to verify request signatures."""
+
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Union
+
+from substrateinterface import Keypair
+
+
+class KeypairCache:
+    """
+    LRU cache of the public :class:`Keypair` of dendrite hotkeys.
+
+    Building a keypair from an ss58 address base58-decodes it and validates its checksum. Since an axon is
+    queried by the same few validator hotkeys over and over, the keypairs are kept and reused. Sizing the
+    cache to the metagraph keeps every hotkey of the subnet cached.
+
+    Args:
+        max_size (int): The maximum number of keypairs kept.
+    """
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._keypairs: "OrderedDict[str, Keypair]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, ss58_address: str) -> Keypair:
+        """
+        Returns the keypair of ``ss58_address``, building it on a cache miss.
+
+        Raises:
+            ValueError: If ``ss58_address`` is not a valid ss58 address.
+        """
+        with self._lock:
+            keypair = self._keypairs.get(ss58_address)
+            if keypair is not None:
+                self._keypairs.move_to_end(ss58_address)
+                self.hits += 1
+                return keypair
+            self.misses += 1
+
+        # Invalid addresses raise here and are not cached.
+        keypair = Keypair(ss58_address=ss58_address)
+
+        with self._lock:
+            self._keypairs[ss58_address] = keypair
+            while len(self._keypairs) > self.max_size:
+                self._keypairs.popitem(last=False)
+        return keypair
+
+    def __len__(self) -> int:
+        return len(self._keypairs)
+
+    def __contains__(self, ss58_address: str) -> bool:
+        return ss58_address in self._keypairs
+
+
+class BatchVerifier:
+    """
+    Verifies signatures in batches on a pool of worker threads, off the event loop.
+
+    Verification requests issued while the event loop is busy are queued and handed to the pool together,
+    up to ``max_batch_size`` per batch, so each worker hop amortizes over several sr25519 verifications.
+    Only the thread hops are grouped: a batch still calls ``keypair.verify`` once per signature, in sequence,
+    rather than using a batch signature verification.
+
+    Args:
+        max_workers (int): The number of worker threads.
+        max_batch_size (int): The maximum number of signatures verified by a single pool task.
+    """
+
+    def __init__(self, max_workers: int = 2, max_batch_size: int = 32):
+        self.max_workers = max_workers
+        self.max_batch_size = max_batch_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="bt_verify"
+        )
+        self._pending: List[
+            Tuple[Keypair, str, Union[str, bytes], "asyncio.Future[bool]"]
+        ] = []
+        self._flush_scheduled = False
+
+    async def verify(
+        self, keypair: Keypair, message: str, signature: Union[str, bytes]
+    ) -> bool:
+        """
+        Verifies ``signature`` of ``message`` against ``keypair``.
+
+        Returns:
+            bool: ``True`` if the signature is valid.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((keypair, message, signature, future))
+        if not self._flush_scheduled:
+            # Let the other requests that are ready on the event loop join the batch.
+            self._flush_scheduled = True
+            loop.call_soon(self._flush, loop)
+        return await future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop):
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, []
+        for start in range(0, len(pending), self.max_batch_size):
+            batch = pending[start : start + self.max_batch_size]
+            self._executor.submit(self._verify_batch, loop, batch)
+
+    @staticmethod
+    def _verify_batch(
+        loop: asyncio.AbstractEventLoop,
+        batch: List[Tuple[Keypair, str, Union[str, bytes], "asyncio.Future[bool]"]],
+    ):
+        for keypair, message, signature, future in batch:
+            try:
+                result = keypair.verify(message, signature)
+                loop.call_soon_threadsafe(_set_result, future, result)
+            except Exception as e:
+                loop.call_soon_threadsafe(_set_exception, future, e)
+
+    def shutdown(self, wait: bool = True):
+        """Shuts the worker pool down."""
+        self._executor.shutdown(wait=wait)
+
+
+def _set_result(future: asyncio.Future, result):
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future, exception: Exception):
+    if not future.done():
+        future.set_exception(exception)
@@ -20,6 +20,7 @@ import bittensor
 import torch
 import os
 from bittensor.mock import MockSubtensor
+from bittensor.mock.subtensor_mock import AxonInfoDict, PrometheusInfoDict
 from bittensor.metagraph import METAGRAPH_STATE_DICT_NDARRAY_KEYS, get_save_dir
 
 _subtensor_mock: MockSubtensor = MockSubtensor()
@@ -112,3 +113,64 @@ class TestMetagraph:
         metagraph.D
         metagraph.B
         metagraph.W
+
+    def test_incremental_sync(self):
+        netuid = 13
+        if not self.sub.subnet_exists(netuid):
+            self.sub.create_subnet(netuid=netuid)
+        for uid in range(16):
+            self.sub.force_register_neuron(
+                netuid, f"hotkey_{uid}", f"coldkey_{uid}", stake=uid + 1
+            )
+        state = self.sub.chain_state["SubtensorModule"]
+        for uid in range(16):
+            state["Weights"][netuid][uid][self.sub.block_number] = [
+                [(uid + 1) % 16, 100]
+            ]
+        self.sub.do_block_step()
+
+        for lite in (True, False):
+            metagraph = bittensor.metagraph(netuid=netuid, network="mock", sync=False)
+            metagraph.sync(lite=lite, subtensor=self.sub, incremental=True)
+            metagraph.axons
+
+            self.sub.do_block_step()
+            block = self.sub.block_number
+            # uid 5 sets its weights, uid 9 is taken by a new hotkey, uid 3 is staked to, uid 7 serves its axon and uid 4
+            # its prometheus endpoint.
+            state["LastUpdate"][netuid][5][block] = block
+            state["Weights"][netuid][5][block] = [[0, 7]]
+            state["Keys"][netuid][9][block] = f"new_hotkey_{lite}"
+            state["Owner"][f"new_hotkey_{lite}"] = {block: "new_coldkey"}
+            state["Stake"][f"new_hotkey_{lite}"] = {"new_coldkey": {block: 12345}}
+            state["Stake"]["hotkey_3"]["coldkey_3"][block] = 10**9 * (10 + lite)
+            state["Axons"][netuid]["hotkey_7"][block] = AxonInfoDict(
+                block=block,
+                version=1,
+                ip=2130706433,
+                port=8091 + lite,
+                ip_type=4,
+                protocol=4,
+                placeholder1=0,
+                placeholder2=0,
+            )
+            state["Prometheus"][netuid]["hotkey_4"][block] = PrometheusInfoDict(
+                block=block, version=1, ip=2130706433, port=7091 + lite, ip_type=4
+            )
+
+            metagraph.sync(lite=lite, subtensor=self.sub, incremental=True)
+
+            expected = bittensor.metagraph(netuid=netuid, network="mock", sync=False)
+            expected.sync(block=block, lite=lite, subtensor=self.sub)
+            assert metagraph.hotkeys[9] == f"new_hotkey_{lite}"
+            assert metagraph.S[3] == 10 + lite
+            assert metagraph.axons[7].port == 8091 + lite
+            assert metagraph.neurons[4].prometheus_info.port == 7091 + lite
+            assert metagraph.hotkeys == expected.hotkeys
+            assert metagraph.axons == expected.axons
+            assert metagraph.neurons == expected.neurons
+            for key in ("block", "stake", "total_stake", "last_update", "ranks"):
+                assert (getattr(metagraph, key) == getattr(expected, key)).all()
+            if not lite:
+                assert (metagraph.W == expected.W).all()
+                assert (metagraph.B == expected.B).all()
@@ -19,7 +19,13 @@
 
 
 # Standard Lib
+import asyncio
+import os
 import re
+import socket
+import threading
+import time
+import typing
 from dataclasses import dataclass
 
 from typing import Any
@@ -30,14 +36,21 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import netaddr
 
 import pytest
+import requests
 from starlette.requests import Request
+from starlette.responses import Response
 from fastapi.testclient import TestClient
 
 # Bittensor
 import bittensor
 from bittensor import Synapse, RunException
-from bittensor.axon import AxonMiddleware
+from bittensor.constants import ALLOWED_DELTA, NONCE_MAX_TIMEOUT
+from bittensor.errors import PriorityException, SynapseParsingError
+from bittensor.axon import AxonMetrics, AxonMiddleware
 from bittensor.axon import axon as Axon
+from bittensor.dendrite import ConnectorProfile
+from bittensor.nonce_store import SQLiteNonceStore, nonce_expiry
+from tests.helpers import _get_mock_wallet
 
 
 def test_attach():
@@ -269,6 +282,15 @@ async def test_priority_pass(middleware):
     assert synapse.axon.status_code != 408
 
 
+@pytest.mark.asyncio
+async def test_priority_sheds_expired_request(middleware):
+    synapse = SynapseMock()
+    middleware.axon.priority_fns = {"SynapseMock": priority_fn_pass}
+    with pytest.raises(PriorityException):
+        await middleware.priority(synapse, deadline=time.time() - 1)
+    assert synapse.axon.status_code == 408
+
+
 @pytest.mark.parametrize(
     "body, expected",
     [
@@ -481,7 +503,7 @@ class TestAxonMiddleware(IsolatedAsyncioTestCase):
         request.url.path = "/request_name"
         request.client.port = "5000"
         request.client.host = "192.168.0.1"
-        request.headers = {}
+        request.headers = {"timeout": "5.0"}
 
         synapse = await self.axon_middleware.preprocess(request)
 
@@ -500,6 +522,45 @@ class TestAxonMiddleware(IsolatedAsyncioTestCase):
         # Check if the preprocess function sets the request name correctly
         assert synapse.name == "request_name"
 
+        # Check if the preprocess function reads the header fields
+        assert synapse.timeout == 5.0
+
+    @pytest.mark.asyncio
+    async def test_parse_body(self):
+        class BodySynapse(bittensor.Synapse):
+            key: int = 0
+
+        request = MagicMock(spec=Request)
+        request.url.path = "/BodySynapse"
+        request.headers = {"timeout": "5.0"}
+        request.body = AsyncMock(return_value=b'{"key": 3, "timeout": 12.0}')
+        synapse = BodySynapse(
+            name="BodySynapse",
+            axon=bittensor.TerminalInfo(uuid="1234"),
+            dendrite=bittensor.TerminalInfo(ip="192.168.0.1"),
+        )
+
+        parsed = await self.axon_middleware.parse_body(request, synapse)
+
+        assert parsed.key == 3
+        # Header fields take precedence over the body
+        assert parsed.timeout == 5.0
+        assert parsed.name == "BodySynapse"
+        assert parsed.axon.uuid == "1234"
+        assert parsed.dendrite.ip == "192.168.0.1"
+
+    @pytest.mark.asyncio
+    async def test_parse_body_error(self):
+        request = MagicMock(spec=Request)
+        request.url.path = "/request_name"
+        request.headers = {}
+        request.body = AsyncMock(return_value=b"not json")
+
+        with pytest.raises(SynapseParsingError):
+            await self.axon_middleware.parse_body(
+                request, bittensor.Synapse(name="request_name")
+            )
+
 
 class SynapseHTTPClient(TestClient):
     def post_synapse(self, synapse: Synapse):
@@ -541,6 +602,12 @@ class TestAxonHTTPAPIResponses:
             },
         )
 
+    def test_warm_up_request(self, http_client):
+        with patch("bittensor.logging.error") as log_error:
+            response = http_client.head("/")
+        assert response.status_code == 200
+        log_error.assert_not_called()
+
     async def test_ping__no_dendrite(self, http_client):
         response = http_client.post_synapse(bittensor.Synapse())
         assert (response.status_code, response.json()) == (
@@ -558,6 +625,100 @@ class TestAxonHTTPAPIResponses:
         response_synapse = Synapse(**response.json())
         assert response_synapse.axon.status_code == 200
 
+    async def test_synapse__sync_forward_runs_in_thread_pool(
+        self, http_client, axon, custom_synapse_cls, no_verify_axon
+    ):
+        forward_threads = []
+
+        def forward_fn(synapse: custom_synapse_cls) -> custom_synapse_cls:
+            forward_threads.append(threading.current_thread())
+            return synapse
+
+        axon.attach(forward_fn)
+
+        response = http_client.post_synapse(custom_synapse_cls())
+        assert response.status_code == 200
+        assert forward_threads[0] in axon.thread_pool._threads
+
+    async def test_synapse__body_hash_mismatch(
+        self, http_client, axon, custom_synapse_cls, no_verify_axon
+    ):
+        async def forward_fn(synapse: custom_synapse_cls):
+            return synapse
+
+        axon.attach(forward_fn)
+        synapse = custom_synapse_cls()
+        response = http_client.post(
+            f"/{custom_synapse_cls.__name__}",
+            json=synapse.model_dump(),
+            headers={"computed_body_hash": "tampered"},
+        )
+        assert response.status_code == 400
+        assert response.json()["message"].startswith("Hash mismatch")
+
+    async def test_synapse__forward_receives_parsed_synapse(
+        self, http_client, axon, no_verify_axon
+    ):
+        class BodySynapse(Synapse):
+            text: str
+            required_hash_fields: typing.ClassVar[typing.Tuple[str, ...]] = ("text",)
+
+        received = []
+
+        async def forward_fn(synapse: BodySynapse) -> BodySynapse:
+            received.append(synapse)
+            synapse.text = synapse.text.upper()
+            return synapse
+
+        axon.attach(forward_fn)
+        request_synapse = BodySynapse(text="hello")
+        # Like a dendrite, send the synapse headers, which carry the required fields.
+        response = http_client.post(
+            "/BodySynapse",
+            json=request_synapse.model_dump(),
+            headers=request_synapse.to_headers(),
+        )
+
+        assert response.status_code == 200
+        assert response.json()["text"] == "HELLO"
+        # The synapse is built from the body and the headers of the request by the middleware.
+        assert received[0].dendrite.ip == "testclient"
+        assert received[0].axon.uuid == axon.uuid
+
+    async def test_synapse__msgpack_body(self, http_client, axon, no_verify_axon):
+        class BodySynapse(Synapse):
+            values: typing.List[float]
+            required_hash_fields: typing.ClassVar[typing.Tuple[str, ...]] = ("values",)
+
+        async def forward_fn(synapse: BodySynapse) -> BodySynapse:
+            synapse.values = [value * 2 for value in synapse.values]
+            return synapse
+
+        axon.attach(forward_fn)
+        request_synapse = BodySynapse(values=[0.5, 1.5])
+        response = http_client.post(
+            "/BodySynapse",
+            content=request_synapse.to_msgpack(),
+            headers={
+                "Content-Type": "application/msgpack",
+                "Accept": "application/msgpack, application/json",
+                **request_synapse.to_headers(),
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/msgpack"
+        body = Synapse.decode_body(response.content, "application/msgpack")
+        assert body["values"] == [1.0, 3.0]
+
+        # Dendrites that do not accept msgpack are answered in JSON
+        response = http_client.post(
+            "/BodySynapse",
+            json=request_synapse.model_dump(),
+            headers=request_synapse.to_headers(),
+        )
+        assert response.json()["values"] == [1.0, 3.0]
+
     @pytest.fixture
     def custom_synapse_cls(self):
         class CustomSynapse(Synapse):
@@ -600,6 +761,18 @@ class TestAxonHTTPAPIResponses:
         assert response.status_code == 409
         assert response.json() == {"message": error_message}
 
+    async def test_synapse__forward_timeout_is_internal_error(
+        self, http_client, axon, custom_synapse_cls, no_verify_axon
+    ):
+        async def forward_fn(synapse: custom_synapse_cls):
+            # e.g. an upstream request of the forward function timing out
+            raise TimeoutError("upstream timeout")
+
+        axon.attach(forward_fn)
+
+        response = http_client.post_synapse(custom_synapse_cls())
+        assert response.status_code == 500
+
     async def test_synapse__internal_error(
         self, http_client, axon, custom_synapse_cls, no_verify_axon
     ):
@@ -613,3 +786,379 @@ class TestAxonHTTPAPIResponses:
         response_data = response.json()
         assert sorted(response_data.keys()) == ["message"]
         assert re.match(r"Internal Server Error #[\da-f\-]+", response_data["message"])
+
+
+def test_max_async_forwards():
+    # Async forward functions are not capped by default.
+    axon = Axon(wallet=_get_mock_wallet(), external_ip="192.0.2.1")
+    assert axon.forward_semaphore is None
+
+    config = Axon.config()
+    config.axon.max_async_forwards = 2
+    axon = Axon(config=config, wallet=_get_mock_wallet(), external_ip="192.0.2.1")
+    assert axon.forward_semaphore.available == 2
+
+
+def test_keepalive_timeout():
+    # Idle connections outlive the keep-alive of the dendrite pools.
+    axon = Axon(wallet=_get_mock_wallet(), external_ip="192.0.2.1")
+    assert axon.fast_config.timeout_keep_alive > ConnectorProfile().keepalive_timeout
+
+    config = Axon.config()
+    config.axon.keepalive_timeout = 300
+    axon = Axon(config=config, wallet=_get_mock_wallet(), external_ip="192.0.2.1")
+    assert axon.fast_config.timeout_keep_alive == 300
+
+
+@pytest.mark.asyncio
+async def test_default_verify_rejects_replayed_nonce():
+    keypair = bittensor.Keypair.create_from_mnemonic(
+        bittensor.Keypair.generate_mnemonic()
+    )
+    axon = Axon(wallet=_get_mock_wallet(), external_ip="192.0.2.1")
+    synapse = Synapse(
+        dendrite=bittensor.TerminalInfo(
+            nonce=time.time_ns(),
+            uuid="uuid",
+            hotkey=keypair.ss58_address,
+            version=bittensor.__version_as_int__,
+        )
+    )
+    message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{axon.wallet.hotkey.ss58_address}.{synapse.dendrite.uuid}.{synapse.computed_body_hash}"
+    synapse.dendrite.signature = f"0x{keypair.sign(message).hex()}"
+
+    await axon.default_verify(synapse)
+    assert axon.nonces.get(f"{keypair.ss58_address}:uuid") == synapse.dendrite.nonce
+
+    with pytest.raises(Exception, match="Nonce is too old"):
+        await axon.default_verify(synapse)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "nonce_offset, version, max_lifetime",
+    [
+        (
+            0,
+            bittensor.__version_as_int__,
+            2 * ALLOWED_DELTA + NONCE_MAX_TIMEOUT * 10**9,
+        ),
+        (10 * ALLOWED_DELTA, bittensor.__version_as_int__, None),
+    ],
+)
+async def test_default_verify_bounds_nonce_lifetime(
+    nonce_offset, version, max_lifetime
+):
+    keypair = bittensor.Keypair.create_from_mnemonic(
+        bittensor.Keypair.generate_mnemonic()
+    )
+    axon = Axon(wallet=_get_mock_wallet(), external_ip="192.0.2.1")
+    synapse = Synapse(
+        timeout=10**9,
+        dendrite=bittensor.TerminalInfo(
+            nonce=time.time_ns() + nonce_offset,
+            uuid="uuid",
+            hotkey=keypair.ss58_address,
+            version=version,
+        ),
+    )
+    message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{axon.wallet.hotkey.ss58_address}.{synapse.dendrite.uuid}.{synapse.computed_body_hash}"
+    synapse.dendrite.signature = f"0x{keypair.sign(message).hex()}"
+
+    if max_lifetime is None:
+        with pytest.raises(Exception, match="Nonce is too far in the future"):
+            await axon.default_verify(synapse)
+        assert len(axon.nonces) == 0
+        return
+
+    await axon.default_verify(synapse)
+    # A huge timeout does not keep the entry around forever
+    ((_, expires_at),) = axon.nonces._entries.values()
+    assert expires_at <= time.time_ns() + max_lifetime
+
+
+@pytest.mark.asyncio
+async def test_default_verify_rejects_replay_with_inflated_timeout(mocker):
+    keypair = bittensor.Keypair.create_from_mnemonic(
+        bittensor.Keypair.generate_mnemonic()
+    )
+    axon = Axon(wallet=_get_mock_wallet(), external_ip="192.0.2.1")
+    now = time.time_ns()
+    synapse = Synapse(
+        timeout=12.0,
+        dendrite=bittensor.TerminalInfo(
+            nonce=now,
+            uuid="uuid",
+            hotkey=keypair.ss58_address,
+            version=bittensor.__version_as_int__,
+        ),
+    )
+    message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{axon.wallet.hotkey.ss58_address}.{synapse.dendrite.uuid}.{synapse.computed_body_hash}"
+    synapse.dendrite.signature = f"0x{keypair.sign(message).hex()}"
+    await axon.default_verify(synapse)
+    ((_, expires_at),) = axon.nonces._entries.values()
+
+    # The timeout is not signed, a replay may claim any timeout once the entry has expired
+    mocker.patch("time.time_ns", return_value=expires_at + 1)
+    assert axon.nonces.get(f"{keypair.ss58_address}:uuid") is None
+    synapse.timeout = 10.0**12
+    with pytest.raises(Exception, match="Nonce is too old"):
+        await axon.default_verify(synapse)
+
+
+@pytest.mark.asyncio
+async def test_default_verify_keeps_legacy_nonces():
+    keypair = bittensor.Keypair.create_from_mnemonic(
+        bittensor.Keypair.generate_mnemonic()
+    )
+    axon = Axon(wallet=_get_mock_wallet(), external_ip="192.0.2.1")
+    synapse = Synapse(
+        dendrite=bittensor.TerminalInfo(
+            nonce=1, uuid="uuid", hotkey=keypair.ss58_address, version=7001000
+        )
+    )
+    message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{axon.wallet.hotkey.ss58_address}.{synapse.dendrite.uuid}.{synapse.computed_body_hash}"
+    synapse.dendrite.signature = f"0x{keypair.sign(message).hex()}"
+
+    await axon.default_verify(synapse)
+    # Legacy nonces have no time window, their entry must outlive any pruning
+    axon.nonces.prune(time.time_ns() + 10**18)
+    assert axon.nonces._entries[f"{keypair.ss58_address}:uuid"] == (1, None)
+
+    with pytest.raises(Exception, match="Nonce is too small"):
+        await axon.default_verify(synapse)
+
+
+@pytest.mark.asyncio
+async def test_middleware_checks_nonces_before_reading_the_body():
+    keypair = bittensor.Keypair.create_from_mnemonic(
+        bittensor.Keypair.generate_mnemonic()
+    )
+    axon = Axon(wallet=_get_mock_wallet(), external_ip="192.0.2.1")
+    middleware = AxonMiddleware(axon.app, axon)
+
+    def signed_request(nonce: int, body_sent: asyncio.Event) -> Request:
+        synapse = Synapse(
+            dendrite=bittensor.TerminalInfo(
+                nonce=nonce,
+                uuid="uuid",
+                hotkey=keypair.ss58_address,
+                version=bittensor.__version_as_int__,
+            )
+        )
+        message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{axon.wallet.hotkey.ss58_address}.{synapse.dendrite.uuid}.{synapse.body_hash}"
+        synapse.dendrite.signature = f"0x{keypair.sign(message).hex()}"
+        body = synapse.model_dump_json().encode()
+
+        async def receive():
+            await body_sent.wait()
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/Synapse",
+            "headers": [
+                (key.encode(), str(value).encode())
+                for key, value in synapse.to_headers().items()
+            ],
+            "client": ("127.0.0.1", 5000),
+        }
+        return Request(scope, receive)
+
+    async def call_next(request: Request) -> Response:
+        return Response(status_code=200)
+
+    # Two requests of one dendrite, the body of the first one arrives last.
+    first_body_sent, second_body_sent = asyncio.Event(), asyncio.Event()
+    nonce = time.time_ns()
+    first = asyncio.create_task(
+        middleware.dispatch(signed_request(nonce, first_body_sent), call_next)
+    )
+    await asyncio.sleep(0.1)
+    second_body_sent.set()
+    second = await middleware.dispatch(
+        signed_request(nonce + 1, second_body_sent), call_next
+    )
+    first_body_sent.set()
+
+    assert ((await first).status_code, second.status_code) == (200, 200)
+
+
+@pytest.mark.asyncio
+async def test_default_verify_batch_verifier():
+    keypair = bittensor.Keypair.create_from_mnemonic(
+        bittensor.Keypair.generate_mnemonic()
+    )
+    config = Axon.config()
+    config.axon.verify_workers = 2
+    axon = Axon(wallet=_get_mock_wallet(), config=config, external_ip="192.0.2.1")
+    synapse = Synapse(
+        dendrite=bittensor.TerminalInfo(
+            nonce=time.time_ns(),
+            uuid="uuid",
+            hotkey=keypair.ss58_address,
+            version=bittensor.__version_as_int__,
+            signature=f"0x{keypair.sign('another message').hex()}",
+        )
+    )
+
+    with pytest.raises(Exception, match="Signature mismatch"):
+        await axon.default_verify(synapse)
+    assert keypair.ss58_address in axon.keypair_cache
+
+    message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{axon.wallet.hotkey.ss58_address}.{synapse.dendrite.uuid}.{synapse.computed_body_hash}"
+    synapse.dendrite.signature = f"0x{keypair.sign(message).hex()}"
+    await axon.default_verify(synapse)
+
+    # Stopping the axon stops the verification threads
+    executor = axon.batch_verifier._executor
+    axon.stop()
+    assert executor._shutdown
+    assert axon.batch_verifier._executor is not executor
+
+
+@pytest.mark.asyncio
+async def test_default_verify_multiple_workers_accepts_out_of_order_nonces():
+    keypair = bittensor.Keypair.create_from_mnemonic(
+        bittensor.Keypair.generate_mnemonic()
+    )
+    axon = Axon(wallet=_get_mock_wallet(), external_ip="192.0.2.1")
+    axon.config.axon.workers = 2
+
+    def signed_synapse(nonce):
+        synapse = Synapse(
+            dendrite=bittensor.TerminalInfo(
+                nonce=nonce,
+                uuid="uuid",
+                hotkey=keypair.ss58_address,
+                version=bittensor.__version_as_int__,
+            )
+        )
+        message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{axon.wallet.hotkey.ss58_address}.{synapse.dendrite.uuid}.{synapse.computed_body_hash}"
+        synapse.dendrite.signature = f"0x{keypair.sign(message).hex()}"
+        return synapse
+
+    now = time.time_ns()
+    later, earlier = signed_synapse(now), signed_synapse(now - 1)
+    await axon.default_verify(later)
+    await axon.default_verify(earlier)
+
+    with pytest.raises(Exception, match="Nonce is too old"):
+        await axon.default_verify(earlier)
+
+
+@pytest.mark.asyncio
+async def test_default_verify_multiple_workers_rejects_replay_with_inflated_timeout(
+    mocker, tmp_path
+):
+    keypair = bittensor.Keypair.create_from_mnemonic(
+        bittensor.Keypair.generate_mnemonic()
+    )
+    axon = Axon(
+        wallet=_get_mock_wallet(),
+        external_ip="192.0.2.1",
+        nonce_store=SQLiteNonceStore(str(tmp_path / "nonces.db")),
+    )
+    axon.config.axon.workers = 2
+    now = time.time_ns()
+    synapse = Synapse(
+        timeout=12.0,
+        dendrite=bittensor.TerminalInfo(
+            nonce=now,
+            uuid="uuid",
+            hotkey=keypair.ss58_address,
+            version=bittensor.__version_as_int__,
+        ),
+    )
+    message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{axon.wallet.hotkey.ss58_address}.{synapse.dendrite.uuid}.{synapse.computed_body_hash}"
+    synapse.dendrite.signature = f"0x{keypair.sign(message).hex()}"
+    await axon.default_verify(synapse)
+
+    # Workers only have the window check once the entry of a nonce has expired
+    mocker.patch("time.time_ns", return_value=nonce_expiry(now, now) + 1)
+    axon.nonces.prune()
+    assert len(axon.nonces) == 0
+    synapse.timeout = 10.0**12
+    with pytest.raises(Exception, match="Nonce is too old"):
+        await axon.default_verify(synapse)
+
+
+def test_axon_metrics_aggregates_workers():
+    metrics = AxonMetrics(num_workers=2)
+    metrics.record(0, 200, 0.5)
+    metrics.record(1, 404, 0.25)
+    metrics.record(1, 500, 0.25)
+
+    assert metrics.worker(0) == {
+        "requests": 1,
+        "status_2xx": 1,
+        "status_4xx": 0,
+        "status_5xx": 0,
+        "process_time": 0.5,
+    }
+    assert metrics.total() == {
+        "requests": 3,
+        "status_2xx": 1,
+        "status_4xx": 1,
+        "status_5xx": 1,
+        "process_time": 1.0,
+    }
+
+
+def test_workers_reject_replayed_nonce():
+    keypair = bittensor.Keypair.create_from_mnemonic(
+        bittensor.Keypair.generate_mnemonic()
+    )
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    config = Axon.config()
+    config.axon.workers = 2
+    axon = Axon(
+        wallet=_get_mock_wallet(), config=config, port=port, external_ip="192.0.2.1"
+    )
+
+    synapse = Synapse(
+        dendrite=bittensor.TerminalInfo(
+            nonce=time.time_ns(),
+            uuid="uuid",
+            hotkey=keypair.ss58_address,
+            version=bittensor.__version_as_int__,
+        )
+    )
+    message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{axon.wallet.hotkey.ss58_address}.{synapse.dendrite.uuid}.{synapse.body_hash}"
+    synapse.dendrite.signature = f"0x{keypair.sign(message).hex()}"
+    headers = synapse.to_headers()
+
+    def post():
+        # A new connection for every request, balanced to either worker.
+        return requests.post(
+            f"http://127.0.0.1:{port}/Synapse",
+            headers={**headers, "Connection": "close"},
+            json={},
+            timeout=5,
+        ).status_code
+
+    axon.start()
+    nonce_store_dir = axon._worker_nonce_store_dir
+    try:
+        deadline = time.time() + 30
+        while True:
+            try:
+                status_codes = [post()]
+                break
+            except requests.ConnectionError:
+                if time.time() > deadline:
+                    raise
+                time.sleep(0.1)
+        status_codes += [post() for _ in range(15)]
+        metrics = [axon.metrics.worker(worker_id) for worker_id in range(2)]
+    finally:
+        axon.stop()
+
+    assert status_codes == [200] + [401] * 15
+    # Both workers served requests, so the replays were rejected across them.
+    assert all(worker["requests"] > 0 for worker in metrics)
+    assert not os.path.exists(nonce_store_dir)
+    assert isinstance(axon.nonces, bittensor.nonce_store.MemoryNonceStore)
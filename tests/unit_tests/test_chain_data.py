@@ -1,7 +1,20 @@
+from dataclasses import replace
+
 import pytest
 import bittensor
 import torch
-from bittensor.chain_data import AxonInfo, ChainDataType, DelegateInfo, NeuronInfo
+from bittensor.chain_data import (
+    AxonInfo,
+    ChainDataType,
+    DelegateInfo,
+    NeuronInfo,
+    NeuronInfoLite,
+    NeuronInfoLiteColumns,
+    create_rpc_scale_object,
+    from_scale_encoding_using_type_string,
+    get_rpc_runtime_config,
+)
+from bittensor.utils.balance import Balance
 
 SS58_FORMAT = bittensor.__ss58_format__
 RAOPERTAO = 10**18
@@ -619,3 +632,154 @@ def test_list_from_vec_u8_error_cases(
     # Act & Assert
     with pytest.raises(expected_exception):
         _ = DelegateInfo.list_from_vec_u8(vec_u8)
+
+
+def test_rpc_runtime_config_is_shared():
+    # Act
+    runtime_config = get_rpc_runtime_config()
+
+    # Assert
+    assert get_rpc_runtime_config() is runtime_config
+    assert runtime_config.get_decoder_class("NeuronInfoLite") is not None
+
+
+def test_create_rpc_scale_object_reuses_decoder_class():
+    # Arrange
+    encoded = create_rpc_scale_object("Vec<(u16, Compact<u64>)>").encode(
+        [(1, 10), (2, 20)]
+    )
+
+    # Act
+    first = create_rpc_scale_object("Vec<(u16, Compact<u64>)>", data=encoded)
+    second = create_rpc_scale_object("Vec<(u16, Compact<u64>)>")
+
+    # Assert
+    assert type(first) is type(second)
+    assert first.runtime_config is get_rpc_runtime_config()
+    assert first.decode() == [(1, 10), (2, 20)]
+    assert from_scale_encoding_using_type_string(
+        list(encoded.data), "Vec<(u16, Compact<u64>)>"
+    ) == [(1, 10), (2, 20)]
+
+
+def test_create_rpc_scale_object_unknown_type():
+    # Act & Assert
+    with pytest.raises(NotImplementedError):
+        create_rpc_scale_object("NotAType")
+
+
+def _encoded_neurons_lite(count):
+    hotkeys = [f"0x{index:064x}" for index in range(1, count + 1)]
+    coldkey = f"0x{255:064x}"
+    neurons = [
+        {
+            "hotkey": hotkeys[uid],
+            "coldkey": coldkey,
+            "uid": uid,
+            "netuid": 1,
+            "active": uid % 2 == 0,
+            "axon_info": {
+                "block": 1,
+                "version": 2,
+                "ip": 3232235777 + uid,
+                "port": 8091,
+                "ip_type": 4,
+                "protocol": 4,
+                "placeholder1": 0,
+                "placeholder2": 0,
+            },
+            "prometheus_info": {
+                "block": 1,
+                "version": 2,
+                "ip": 0,
+                "port": 0,
+                "ip_type": 0,
+            },
+            "stake": [(coldkey, 10**9 * uid), (hotkeys[0], 2**60)][: uid % 3],
+            "rank": 65535,
+            "emission": 10**9 + uid,
+            "incentive": uid,
+            "consensus": 2**15,
+            "trust": 2**14,
+            "validator_trust": 0,
+            "dividends": 65534,
+            "last_update": 2**40 + uid,
+            "validator_permit": uid % 2 == 1,
+            "pruning_score": 7,
+        }
+        for uid in range(count)
+    ]
+    return list(create_rpc_scale_object("Vec<NeuronInfoLite>").encode(neurons).data)
+
+
+def test_neuron_info_lite_columns_from_vec_u8():
+    # Arrange
+    vec_u8 = _encoded_neurons_lite(5)
+    neurons = NeuronInfoLite.list_from_vec_u8(vec_u8)
+
+    # Act
+    columns = NeuronInfoLiteColumns.from_vec_u8(vec_u8)
+
+    # Assert
+    assert len(columns) == 5
+    assert len(columns.keys) == 6
+    assert columns.hotkeys == [neuron.hotkey for neuron in neurons]
+    assert columns.coldkeys == [neuron.coldkey for neuron in neurons]
+    assert columns.uid.tolist() == [neuron.uid for neuron in neurons]
+    assert columns.trust.tolist() == [neuron.trust for neuron in neurons]
+    assert columns.emission.tolist() == [neuron.emission for neuron in neurons]
+    assert columns.last_update.tolist() == [neuron.last_update for neuron in neurons]
+    assert columns.stake.tolist() == [float(neuron.stake) for neuron in neurons]
+    assert columns.axons() == [neuron.axon_info for neuron in neurons]
+    assert columns.to_neurons() == neurons
+    assert NeuronInfoLiteColumns.from_neurons(neurons).to_neurons() == neurons
+
+
+@pytest.mark.parametrize("vec_u8", [[], [0]])
+def test_neuron_info_lite_columns_empty(vec_u8):
+    # Act
+    columns = NeuronInfoLiteColumns.from_vec_u8(vec_u8)
+
+    # Assert
+    assert len(columns) == 0
+    assert columns.to_neurons() == []
+
+
+def test_neuron_info_lite_columns_truncated():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        NeuronInfoLiteColumns.from_vec_u8(_encoded_neurons_lite(2)[:-10])
+
+
+def test_neuron_info_lite_columns_changed():
+    # Arrange
+    vec_u8 = _encoded_neurons_lite(6)
+    neurons = NeuronInfoLite.list_from_vec_u8(vec_u8)
+    columns = NeuronInfoLiteColumns.from_vec_u8(vec_u8)
+    neurons[1] = replace(neurons[1], hotkey="hotkey_1")
+    neurons[2] = replace(neurons[2], trust=0.5)
+    # The same total stake, staked by the two coldkeys the other way around.
+    coldkeys, stakes = zip(*neurons[5].stake_dict.items())
+    neurons[5] = replace(neurons[5], stake_dict=dict(zip(coldkeys, reversed(stakes))))
+
+    # Act
+    changed = columns.changed(NeuronInfoLiteColumns.from_neurons(neurons))
+
+    # Assert
+    assert changed.tolist() == [1, 2, 5]
+    assert columns.changed(NeuronInfoLiteColumns.from_vec_u8(vec_u8)).tolist() == []
+    with pytest.raises(ValueError):
+        columns.changed(columns.take([0, 1]))
+
+
+def test_neuron_info_lite_columns_take():
+    # Arrange
+    vec_u8 = _encoded_neurons_lite(5)
+    neurons = NeuronInfoLite.list_from_vec_u8(vec_u8)
+    columns = NeuronInfoLiteColumns.from_vec_u8(vec_u8)
+
+    # Act
+    taken = columns.take([3, 1])
+
+    # Assert
+    assert taken.to_neurons() == [neurons[3], neurons[1]]
@@ -17,6 +17,9 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import asyncio
+import json
+
 from pydantic import ValidationError
 import pytest
 import typing
@@ -24,6 +27,8 @@ import bittensor
 from unittest.mock import MagicMock, Mock
 from tests.helpers import _get_mock_wallet
 
+from bittensor.dendrite import BroadcastRequest, ConnectorProfile
+from bittensor.latency import LatencyPolicy
 from bittensor.synapse import TerminalInfo
 
 
@@ -287,6 +292,190 @@ def test_terminal_info_error_cases(
         )
 
 
+@pytest.mark.asyncio
+async def test_dendrite__call__records_synapse_history(axon_info, mock_aioresponse):
+    dendrite_obj = bittensor.dendrite(
+        _get_mock_wallet(), synapse_history="records", synapse_history_size=2
+    )
+    response_synapse = SynapseDummy(
+        input=1,
+        output=2,
+        axon=TerminalInfo(status_code=200, hotkey=axon_info.hotkey),
+    )
+    for _ in range(3):
+        mock_aioresponse.post(
+            f"http://127.0.0.1:666/SynapseDummy", body=response_synapse.json()
+        )
+        await dendrite_obj.call(axon_info, synapse=SynapseDummy(input=1))
+
+    assert len(dendrite_obj.synapse_history) == 2
+    record = dendrite_obj.synapse_history[-1]
+    assert record["status_code"] == 200
+    assert record["hotkey"] == axon_info.hotkey
+    assert record["total_size"] > 0
+    stats = dendrite_obj.synapse_history.latency_stats()
+    assert stats[axon_info.hotkey]["count"] == 2
+    assert stats[axon_info.hotkey]["success_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_dendrite_session_uses_connector_profile():
+    profile = ConnectorProfile(limit=10, limit_per_host=2, use_dns_cache=False)
+    dendrite_obj = bittensor.dendrite(_get_mock_wallet(), connector_profile=profile)
+    assert dendrite_obj.pool_stats()["opened"] == 0
+
+    session = await dendrite_obj.session
+    assert session.connector.limit == 10
+    assert session.connector.limit_per_host == 2
+    assert not session.connector.use_dns_cache
+    await dendrite_obj.aclose_session()
+
+
+@pytest.mark.asyncio
+async def test_dendrite_warm_pool(setup_dendrite):
+    async def handle(reader, writer):
+        # Answers every request on the connection, keeping it alive.
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n")
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    axons = [
+        bittensor.AxonInfo(
+            version=1,
+            ip="127.0.0.1",
+            port=port,
+            ip_type=4,
+            hotkey="hot",
+            coldkey="cold",
+        ),
+        bittensor.AxonInfo(
+            version=1, ip="0.0.0.0", port=port, ip_type=4, hotkey="", coldkey=""
+        ),
+    ]
+    try:
+        assert await setup_dendrite.warm_pool(axons) == 1
+        stats = setup_dendrite.pool_stats()
+        assert (stats["opened"], stats["reused"], stats["in_flight"]) == (1, 0, 0)
+        # The pooled connection is reused instead of opening a new one.
+        assert await setup_dendrite.warm_pool(axons) == 0
+        stats = setup_dendrite.pool_stats()
+        assert (stats["opened"], stats["reused"], stats["in_flight"]) == (1, 1, 0)
+    finally:
+        await setup_dendrite.aclose_session()
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_dendrite__forward__quorum(setup_dendrite, mocker):
+    axons = [
+        bittensor.AxonInfo(
+            version=1,
+            ip="127.0.0.1",
+            port=port,
+            ip_type=4,
+            hotkey=f"hot{port}",
+            coldkey="cold",
+        )
+        for port in range(3)
+    ]
+
+    async def call(target_axon, synapse, timeout, deserialize, broadcast_request):
+        try:
+            await asyncio.sleep(10 if target_axon.port == 2 else 0)
+            synapse.dendrite = TerminalInfo(status_code=200)
+        except asyncio.CancelledError:
+            synapse.dendrite = TerminalInfo(status_code=408)
+        return synapse
+
+    mocker.patch.object(setup_dendrite, "call", side_effect=call)
+    responses = await setup_dendrite.forward(
+        axons,
+        SynapseDummy(input=1),
+        deserialize=False,
+        latency_policy=LatencyPolicy(quorum=2),
+    )
+    assert [response.dendrite.status_code for response in responses] == [
+        200,
+        200,
+        408,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_dendrite__forward__adaptive_timeout(setup_dendrite, mocker):
+    for _ in range(10):
+        setup_dendrite.latency_tracker.observe("hot", 0.1)
+    call = mocker.patch.object(
+        setup_dendrite,
+        "call",
+        return_value=SynapseDummy(
+            input=1, dendrite=TerminalInfo(status_code=200), output=2
+        ),
+    )
+    axon = bittensor.AxonInfo(
+        version=1, ip="127.0.0.1", port=666, ip_type=4, hotkey="hot", coldkey="cold"
+    )
+
+    responses = await setup_dendrite.forward(
+        [axon], SynapseDummy(input=1), latency_policy=LatencyPolicy(min_timeout=0.5)
+    )
+    assert responses[0].output == 2
+    assert call.call_args.kwargs["timeout"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_dendrite__as_completed(setup_dendrite, mocker):
+    axons = [
+        bittensor.AxonInfo(
+            version=1,
+            ip="127.0.0.1",
+            port=port,
+            ip_type=4,
+            hotkey=f"hot{port}",
+            coldkey="cold",
+        )
+        for port in (3, 1, 2)
+    ]
+    cancelled = []
+    released = {axon.port: asyncio.Event() for axon in axons}
+
+    async def call(target_axon, synapse, timeout, deserialize, broadcast_request):
+        try:
+            await released[target_axon.port].wait()
+        except asyncio.CancelledError:
+            cancelled.append(target_axon.port)
+            raise
+        synapse.output = target_axon.port
+        return synapse
+
+    mocker.patch.object(setup_dendrite, "call", side_effect=call)
+
+    iterator = setup_dendrite.as_completed(axons, SynapseDummy(input=1))
+    completed = []
+    for port in (1, 2, 3):
+        released[port].set()
+        axon, response = await iterator.__anext__()
+        completed.append((axon.port, response.output))
+    assert completed == [(1, 1), (2, 2), (3, 3)]
+    with pytest.raises(StopAsyncIteration):
+        await iterator.__anext__()
+
+    for event in released.values():
+        event.clear()
+    released[1].set()
+    iterator = setup_dendrite.as_completed(axons, SynapseDummy(input=1))
+    axon, _ = await iterator.__anext__()
+    assert axon.port == 1
+    await iterator.aclose()
+    await asyncio.sleep(0)
+    assert sorted(cancelled) == [2, 3]
+
+
 @pytest.mark.asyncio
 async def test_dendrite__call__success_response(
     axon_info, dendrite_obj, mock_aioresponse
@@ -334,3 +523,129 @@ async def test_dendrite__call__handles_http_error_response(
 
     assert synapse.axon.status_code == synapse.dendrite.status_code == status_code
     assert synapse.axon.status_message == synapse.dendrite.status_message == message
+
+
+@pytest.mark.asyncio
+async def test_dendrite__call__broadcast_request(
+    axon_info, dendrite_obj, mock_aioresponse
+):
+    mock_aioresponse.post(
+        f"http://127.0.0.1:666/SynapseDummy",
+        body=SynapseDummy(input=1, output=2, axon=TerminalInfo(status_code=200)).json(),
+    )
+    input_synapse = SynapseDummy(input=1)
+    input_synapse.timeout = 5.0
+    broadcast_request = BroadcastRequest.from_synapse(input_synapse)
+
+    synapse = await dendrite_obj.call(
+        axon_info,
+        synapse=input_synapse.model_copy(),
+        timeout=5.0,
+        broadcast_request=broadcast_request,
+    )
+    assert synapse.output == 2
+    assert synapse.dendrite.status_code == 200
+
+    # Only the terminal information is encoded per target
+    request = next(iter(mock_aioresponse.requests.values()))[0]
+    headers, body = request.kwargs["headers"], json.loads(request.kwargs["data"])
+    assert headers["Content-Type"] == "application/json"
+    assert headers["computed_body_hash"] == input_synapse.body_hash
+    input_obj_header = input_synapse.to_headers()["bt_header_input_obj_input"]
+    assert headers["bt_header_input_obj_input"] == input_obj_header
+    assert headers["bt_header_axon_hotkey"] == body["axon"]["hotkey"] == "hot"
+    assert headers["bt_header_dendrite_signature"] == body["dendrite"]["signature"]
+    assert SynapseDummy(**body).body_hash == input_synapse.body_hash
+
+
+def test_broadcast_request_hashed_terminal_fields():
+    class TerminalHashedSynapse(bittensor.Synapse):
+        required_hash_fields: typing.ClassVar[typing.Tuple[str, ...]] = ("dendrite",)
+
+    assert BroadcastRequest.from_synapse(TerminalHashedSynapse()) is None
+    assert BroadcastRequest.from_synapse(SynapseDummy(input=1)) is not None
+
+
+@pytest.mark.asyncio
+async def test_dendrite__call__negotiates_msgpack(
+    axon_info, dendrite_obj, mock_aioresponse
+):
+    response_synapse = SynapseDummy(
+        input=1, output=2, axon=TerminalInfo(status_code=200)
+    )
+    url = "http://127.0.0.1:666/SynapseDummy"
+    mock_aioresponse.post(
+        url, body=response_synapse.to_msgpack(), content_type="application/msgpack"
+    )
+    mock_aioresponse.post(url, body=response_synapse.json())
+
+    # JSON is sent until the axon answered in msgpack
+    synapse = await dendrite_obj.call(axon_info, synapse=SynapseDummy(input=1))
+    assert synapse.output == 2
+    assert synapse.dendrite.status_code == 200
+
+    input_synapse = SynapseDummy(input=1)
+    await dendrite_obj.call(axon_info, synapse=input_synapse)
+
+    first, second = next(iter(mock_aioresponse.requests.values()))
+    assert "json" in first.kwargs
+    assert first.kwargs["headers"]["Accept"].startswith("application/msgpack")
+    headers = second.kwargs["headers"]
+    assert headers["Content-Type"] == "application/msgpack"
+    body = bittensor.Synapse.decode_body(second.kwargs["data"], "application/msgpack")
+    assert SynapseDummy(**body).body_hash == headers["computed_body_hash"]
+
+    # The axon answered the msgpack request in JSON, fall back to JSON
+    assert dendrite_obj._request_content_type(axon_info) == "application/json"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status, keeps_msgpack", [(200, False), (500, True)])
+async def test_read_response_body_json_fallback(
+    axon_info, dendrite_obj, status, keeps_msgpack
+):
+    dendrite_obj._msgpack_endpoints.add(dendrite_obj._endpoint_key(axon_info))
+    response = MagicMock(status=status, content_type="application/json")
+    response.json = AsyncMock(return_value={"message": "Internal Server Error"})
+
+    await dendrite_obj._read_response_body(response, axon_info, "application/msgpack")
+
+    # Errors are always answered in JSON, only successful ones show the axon stopped speaking msgpack
+    assert (
+        dendrite_obj._request_content_type(axon_info) == "application/msgpack"
+    ) is keeps_msgpack
+
+
+def test_dendrite_wire_format(axon_info):
+    dendrite = bittensor.dendrite(_get_mock_wallet(), wire_format="json")
+    payload = dendrite._build_request_payload(SynapseDummy(input=1))
+    assert "Accept" not in payload["headers"]
+
+    with pytest.raises(ValueError):
+        bittensor.dendrite(_get_mock_wallet(), wire_format="xml")
+
+
+def test_broadcast_request_msgpack_body(dendrite_obj, axon_info):
+    input_synapse = SynapseDummy(input=1)
+    input_synapse.timeout = 5.0
+    broadcast_request = BroadcastRequest.from_synapse(input_synapse)
+
+    synapse = dendrite_obj.preprocess_synapse_for_request(
+        axon_info, input_synapse.model_copy(), 5.0
+    )
+    body = broadcast_request.body(synapse, "application/msgpack")
+    assert bittensor.Synapse.decode_body(
+        body, "application/msgpack"
+    ) == bittensor.Synapse.decode_body(synapse.to_msgpack(), "application/msgpack")
+
+
+def test_dendrite_log_skips_disabled_trace(dendrite_obj, axon_info, mocker):
+    synapse = dendrite_obj.preprocess_synapse_for_request(
+        axon_info, SynapseDummy(input=1)
+    )
+    get_total_size = mocker.patch.object(SynapseDummy, "get_total_size")
+    mocker.patch.object(bittensor.logging, "isEnabledFor", return_value=False)
+
+    dendrite_obj._log_outgoing_request(synapse)
+
+    get_total_size.assert_not_called()
@@ -0,0 +1,91 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import pytest
+
+from bittensor.latency import LatencyPolicy, LatencyTracker
+
+
+def test_tracker_quantiles():
+    tracker = LatencyTracker()
+    assert tracker.quantile("A", 0.5) is None
+
+    for _ in range(90):
+        tracker.observe("A", 0.1)
+    for _ in range(10):
+        tracker.observe("A", 2.0)
+
+    assert tracker.count("A") == 100
+    assert 0.1 <= tracker.quantile("A", 0.5) < 0.2
+    assert 2.0 <= tracker.quantile("A", 0.95) < 2.5
+    assert "B" not in tracker
+
+
+def test_tracker_window_decays_counts():
+    tracker = LatencyTracker(window=10)
+    for _ in range(10):
+        tracker.observe("A", 0.1)
+    assert tracker.count("A") == 5
+
+
+def test_tracker_max_hotkeys():
+    tracker = LatencyTracker(max_hotkeys=2)
+    for hotkey in "ABC":
+        tracker.observe(hotkey, 0.1)
+    assert len(tracker) == 2
+    assert "A" not in tracker
+
+
+def test_policy_timeout():
+    tracker = LatencyTracker()
+    policy = LatencyPolicy(quantile=0.9, multiplier=2.0, min_timeout=0.5, min_samples=5)
+    for _ in range(4):
+        tracker.observe("A", 1.0)
+    # Too few samples, the full timeout is used.
+    assert policy.timeout(tracker, "A", 12.0) == 12.0
+
+    tracker.observe("A", 1.0)
+    assert 2.0 <= policy.timeout(tracker, "A", 12.0) < 2.5
+    assert policy.timeout(tracker, "A", 1.5) == 1.5
+
+    for _ in range(100):
+        tracker.observe("B", 0.01)
+    assert policy.timeout(tracker, "B", 12.0) == 0.5
+
+
+def test_policy_hedge_delay():
+    tracker = LatencyTracker()
+    for _ in range(10):
+        tracker.observe("A", 1.0)
+    assert LatencyPolicy().hedge_delay(tracker, "A", 12.0) is None
+    policy = LatencyPolicy(hedge_quantile=0.5)
+    assert 1.0 <= policy.hedge_delay(tracker, "A", 12.0) < 1.2
+    assert policy.hedge_delay(tracker, "A", 1.0) is None
+
+
+@pytest.mark.parametrize(
+    "quorum, num_axons, expected",
+    [(None, 10, None), (3, 10, 3), (30, 10, 10), (0.5, 10, 5), (0.25, 10, 3)],
+)
+def test_policy_quorum_size(quorum, num_axons, expected):
+    assert LatencyPolicy(quorum=quorum).quorum_size(num_axons) == expected
+
+
+@pytest.mark.parametrize("quorum", [0, 0.0, -1])
+def test_policy_quorum_must_be_positive(quorum):
+    with pytest.raises(ValueError):
+        LatencyPolicy(quorum=quorum)
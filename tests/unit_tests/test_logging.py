@@ -1,9 +1,12 @@
 import pytest
 import multiprocessing
+import queue
 import logging as stdlogging
 from unittest.mock import MagicMock, patch
 from bittensor.btlogging import LoggingMachine
 from bittensor.btlogging.defines import DEFAULT_LOG_FILE_NAME, BITTENSOR_LOGGER_NAME
+from bittensor.btlogging.format import TRACE_LEVEL_NUM
+from bittensor.btlogging.handlers import BatchingQueueHandler, BatchingQueueListener
 from bittensor.btlogging.loggingmachine import LoggingConfig
 
 
@@ -168,3 +171,143 @@ def test_all_log_levels_output(logging_machine, caplog):
     assert "Test warning" in caplog.text
     assert "Test error" in caplog.text
     assert "Test critical" in caplog.text
+
+
+def test_disabled_levels_skip_formatting(logging_machine, caplog):
+    """
+    Test that messages of disabled levels are neither formatted nor passed to the logger.
+    """
+    logging_machine.set_trace()
+    logging_machine.set_trace(False)
+    assert not logging_machine.isEnabledFor(TRACE_LEVEL_NUM)
+    assert logging_machine.isEnabledFor(stdlogging.INFO)
+
+    with patch.object(logging_machine._logger, "trace") as trace:
+        logging_machine.trace("Test trace")
+    trace.assert_not_called()
+
+    logging_machine.set_trace()
+    assert logging_machine.isEnabledFor(TRACE_LEVEL_NUM)
+    logging_machine.trace("Test trace")
+    assert "Test trace" in caplog.text
+
+
+def _record(msg):
+    return stdlogging.LogRecord("test", stdlogging.INFO, __file__, 1, msg, None, None)
+
+
+def test_batching_queue_handler_ships_batches():
+    """
+    Test that records are put on the queue in batches of batch_size, and that flush ships the rest.
+    """
+    q = queue.Queue()
+    handler = BatchingQueueHandler(q, batch_size=3, flush_interval=60)
+    for index in range(4):
+        handler.handle(_record(f"message {index}"))
+
+    batch = q.get_nowait()
+    assert [record.msg for record in batch] == ["message 0", "message 1", "message 2"]
+    assert q.empty()
+    assert handler.stats() == {"queued": 3, "batches": 1, "pending": 1, "dropped": 0}
+
+    handler.flush()
+    assert [record.msg for record in q.get_nowait()] == ["message 3"]
+
+    handler.handle(
+        stdlogging.makeLogRecord({"msg": "boom", "levelno": stdlogging.ERROR})
+    )
+    assert [record.msg for record in q.get_nowait()] == ["boom"]
+    handler.close()
+
+
+def test_batching_queue_handler_drops_oldest_when_queue_is_full():
+    """
+    Test that the records wait while the queue is full, and that the oldest are dropped past max_pending.
+    """
+    q = queue.Queue(maxsize=1)
+    handler = BatchingQueueHandler(q, batch_size=2, flush_interval=60, max_pending=4)
+    for index in range(8):
+        handler.handle(_record(f"message {index}"))
+
+    assert handler.stats() == {"queued": 2, "batches": 1, "pending": 4, "dropped": 2}
+    assert [record.msg for record in q.get_nowait()] == ["message 0", "message 1"]
+
+    handler.flush()
+    assert [record.msg for record in q.get_nowait()] == ["message 4", "message 5"]
+    handler.close()
+    assert [record.msg for record in q.get_nowait()] == ["message 6", "message 7"]
+    assert handler.stats()["dropped"] == 2
+
+
+def test_batching_queue_handler_bounds_batches_in_flight():
+    """
+    Test that an unbounded queue only takes batches while the listener frees slots of in_flight.
+    """
+    q = queue.Queue()
+    in_flight = multiprocessing.Semaphore(1)
+    handler = BatchingQueueHandler(
+        q, batch_size=2, flush_interval=60, max_pending=4, in_flight=in_flight
+    )
+    for index in range(8):
+        handler.handle(_record(f"message {index}"))
+
+    assert handler.stats() == {"queued": 2, "batches": 1, "pending": 4, "dropped": 2}
+    assert q.qsize() == 1
+
+    target = MagicMock(level=stdlogging.NOTSET)
+    listener = BatchingQueueListener(q, target, in_flight=in_flight)
+    listener.start()
+    handler.close()
+    listener.stop()
+
+    assert [call.args[0].msg for call in target.handle.call_args_list] == [
+        "message 0",
+        "message 1",
+        "message 4",
+        "message 5",
+        "message 6",
+        "message 7",
+    ]
+    assert handler.stats()["dropped"] == 2
+
+
+def test_batching_queue_handler_flushes_after_interval():
+    """
+    Test that buffered records are shipped by the background thread after flush_interval.
+    """
+    q = queue.Queue()
+    handler = BatchingQueueHandler(q, batch_size=100, flush_interval=0.01)
+    handler.handle(_record("message"))
+
+    assert [record.msg for record in q.get(timeout=5)] == ["message"]
+    handler.close()
+
+
+def test_batching_queue_listener_handles_batches_and_records():
+    """
+    Test that the listener handles both the batches of BatchingQueueHandler and single records.
+    """
+    q = queue.Queue()
+    target = MagicMock(level=stdlogging.NOTSET)
+    listener = BatchingQueueListener(q, target)
+    listener.start()
+    q.put([_record("first"), _record("second")])
+    q.put(_record("third"))
+    listener.stop()
+
+    assert [call.args[0].msg for call in target.handle.call_args_list] == [
+        "first",
+        "second",
+        "third",
+    ]
+
+
+def test_logging_machine_queue_stats(logging_machine):
+    """
+    Test that the records of the logging machine are counted by queue_stats.
+    """
+    logging_machine.info("Test info")
+    logging_machine._queue_handler.flush()
+    stats = logging_machine.queue_stats()
+    assert stats["queued"] >= 1
+    assert stats["dropped"] == 0
@@ -15,12 +15,28 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import os
+import time
+from dataclasses import replace
 from unittest.mock import Mock
 import pytest
 import numpy as np
 import bittensor
 
-from bittensor.metagraph import metagraph as Metagraph
+from bittensor.chain_data import (
+    AxonInfo,
+    NeuronInfoLite,
+    NeuronInfoLiteColumns,
+    PrometheusInfo,
+)
+from bittensor.metagraph import (
+    SNAPSHOT_GRACE_PERIOD,
+    latest_block_path,
+    load_snapshot,
+    metagraph as Metagraph,
+    save_snapshot,
+)
+from bittensor.utils.balance import Balance
 from unittest.mock import MagicMock
 
 
@@ -124,6 +140,27 @@ def test_process_weights_or_bonds(mock_environment):
     # TODO: Add more checks to ensure the bonds have been processed correctly
 
 
+def test_set_weights_and_bonds_densifies_lazily(mock_environment):
+    _, neurons = mock_environment
+    metagraph = bittensor.metagraph(1, sync=False)
+    metagraph.neurons = neurons
+
+    metagraph._set_weights_and_bonds()
+
+    assert "weights" not in vars(metagraph)
+    assert metagraph.weights_csr.nnz == metagraph.bonds_csr.nnz == 5 * len(neurons)
+    assert metagraph.W.shape == metagraph.B.shape == (len(neurons), len(neurons))
+    assert np.allclose(metagraph.W, metagraph.weights_csr.todense())
+    assert np.allclose(metagraph.W[:, :5].sum(axis=1), 1)
+    assert np.array_equal(metagraph.B, metagraph.bonds_csr.todense(np.float32))
+
+    # An assigned matrix is kept instead of the synced one.
+    metagraph._set_weights_and_bonds()
+    metagraph.weights = np.zeros((1, 1), dtype=np.float32)
+    assert metagraph.W.shape == (1, 1)
+    assert metagraph.state_dict()["bonds"].shape == (len(neurons), len(neurons))
+
+
 # Mocking the bittensor.subtensor class for testing purposes
 @pytest.fixture
 def mock_subtensor():
@@ -173,3 +210,178 @@ def test_sync_warning_cases(block, test_id, metagraph_instance, mock_subtensor,
     assert (
         expected_message in caplog.text
     ), f"Test ID: {test_id} - Expected warning message not found in Loguru sink."
+
+
+@pytest.mark.parametrize(
+    "synced_block, synced_lite, lite, blocks_since_last_step",
+    [
+        (None, True, True, 100),
+        (590, False, True, 100),
+        (610, True, True, 100),
+        (590, False, False, 5),
+        (590, False, False, None),
+    ],
+    ids=[
+        "never_synced",
+        "lite_changed",
+        "older_block",
+        "epoch_since_sync",
+        "subnet_missing",
+    ],
+)
+def test_incremental_sync_falls_back_to_full_sync(
+    synced_block,
+    synced_lite,
+    lite,
+    blocks_since_last_step,
+    metagraph_instance,
+    mock_subtensor,
+):
+    metagraph_instance._synced_block = synced_block
+    metagraph_instance.lite = synced_lite
+    mock_subtensor.blocks_since_last_step.return_value = blocks_since_last_step
+
+    metagraph_instance.sync(lite=lite, subtensor=mock_subtensor, incremental=True)
+
+    metagraph_instance._assign_neurons.assert_called_once_with(
+        601, lite, mock_subtensor
+    )
+    mock_subtensor.neurons_lite_columns.assert_not_called()
+    mock_subtensor.neuron_for_uid.assert_not_called()
+    assert metagraph_instance._synced_block == 601
+
+
+def test_lite_sync_reads_neuron_columns(mock_environment, mocker):
+    subtensor, _ = mock_environment
+    hotkeys = [f"hotkey_{i}" for i in range(3)]
+    neurons = [
+        replace(
+            NeuronInfoLite.get_null_neuron(),
+            uid=i,
+            hotkey=hotkeys[i],
+            coldkey="coldkey",
+            trust=i / 4,
+            stake=Balance.from_rao(10**9 * i),
+            stake_dict={"coldkey": Balance.from_rao(10**9 * i)},
+            total_stake=Balance.from_rao(10**9 * i),
+            prometheus_info=PrometheusInfo(0, 0, "0.0.0.0", 0, 0),
+            axon_info=AxonInfo(1, "127.0.0.1", 8091 + i, 4, hotkeys[i], "coldkey"),
+            is_null=False,
+        )
+        for i in range(3)
+    ]
+    subtensor.neurons_lite_columns.return_value = NeuronInfoLiteColumns.from_neurons(
+        neurons
+    )
+    to_neurons = mocker.spy(NeuronInfoLiteColumns, "to_neurons")
+
+    metagraph = bittensor.metagraph(1, sync=False)
+    metagraph._assign_neurons(block=5, lite=True, subtensor=subtensor)
+    metagraph._set_metagraph_attributes(block=5, subtensor=subtensor)
+
+    subtensor.neurons_lite.assert_not_called()
+    assert metagraph.n.item() == 3
+    assert metagraph.uids.tolist() == [0, 1, 2]
+    assert metagraph.trust.tolist() == [0.0, 0.25, 0.5]
+    assert metagraph.S.tolist() == [0.0, 1.0, 2.0]
+    assert metagraph.hotkeys == hotkeys
+    to_neurons.assert_not_called()
+
+    assert metagraph.axons == [neuron.axon_info for neuron in neurons]
+    assert metagraph.neurons == neurons
+    to_neurons.assert_called_once()
+
+
+def _snapshot_names(path):
+    return sorted(p.name for p in path.iterdir() if not p.name.startswith("."))
+
+
+def test_snapshot_round_trip(tmp_path):
+    axons = [
+        AxonInfo(1, f"192.168.0.{i % 2}", 8091 + i, 4, f"hotkey_{i}", "coldkey")
+        for i in range(3)
+    ]
+    state_dict = {
+        "netuid": 1,
+        "network": "mock",
+        "version": (np.array([7], dtype=np.int64),),
+        "n": np.array(3, dtype=np.int64),
+        "block": np.array(10, dtype=np.int64),
+        "stake": np.array([1.0, 2.0, 3.0], dtype=np.float32),
+        "validator_permit": np.array([True, False, True]),
+        "weights": np.eye(3, dtype=np.float32),
+        "axons": axons,
+    }
+
+    save_snapshot(str(tmp_path / "block-10"), state_dict)
+    loaded = load_snapshot(str(tmp_path / "block-10"))
+
+    assert _snapshot_names(tmp_path) == ["block-10"]
+    assert isinstance(loaded["stake"], np.memmap)
+    assert loaded["n"].item() == 3
+    assert loaded["block"].item() == 10
+    assert np.array_equal(loaded["stake"], state_dict["stake"])
+    assert np.array_equal(loaded["validator_permit"], state_dict["validator_permit"])
+    assert np.array_equal(loaded["weights"], state_dict["weights"])
+    assert loaded["axons"] == axons
+
+    # Changes to the loaded arrays are not written back to the snapshot.
+    loaded["stake"][0] = 5
+    assert load_snapshot(str(tmp_path / "block-10"))["stake"][0] == 1
+
+
+def test_snapshot_replaces_existing_snapshot(tmp_path, mocker):
+    path = str(tmp_path / "block-10")
+    stake = np.array([1.0, 2.0], dtype=np.float32)
+    save_snapshot(path, {"stake": stake})
+    data_dir = os.path.realpath(path)
+    loaded = load_snapshot(path)
+
+    # A snapshot holding the same data is not rewritten.
+    save_snapshot(path, {"stake": stake.copy()})
+    assert os.path.realpath(path) == data_dir
+
+    # Otherwise the new one is swapped in place of the previous one.
+    weights = np.eye(2, dtype=np.float32)
+    save_snapshot(path, {"stake": stake * 2})
+    assert np.array_equal(load_snapshot(path)["stake"], stake * 2)
+    save_snapshot(path, {"stake": stake * 3, "weights": weights})
+    assert np.array_equal(load_snapshot(path)["stake"], stake * 3)
+    assert np.array_equal(load_snapshot(path)["weights"], weights)
+    assert _snapshot_names(tmp_path) == ["block-10"]
+    # Processes still loading a replaced snapshot can read all of its files.
+    assert np.array_equal(loaded["stake"], stake)
+    assert np.array_equal(load_snapshot(data_dir)["stake"], stake)
+
+    # Replaced data directories are deleted by a later save after their grace period.
+    replaced = [p for p in tmp_path.iterdir() if p.name.startswith(".")]
+    assert len(replaced) == 3
+    expired = time.time() - SNAPSHOT_GRACE_PERIOD - 1
+    os.utime(data_dir, (expired, expired))
+    save_snapshot(str(tmp_path / "block-11"), {"stake": stake})
+    assert not os.path.exists(data_dir)
+    assert len(list(tmp_path.iterdir())) == 5
+
+    # The previous snapshot is kept if the new one cannot be swapped in.
+    mocker.patch("bittensor.metagraph.os.replace", side_effect=OSError("failed"))
+    with pytest.raises(OSError):
+        save_snapshot(path, {"stake": stake, "weights": weights, "bonds": weights})
+    assert np.array_equal(load_snapshot(path)["stake"], stake * 3)
+    assert len(list(tmp_path.iterdir())) == 5
+
+
+def test_latest_block_path_prefers_snapshot(tmp_path):
+    (tmp_path / "block-9").mkdir()
+    (tmp_path / "block-10.pt").write_bytes(b"")
+    (tmp_path / "block-10").mkdir()
+    (tmp_path / ".tmp-snapshot-11").mkdir()
+
+    assert latest_block_path(str(tmp_path)) == str(tmp_path / "block-10")
+
+
+def test_load_snapshot_unsupported_format(tmp_path):
+    save_snapshot(str(tmp_path / "block-1"), {"n": np.array(0), "axons": []})
+    (tmp_path / "block-1" / "metadata.json").write_text('{"format": 0}')
+
+    with pytest.raises(ValueError):
+        load_snapshot(str(tmp_path / "block-1"))
@@ -0,0 +1,125 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import os
+
+import numpy as np
+import pytest
+
+import bittensor
+from bittensor.chain_data import AxonInfo
+from bittensor.metagraph_history import HISTORY_COLUMNS, MetagraphHistory
+
+
+def _metagraph(block, stake, hotkeys=None):
+    n = len(stake)
+    hotkeys = hotkeys or [f"hotkey_{uid}" for uid in range(n)]
+    state_dict = {name: np.zeros(n, dtype=np.float32) for name in HISTORY_COLUMNS}
+    state_dict.update(
+        n=np.array(n, dtype=np.int64),
+        block=np.array(block, dtype=np.int64),
+        uids=np.arange(n, dtype=np.int64),
+        stake=np.array(stake, dtype=np.float32),
+        last_update=np.full(n, block, dtype=np.int64),
+        validator_permit=np.arange(n) % 2 == 0,
+        axons=[
+            AxonInfo(1, "127.0.0.1", 8091 + uid, 4, hotkeys[uid], "coldkey")
+            for uid in range(n)
+        ],
+    )
+    return bittensor.metagraph(netuid=1, network="mock", sync=False)._load_state(
+        state_dict
+    )
+
+
+@pytest.fixture
+def history(tmp_path):
+    return MetagraphHistory(
+        netuid=1,
+        network="mock",
+        path=str(tmp_path / "history.bin"),
+        keyframe_interval=3,
+    )
+
+
+def test_append_writes_keyframes_and_deltas(history):
+    for block in range(10, 17):
+        history.append(_metagraph(block, [block, 1.0, 2.0]))
+    history.append(_metagraph(17, [17, 1.0, 2.0, 3.0]))
+
+    assert history.blocks.tolist() == list(range(10, 18))
+    assert history._keyframes == [0, 3, 6, 7]
+    # The deltas only hold the changed stake and last_update of the first neuron.
+    assert history._arrays[1]["stake.uids"][2] == 1
+    assert "trust" not in history._arrays[1]
+
+
+def test_at_rebuilds_metagraph(history, tmp_path):
+    metagraphs = [
+        _metagraph(10, [1.0, 2.0]),
+        _metagraph(12, [1.0, 3.0], hotkeys=["hotkey_0", "new_hotkey"]),
+        _metagraph(13, [4.0, 3.0, 5.0]),
+    ]
+    for metagraph in metagraphs:
+        history.append(metagraph)
+
+    reopened = MetagraphHistory(netuid=1, network="mock", path=history.path)
+    for block, metagraph in zip((11, 12, 20), (metagraphs[0], *metagraphs[1:])):
+        rebuilt = reopened.at(block)
+        assert rebuilt.block.item() == metagraph.block.item()
+        assert rebuilt.hotkeys == metagraph.hotkeys
+        assert rebuilt.axons == metagraph.axons
+        assert np.array_equal(rebuilt.S, metagraph.S)
+        assert np.array_equal(rebuilt.validator_permit, metagraph.validator_permit)
+    with pytest.raises(KeyError):
+        reopened.at(9)
+
+
+def test_stake_range(history):
+    for block in range(10, 20):
+        history.append(_metagraph(block, [block // 2, 1.0]))
+
+    blocks, stake = history.stake(0, range(12, 16))
+
+    assert blocks.tolist() == [12, 13, 14, 15]
+    assert stake.tolist() == [6.0, 6.0, 7.0, 7.0]
+    assert history.stake(1, (0, 11))[1].tolist() == [1.0]
+    assert history.stake(5)[0].size == 0
+    with pytest.raises(ValueError):
+        history.series("weights", 0)
+
+
+def test_append_rejects_older_block(history):
+    history.append(_metagraph(10, [1.0]))
+
+    with pytest.raises(ValueError):
+        history.append(_metagraph(10, [1.0]))
+
+
+def test_torn_record_is_dropped(history):
+    history.append(_metagraph(10, [1.0]))
+    history.append(_metagraph(11, [5.0]))
+    with open(history.path, "r+b") as log:
+        log.truncate(os.path.getsize(history.path) - 4)
+
+    reopened = MetagraphHistory(netuid=1, network="mock", path=history.path)
+    assert reopened.blocks.tolist() == [10]
+    reopened.append(_metagraph(12, [2.0]))
+
+    blocks, stake = MetagraphHistory(1, "mock", path=history.path).stake(0)
+    assert blocks.tolist() == [10, 12]
+    assert stake.tolist() == [1.0, 2.0]
@@ -0,0 +1,146 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import time
+
+import pytest
+
+from bittensor.constants import ALLOWED_DELTA, NONCE_MAX_TIMEOUT
+from bittensor.nonce_store import (
+    MemoryNonceStore,
+    SQLiteNonceStore,
+    nonce_expiry,
+    nonce_window,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def nonce_store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryNonceStore(max_size=3)
+    return SQLiteNonceStore(str(tmp_path / "nonces.db"))
+
+
+def test_nonce_window():
+    assert nonce_window(None) == ALLOWED_DELTA
+    assert nonce_window(12.0) == ALLOWED_DELTA + 12_000_000_000
+    # Huge timeouts are clamped
+    assert nonce_window(10.0**9) == ALLOWED_DELTA + NONCE_MAX_TIMEOUT * 10**9
+
+
+def test_nonce_expiry():
+    # Entries outlive the widest window a replay may claim
+    assert nonce_expiry(10) == 10 + nonce_window(NONCE_MAX_TIMEOUT)
+
+    # Far-future nonces are clamped
+    now = time.time_ns()
+    assert nonce_expiry(now + 10**15, now) == (
+        now + ALLOWED_DELTA + nonce_window(NONCE_MAX_TIMEOUT)
+    )
+
+
+def test_update_only_increasing(nonce_store):
+    expires_at = time.time_ns() + 10**12
+    assert nonce_store.get("hotkey:uuid") is None
+    assert nonce_store.update("hotkey:uuid", 5, expires_at)
+    assert nonce_store.get("hotkey:uuid") == 5
+    assert "hotkey:uuid" in nonce_store
+
+    # Replayed and older nonces are rejected
+    assert not nonce_store.update("hotkey:uuid", 5, expires_at)
+    assert not nonce_store.update("hotkey:uuid", 4, expires_at)
+    assert nonce_store.update("hotkey:uuid", 6, expires_at)
+    assert nonce_store.get("hotkey:uuid") == 6
+
+
+def test_expired_entries_are_evicted(nonce_store):
+    now = time.time_ns()
+    nonce_store.update("expired", 5, now - 1)
+    nonce_store.update("live", 5, now + 10**12)
+    nonce_store.update("legacy", 5, None)
+
+    assert nonce_store.get("expired") is None
+    nonce_store.prune()
+    assert len(nonce_store) == 2
+    assert nonce_store.get("live") == 5
+    assert nonce_store.get("legacy") == 5
+
+    # An expired key behaves like an unknown one
+    nonce_store.update("expired_again", 9, now - 1)
+    assert nonce_store.update("expired_again", 1, now + 10**12)
+
+
+def test_memory_store_is_bounded():
+    nonce_store = MemoryNonceStore(max_size=2, max_legacy_size=2)
+    assert nonce_store.update("hotkey:0", 1, None)
+    assert nonce_store.update("hotkey:1", 1, time.time_ns() + 10**12)
+    assert nonce_store.update("hotkey:2", 1, time.time_ns() + 10**13)
+
+    # Live entries are never evicted, new endpoint keys are refused instead
+    assert not nonce_store.update("hotkey:3", 1, time.time_ns() + 10**14)
+    assert nonce_store.get("hotkey:3") is None
+    assert nonce_store.get("hotkey:1") == 1
+    assert nonce_store.update("hotkey:1", 2, time.time_ns() + 10**14)
+
+    # Expired entries make room
+    nonce_store.update("hotkey:1", 3, time.time_ns() - 1)
+    assert nonce_store.update("hotkey:3", 1, time.time_ns() + 10**14)
+    assert len(nonce_store) == 3
+    assert nonce_store.get("hotkey:0") == 1
+
+    # Entries without expiry are refused once their own bound is reached
+    assert nonce_store.update("hotkey:4", 1, None)
+    assert not nonce_store.update("hotkey:5", 1, None)
+    assert nonce_store.get("hotkey:5") is None
+    assert nonce_store.update("hotkey:0", 2, None)
+    assert len(nonce_store) == 4
+
+
+def test_entries_without_expiry_keep_none(nonce_store):
+    now = time.time_ns()
+    nonce_store.update("legacy", 1, None)
+    nonce_store.update("legacy", 2, now - 1)
+
+    nonce_store.prune()
+    assert nonce_store.get("legacy") == 2
+    assert not nonce_store.update("legacy", 1, now + 10**12)
+
+
+def test_memory_store_evicts_by_expiry():
+    nonce_store = MemoryNonceStore(max_size=3)
+    now = time.time_ns()
+    # Entries stored in front of an expired one do not keep it alive
+    nonce_store.update("legacy", 1, None)
+    nonce_store.update("long", 1, now + 10**12)
+    nonce_store.update("short", 1, now + 10**6)
+    nonce_store.update("long", 2, now + 2 * 10**12)
+
+    assert nonce_store.prune(now + 10**9) == 1
+    assert nonce_store.get("short") is None
+    assert nonce_store.get("long") == 2
+    assert nonce_store.update("hotkey", 1, None)
+    assert len(nonce_store) == 3
+
+
+def test_sqlite_store_is_shared(tmp_path):
+    path = str(tmp_path / "nonces.db")
+    worker_1, worker_2 = SQLiteNonceStore(path), SQLiteNonceStore(path)
+    expires_at = time.time_ns() + 10**12
+
+    assert worker_1.update("hotkey:uuid", 5, expires_at)
+    assert worker_2.get("hotkey:uuid") == 5
+    assert not worker_2.update("hotkey:uuid", 5, expires_at)
@@ -0,0 +1,185 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import asyncio
+
+import pytest
+
+import bittensor
+from bittensor.stream import (
+    FRAMED_STREAM_CONTENT_TYPE,
+    FrameType,
+    FramedStreamWriter,
+    encode_frame,
+    iter_frames,
+)
+
+
+class MockContent:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def iter_any(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+class MockResponse:
+    def __init__(self, body: bytes, chunk_size: int = 7):
+        self.content_type = FRAMED_STREAM_CONTENT_TYPE
+        self.content = MockContent(
+            [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+        )
+
+
+class Completion(bittensor.FramedStreamingSynapse):
+    prompt: str
+    completion: str = ""
+
+
+def body_of(messages):
+    return b"".join(message["body"] for message in messages)
+
+
+@pytest.mark.asyncio
+async def test_writer_coalesces_frames():
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    writer = FramedStreamWriter(send, flush_interval=10.0)
+    for i in range(100):
+        await writer.write(f"token{i}")
+    await writer.write(b"\x00")
+    assert messages == []
+
+    await writer.close()
+    assert len(messages) == 1
+    assert messages[0]["more_body"]
+
+    frames = [frame async for frame in iter_frames(MockResponse(body_of(messages)))]
+    assert frames[0] == (FrameType.TEXT, b"token0")
+    assert frames[-1] == (FrameType.BYTES, b"\x00")
+    assert len(frames) == writer.frames == 101
+
+    with pytest.raises(RuntimeError):
+        await writer.write("late")
+
+
+@pytest.mark.asyncio
+async def test_writer_flush_interval():
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    writer = FramedStreamWriter(send, flush_interval=0.01)
+    await writer.write("a")
+    await writer.write("b")
+    await asyncio.sleep(0.05)
+    assert body_of(messages) == encode_frame(FrameType.TEXT, b"a") + encode_frame(
+        FrameType.TEXT, b"b"
+    )
+
+
+@pytest.mark.asyncio
+async def test_writer_backpressure():
+    sent = []
+    release = asyncio.Event()
+
+    async def send(message):
+        await release.wait()
+        sent.append(message)
+
+    writer = FramedStreamWriter(send, flush_interval=10.0, max_buffered_bytes=64)
+    await writer.write(b"x" * 10)
+
+    # A full buffer is sent before the write returns.
+    write = asyncio.ensure_future(writer.write(b"x" * 100))
+    await asyncio.sleep(0.01)
+    assert not write.done()
+    release.set()
+    await write
+    assert len(sent) == 1 and writer.messages == 1
+
+
+@pytest.mark.asyncio
+async def test_iter_frames_errors():
+    frame = encode_frame(FrameType.BYTES, b"x" * 100)
+    with pytest.raises(ValueError):
+        [_ async for _ in iter_frames(MockResponse(frame), max_frame_size=10)]
+    with pytest.raises(ValueError):
+        [_ async for _ in iter_frames(MockResponse(frame[:-1]))]
+
+
+@pytest.mark.asyncio
+async def test_framed_streaming_synapse():
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    synapse = Completion(prompt="hi")
+
+    async def token_streamer(writer):
+        for token in ("Hello", " world"):
+            synapse.completion += token
+            await writer.write(token)
+
+    response = synapse.create_framed_streaming_response(token_streamer)
+    await response(None, None, send)
+
+    start, *body, end = messages
+    assert (b"content-type", FRAMED_STREAM_CONTENT_TYPE.encode()) in start["headers"]
+    assert not end["more_body"]
+
+    local = Completion(prompt="hi")
+    chunks = [
+        chunk
+        async for chunk in local.process_streaming_response(MockResponse(body_of(body)))
+    ]
+    assert chunks == ["Hello", " world"]
+    fields = local.extract_response_json(None)
+    assert fields["completion"] == "Hello world"
+    assert "axon" not in fields
+
+
+@pytest.mark.asyncio
+async def test_framed_streaming_synapse_error_cancels_flush():
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    async def token_streamer(writer):
+        await writer.write("partial")
+        raise RuntimeError("model failed")
+
+    synapse = Completion(prompt="hi")
+    response = synapse.create_framed_streaming_response(
+        token_streamer, flush_interval=0.01
+    )
+    with pytest.raises(RuntimeError):
+        await response(None, None, send)
+    sent = len(messages)
+    await asyncio.sleep(0.05)
+    assert len(messages) == sent
+    assert all(
+        message.get("body") != encode_frame(FrameType.TEXT, b"partial")
+        for message in messages
+    )
@@ -17,6 +17,7 @@
 
 # Standard Lib
 import argparse
+import threading
 import unittest.mock as mock
 from unittest.mock import MagicMock
 
@@ -2315,3 +2316,156 @@ def test_get_remaining_arbitration_period_happy(subtensor, mocker):
     )
     # if we change the methods logic in the future we have to be make sure the returned type is correct
     assert result == 1800  # 2000 - 200
+
+
+# Block hash cache and `at_block` tests
+@pytest.fixture
+def offline_subtensor(mocker):
+    mocker.patch.object(subtensor_module, "SubstrateInterface")
+    subtensor = Subtensor(log_verbose=False)
+    subtensor.substrate.get_block_hash.side_effect = lambda block: f"0x{block:064x}"
+    subtensor.substrate.get_block_number.return_value = 200
+    return subtensor
+
+
+def test_get_block_hash_caches_finalized_blocks(offline_subtensor):
+    """Tests that only the hashes of finalized blocks are reused."""
+    substrate = offline_subtensor.substrate
+
+    assert offline_subtensor.get_block_hash(150) == f"0x{150:064x}"
+    assert offline_subtensor.get_block_hash(150) == f"0x{150:064x}"
+    offline_subtensor.get_block_hash(250)
+    offline_subtensor.get_block_hash(250)
+
+    assert substrate.get_block_hash.call_count == 3
+    # The finalized head is looked up at most once per block time.
+    substrate.get_chain_finalised_head.assert_called_once()
+
+
+def test_get_block_hash_cache_evicts_least_recently_used(offline_subtensor):
+    """Tests that the block hash cache is bounded."""
+    offline_subtensor.BLOCK_HASH_CACHE_SIZE = 2
+    for block in (1, 2, 1, 3):
+        offline_subtensor.get_block_hash(block)
+
+    assert list(offline_subtensor._block_hashes) == [1, 3]
+
+
+def test_at_block_pins_queries(offline_subtensor):
+    """Tests that queries without a block read the pinned block."""
+    substrate = offline_subtensor.substrate
+    substrate.rpc_request.return_value = {"result": None}
+
+    with offline_subtensor.at_block(123) as pinned:
+        pinned.get_all_subnets_info()
+        pinned.get_all_subnets_info()
+        with pinned.at_block(124):
+            assert pinned._get_block_hash(None) == f"0x{124:064x}"
+        assert pinned._get_block_hash(None) == f"0x{123:064x}"
+        # The current block stays the chain head, e.g. for the era of extrinsics.
+        assert pinned.get_current_block() == 200
+
+    substrate.get_block_hash.assert_has_calls([mock.call(123), mock.call(124)])
+    assert substrate.get_block_hash.call_count == 2
+    substrate.rpc_request.assert_called_with(
+        method="subnetInfo_getSubnetsInfo", params=[f"0x{123:064x}"]
+    )
+    assert offline_subtensor._get_block_hash(None) is None
+    offline_subtensor.get_all_subnets_info()
+    substrate.rpc_request.assert_called_with(
+        method="subnetInfo_getSubnetsInfo", params=[]
+    )
+
+
+def test_at_block_is_local_to_the_thread(offline_subtensor):
+    """Tests that a pin does not leak to other threads or other subtensors."""
+    other = Subtensor(log_verbose=False)
+    hashes = []
+
+    with offline_subtensor.at_block(123):
+        thread = threading.Thread(
+            target=lambda: hashes.append(offline_subtensor._get_block_hash(None))
+        )
+        thread.start()
+        thread.join()
+        assert other._get_block_hash(None) is None
+
+    assert hashes == [None]
+
+
+def test_at_block_unknown_block(offline_subtensor):
+    """Tests that pinning a block that does not exist raises."""
+    offline_subtensor.substrate.get_block_hash.side_effect = None
+    offline_subtensor.substrate.get_block_hash.return_value = None
+
+    with pytest.raises(ValueError):
+        with offline_subtensor.at_block(10**9):
+            pass
+
+
+# `query_multi` and `batch` tests
+def test_query_multi_reads_keys_in_chunks(offline_subtensor, mocker):
+    """Tests that the storage keys are read in chunks at one block, in order."""
+    substrate = offline_subtensor.substrate
+    storage_keys = {}
+
+    def create_storage_key(module, name, params, **kwargs):
+        storage_key = mocker.MagicMock()
+        storage_key.to_hex.return_value = f"{module}.{name}.{params[0]}"
+        storage_keys[params[0]] = storage_key
+        return storage_key
+
+    mocker.patch.object(
+        subtensor_module.StorageKey,
+        "create_from_storage_function",
+        side_effect=create_storage_key,
+    )
+    substrate.get_chain_head.return_value = "0xhead"
+    substrate.query_multi.side_effect = lambda chunk, block_hash: [
+        (storage_key, mocker.MagicMock(value=storage_key.to_hex()))
+        for storage_key in reversed(chunk)
+    ]
+    offline_subtensor.QUERY_MULTI_CHUNK_SIZE = 2
+
+    result = offline_subtensor.query_multi(
+        [("SubtensorModule", "TotalColdkeyStake", [key]) for key in "abc"]
+    )
+
+    assert result == [f"SubtensorModule.TotalColdkeyStake.{key}" for key in "abc"]
+    substrate.get_chain_head.assert_called_once()
+    substrate.init_runtime.assert_called_once_with(block_hash="0xhead")
+    substrate.query_multi.assert_has_calls(
+        [
+            mock.call([storage_keys["a"], storage_keys["b"]], block_hash="0xhead"),
+            mock.call([storage_keys["c"]], block_hash="0xhead"),
+        ]
+    )
+
+
+def test_batch_decodes_results(offline_subtensor, mocker):
+    """Tests that the results of a batch are set when the batch exits."""
+    query_multi = mocker.patch.object(
+        offline_subtensor,
+        "query_multi",
+        return_value=[{"data": {"free": 5}}, 7, None],
+    )
+
+    with offline_subtensor.batch(block=10) as batch:
+        balance = batch.get_balance("coldkey")
+        coldkey_stake = batch.get_total_stake_for_coldkey("coldkey")
+        hotkey_stake = batch.get_total_stake_for_hotkey("hotkey")
+        with pytest.raises(RuntimeError):
+            balance.value
+
+    query_multi.assert_called_once_with(
+        [
+            ("System", "Account", ["coldkey"]),
+            ("SubtensorModule", "TotalColdkeyStake", ["coldkey"]),
+            ("SubtensorModule", "TotalHotkeyStake", ["hotkey"]),
+        ],
+        block=10,
+    )
+    assert balance.value == Balance.from_rao(5)
+    assert coldkey_stake.value == Balance.from_rao(7)
+    assert hotkey_stake.value is None
+    assert len(batch) == 0
@@ -16,9 +16,10 @@
 # DEALINGS IN THE SOFTWARE.
 import json
 import base64
+import numpy as np
 import pytest
 import bittensor
-from typing import Optional, ClassVar
+from typing import Dict, Optional, ClassVar, Tuple
 
 
 def test_parse_headers_to_inputs():
@@ -91,6 +92,74 @@ def test_from_headers():
     assert synapse.total_size == 111
 
 
+def test_from_body_and_headers():
+    class Test(bittensor.Synapse):
+        key1: list[int]
+
+    headers = {
+        "bt_header_axon_nonce": "111",
+        "bt_header_dendrite_ip": "12.1.1.2",
+        # Not decoded, the body carries the field.
+        "bt_header_input_obj_key1": "not base64",
+        "timeout": "5",
+        "name": "Test",
+        "computed_body_hash": "0xabcdef",
+    }
+    body = json.dumps(
+        {"key1": [1, 2, 3, 4], "timeout": 12, "computed_body_hash": "0x0"}
+    ).encode()
+
+    synapse = Test.from_body_and_headers(body, headers)
+
+    assert isinstance(synapse, Test)
+    assert synapse.key1 == [1, 2, 3, 4]
+    assert synapse.axon.nonce == 111
+    assert synapse.dendrite.ip == "12.1.1.2"
+    assert synapse.timeout == 5
+    assert synapse.computed_body_hash == "0xabcdef"
+
+    with pytest.raises(ValueError):
+        Test.from_body_and_headers(b"{}", headers)
+
+
+def test_from_body_and_headers_msgpack():
+    class Test(bittensor.Synapse):
+        key1: list[float]
+        key2: bytes = b""
+        key3: Optional[bittensor.Tensor] = None
+        required_hash_fields: ClassVar[Tuple[str, ...]] = ("key1", "key2", "key3")
+
+    synapse = Test(
+        key1=[0.1, 1e-30, 3.0],
+        key2=b"\x01\x02",
+        key3=bittensor.tensor(np.arange(4, dtype=np.float32)),
+    )
+    headers = {"content-type": "application/msgpack", "name": "Test"}
+
+    decoded = Test.from_body_and_headers(synapse.to_msgpack(), headers)
+
+    assert decoded.key1 == synapse.key1
+    assert decoded.key2 == synapse.key2
+    # Tensors are sent as raw bytes, and hashed in their base64 form like in JSON bodies.
+    assert decoded.key3.buffer == synapse.key3.buffer
+    assert decoded.body_hash == synapse.body_hash
+    assert Test.model_validate_json(synapse.json()).body_hash == synapse.body_hash
+
+
+def test_from_body_and_headers_msgpack_int_keys():
+    class Test(bittensor.Synapse):
+        scores: Dict[int, float]
+        required_hash_fields: ClassVar[Tuple[str, ...]] = ("scores",)
+
+    synapse = Test(scores={0: 0.5, 17: 1.0})
+    headers = {"content-type": "application/msgpack", "name": "Test"}
+
+    decoded = Test.from_body_and_headers(synapse.to_msgpack(), headers)
+
+    assert decoded.scores == synapse.scores
+    assert decoded.body_hash == synapse.body_hash
+
+
 def test_synapse_create():
     # Create an instance of Synapse
     synapse = bittensor.Synapse()
@@ -264,3 +333,30 @@ def test_synapse_body_hash(synapse_cls):
     # Different hashed values should result in different body hashes
     synapse_different = synapse_cls(a=1, b=2)
     assert synapse_instance.body_hash != synapse_different.body_hash
+
+
+def test_to_headers_uses_cached_codec(mocker):
+    class Test(bittensor.Synapse):
+        a: int
+        b: Optional[list[int]]
+        c: Optional[int] = None
+
+    synapse = Test(a=1, b=[1, 2, 3])
+    headers = synapse.to_headers()
+    codec = Test.header_codec()
+
+    # The codec is compiled once per subclass and never inherited
+    assert Test.header_codec() is codec
+    assert bittensor.Synapse.header_codec() is not codec
+    assert codec.required_fields == ("a", "b")
+
+    # Subsequent encodings do no schema work and produce the same headers
+    schema_spy = mocker.spy(Test, "model_json_schema")
+    next_headers = synapse.to_headers()
+    assert next_headers.keys() == headers.keys()
+    assert next_headers["computed_body_hash"] == headers["computed_body_hash"]
+    assert schema_spy.call_count == 0
+
+    assert "bt_header_input_obj_c" not in headers
+    assert json.loads(base64.b64decode(headers["bt_header_input_obj_a"])) == 0
+    assert json.loads(base64.b64decode(headers["bt_header_input_obj_b"])) == []
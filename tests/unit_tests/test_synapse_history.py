@@ -0,0 +1,111 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import math
+
+import pytest
+
+import bittensor
+from bittensor.synapse_history import (
+    NullSynapseHistory,
+    RecordSynapseHistory,
+    RingSynapseHistory,
+    SynapseHistory,
+)
+
+
+def _synapse(status_code, process_time, hotkey):
+    return bittensor.Synapse(
+        total_size=100,
+        header_size=10,
+        dendrite=bittensor.TerminalInfo(
+            status_code=status_code, process_time=process_time
+        ),
+        axon=bittensor.TerminalInfo(status_code=status_code, hotkey=hotkey),
+    )
+
+
+@pytest.mark.parametrize(
+    "mode, expected",
+    [
+        ("off", NullSynapseHistory),
+        (None, NullSynapseHistory),
+        ("ring", RingSynapseHistory),
+        ("records", RecordSynapseHistory),
+    ],
+)
+def test_create(mode, expected):
+    assert isinstance(SynapseHistory.create(mode), expected)
+
+
+def test_create_unknown_mode():
+    with pytest.raises(ValueError):
+        SynapseHistory.create("everything")
+
+
+def test_null_history():
+    history = NullSynapseHistory()
+    history.record(_synapse(200, 0.1, "A"))
+    assert len(history) == 0
+    assert list(history) == []
+    assert history[-10:] == []
+
+
+def test_ring_history_is_bounded():
+    history = RingSynapseHistory(max_size=2)
+    for hotkey in "ABC":
+        history.record(_synapse(200, 0.1, hotkey))
+
+    assert len(history) == 2
+    assert [synapse.axon.hotkey for synapse in history] == ["B", "C"]
+    assert history[-1].total_size == 100
+    assert history[-1].dendrite.status_code == 200
+    assert [synapse.axon.hotkey for synapse in history[-10:]] == ["B", "C"]
+
+
+def test_record_history_wraps_around():
+    history = RecordSynapseHistory(max_size=3)
+    for index, hotkey in enumerate("ABCD"):
+        history.record(_synapse(200, float(index), hotkey))
+
+    records = history.records()
+    assert list(records["hotkey"]) == ["B", "C", "D"]
+    assert list(records["process_time"]) == [1.0, 2.0, 3.0]
+    assert history[0]["hotkey"] == "B"
+    assert history[-1]["hotkey"] == "D"
+    assert list(history[-2:]["hotkey"]) == ["C", "D"]
+    with pytest.raises(IndexError):
+        history[3]
+
+    history.clear()
+    assert len(history) == 0
+
+
+def test_record_history_latency_stats():
+    history = RecordSynapseHistory(max_size=10)
+    history.record(_synapse(200, 0.1, "A"))
+    history.record(_synapse(200, 0.3, "A"))
+    history.record(_synapse(408, None, "A"))
+    history.record(_synapse(503, None, "B"))
+
+    stats = history.latency_stats()
+    assert stats["A"]["count"] == 3
+    assert stats["A"]["success_rate"] == pytest.approx(2 / 3)
+    assert stats["A"]["mean"] == pytest.approx(0.2)
+    assert stats["B"]["success_rate"] == 0.0
+    assert math.isnan(stats["B"]["mean"])
+    assert list(history.latency_stats(hotkey="B")) == ["B"]
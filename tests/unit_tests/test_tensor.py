@@ -14,12 +14,15 @@
 # THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
+import json
 import pytest
 import numpy as np
 import bittensor
 import numpy
 import torch
 
+from bittensor.tensor import binary_transport
+
 
 # This is a fixture that creates an example tensor for testing
 @pytest.fixture
@@ -241,3 +244,74 @@ def test_serialize_all_types_equality_torch(force_legacy_torch_compat_api):
 
     torchtensor = torch.randn([100], dtype=torch.float32) < 0.5
     assert torch.all(bittensor.tensor(torchtensor).tensor() == torchtensor)
+
+
+def test_raw_buffer_deserialize_is_zero_copy():
+    array = np.arange(12, dtype=np.float32).reshape(3, 4)
+    tensor = bittensor.tensor(array)
+    assert isinstance(tensor.buffer, bytes)
+
+    deserialized = tensor.deserialize()
+    assert np.array_equal(deserialized, array)
+    assert not deserialized.flags.writeable
+    assert np.shares_memory(deserialized, np.frombuffer(tensor.buffer, np.uint8))
+
+    assert bittensor.tensor(np.array(5.0)).deserialize().shape == ()
+    assert bittensor.tensor(np.array([], dtype=np.int64)).tolist() == []
+
+
+def test_raw_buffer_dumps_base64_form():
+    array = np.arange(12, dtype=np.float32).reshape(3, 4)
+    tensor = bittensor.tensor(array)
+
+    # The JSON encoding is readable by peers that only know the base64 form.
+    legacy = bittensor.Tensor(**json.loads(tensor.model_dump_json()))
+    assert isinstance(legacy.buffer, str)
+    assert np.array_equal(legacy.deserialize(), array)
+    assert legacy.model_dump() == tensor.model_dump()
+
+    with binary_transport():
+        assert tensor.model_dump()["buffer"] == array.tobytes()
+        assert legacy.model_dump()["buffer"] == legacy.buffer
+
+
+def test_deserialize_is_cached(example_tensor):
+    assert isinstance(example_tensor.buffer, bytes)
+    assert example_tensor.deserialize() is example_tensor.tensor()
+    assert example_tensor.deserialize() is example_tensor.numpy()
+    assert not example_tensor.numpy().flags.writeable
+    assert example_tensor.tolist() == [1, 2, 3, 4]
+
+
+def test_deserialize_base64_buffer_is_writable(example_tensor):
+    legacy = bittensor.Tensor(**example_tensor.model_dump())
+    assert isinstance(legacy.buffer, str)
+
+    deserialized = legacy.deserialize()
+    assert deserialized.flags.writeable
+    deserialized[0] = 10
+    assert legacy.deserialize() is not deserialized
+    assert legacy.tolist() == [1, 2, 3, 4]
+
+
+def test_deserialize_torch_is_not_shared(
+    example_tensor_torch, force_legacy_torch_compat_api
+):
+    deserialized = example_tensor_torch.deserialize()
+    deserialized[0] = 10
+    assert example_tensor_torch.tensor() is not deserialized
+    assert example_tensor_torch.tensor().tolist() == [1, 2, 3, 4]
+    assert example_tensor_torch.numpy().tolist() == [1, 2, 3, 4]
+
+
+def test_nbytes():
+    array = np.zeros((3, 4), dtype=np.float32)
+    tensor = bittensor.tensor(array)
+    assert tensor.nbytes == array.nbytes == 48
+    assert bittensor.Tensor(**tensor.model_dump()).nbytes == 48
+    assert bittensor.tensor(np.array(1, dtype=np.int16)).nbytes == 2
+
+    oversized = bittensor.Tensor(buffer=b"", dtype="float64", shape=[10**9, 10**9])
+    assert oversized.nbytes == 8 * 10**18
+    with pytest.raises(ValueError):
+        oversized.deserialize()
@@ -0,0 +1,83 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from bittensor.errors import QueueExpiredError
+from bittensor.threadpool import PrioritySemaphore, PriorityThreadPoolExecutor
+
+
+@pytest.mark.asyncio
+async def test_priority_semaphore_wakes_highest_priority_first():
+    semaphore = PrioritySemaphore(1)
+    order = []
+
+    async def worker(name, priority, deadline=None):
+        async with semaphore.slot(priority, deadline):
+            order.append(name)
+
+    await semaphore.acquire()
+    tasks = [
+        asyncio.create_task(worker("low", 1.0)),
+        asyncio.create_task(worker("high", 10.0)),
+        asyncio.create_task(worker("late", 5.0, time.time() + 60)),
+        asyncio.create_task(worker("early", 5.0, time.time() + 30)),
+    ]
+    await asyncio.sleep(0)
+    assert semaphore.waiting == 4
+
+    semaphore.release()
+    await asyncio.gather(*tasks)
+    assert order == ["high", "early", "late", "low"]
+    assert semaphore.available == 1
+
+
+@pytest.mark.asyncio
+async def test_priority_semaphore_deadline():
+    semaphore = PrioritySemaphore(1)
+    await semaphore.acquire()
+
+    with pytest.raises(QueueExpiredError):
+        await semaphore.acquire(deadline=time.time() + 0.01)
+    assert semaphore.waiting == 0
+
+    semaphore.release()
+    assert semaphore.available == 1
+
+
+def test_thread_pool_expires_queued_work_items():
+    executor = PriorityThreadPoolExecutor(max_workers=1)
+    started, release = threading.Event(), threading.Event()
+
+    def block():
+        started.set()
+        release.wait()
+
+    executor.submit(block)
+    started.wait()
+    expired = executor.submit(lambda: "ran", priority=1.0, deadline=time.time())
+    pending = executor.submit(lambda: "ran", priority=1.0, deadline=time.time() + 60)
+    release.set()
+
+    with pytest.raises(QueueExpiredError):
+        expired.result(timeout=5)
+    assert pending.result(timeout=5) == "ran"
+    executor.shutdown()
@@ -0,0 +1,71 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import asyncio
+
+import pytest
+
+import bittensor
+from bittensor.verification import BatchVerifier, KeypairCache
+
+
+def _keypair():
+    return bittensor.Keypair.create_from_mnemonic(bittensor.Keypair.generate_mnemonic())
+
+
+def test_keypair_cache_reuses_keypairs():
+    cache = KeypairCache(max_size=2)
+    first, second, third = (_keypair().ss58_address for _ in range(3))
+
+    keypair = cache.get(first)
+    assert keypair.ss58_address == first
+    assert cache.get(first) is keypair
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.get(second)
+    cache.get(first)
+    cache.get(third)
+    # The least recently used keypair is evicted.
+    assert second not in cache
+    assert first in cache and third in cache
+    assert len(cache) == 2
+
+
+def test_keypair_cache_invalid_address():
+    cache = KeypairCache()
+    with pytest.raises(ValueError):
+        cache.get("not an address")
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_verifier():
+    verifier = BatchVerifier(max_workers=2, max_batch_size=2)
+    signer = _keypair()
+    public = KeypairCache().get(signer.ss58_address)
+    messages = [f"message {i}" for i in range(5)]
+    signatures = [f"0x{signer.sign(message).hex()}" for message in messages]
+    signatures[3] = signatures[0]
+
+    results = await asyncio.gather(
+        *(
+            verifier.verify(public, message, signature)
+            for message, signature in zip(messages, signatures)
+        )
+    )
+    assert results == [True, True, True, False, True]
+    verifier.shutdown()
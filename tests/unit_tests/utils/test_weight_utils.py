@@ -532,3 +532,105 @@ def test_error_cases(test_id, n, uids, bonds, exception):
     # Act / Assert
     with pytest.raises(exception):
         weight_utils.convert_bond_uids_and_vals_to_tensor(n, uids, bonds)
+
+
+@pytest.mark.parametrize(
+    "test_id, n, rows",
+    [
+        ("happy-1", 4, [[(0, 10), (2, 30)], [], [(3, 65535)], [(1, 0)]]),
+        ("single-row", 3, [[(0, 1), (1, 1), (2, 2)]]),
+        ("no-rows", 5, []),
+    ],
+)
+def test_convert_uids_and_vals_to_csr_matches_dense(test_id, n, rows):
+    # Arrange
+    dense_weights = [
+        weight_utils.convert_weight_uids_and_vals_to_tensor(
+            n, [uid for uid, _ in row], [value for _, value in row]
+        )
+        for row in rows
+    ]
+    dense_bonds = [
+        weight_utils.convert_bond_uids_and_vals_to_tensor(
+            n, [uid for uid, _ in row], [value for _, value in row]
+        )
+        for row in rows
+    ]
+
+    # Act
+    weights = weight_utils.convert_weight_uids_and_vals_to_csr(n, rows)
+    bonds = weight_utils.convert_bond_uids_and_vals_to_csr(n, rows)
+
+    # Assert
+    assert weights.shape == bonds.shape == (len(rows), n), f"Failed {test_id}"
+    assert weights.nnz == sum(map(len, rows)), f"Failed {test_id}"
+    assert np.allclose(
+        weights.todense(), np.array(dense_weights, dtype=np.float32).reshape(-1, n)
+    ), f"Failed {test_id}"
+    assert np.array_equal(
+        bonds.todense(), np.array(dense_bonds, dtype=np.int64).reshape(-1, n)
+    ), f"Failed {test_id}"
+
+
+def test_convert_root_weight_uids_and_vals_to_csr(caplog):
+    # Arrange
+    subnets = [0, 3, 7, 11]
+    rows = [[(0, 5), (7, 10), (9, 3)], [], [(11, 1), (50, 2)]]
+
+    # Act
+    with caplog.at_level(logging.WARNING):
+        weights = weight_utils.convert_root_weight_uids_and_vals_to_csr(
+            len(subnets), rows, subnets
+        )
+
+    # Assert
+    expected = [
+        weight_utils.convert_root_weight_uids_and_vals_to_tensor(
+            len(subnets),
+            [uid for uid, _ in row],
+            [value for _, value in row],
+            subnets,
+        )
+        for row in rows
+    ]
+    assert np.allclose(weights.todense(), np.array(expected))
+    assert weights.nnz == 3
+    assert "Incorrect Subnet uid 9" in caplog.text
+    assert "Incorrect Subnet uid 50" in caplog.text
+
+
+def test_csr_matrix_rows():
+    # Arrange
+    matrix = weight_utils.CSRMatrix.from_rows([[(1, 4)], [], [(0, 2), (2, 6)]], 3)
+
+    # Act
+    columns, values = matrix.row(2)
+
+    # Assert
+    assert columns.tolist() == [0, 2]
+    assert values.tolist() == [2, 6]
+    assert matrix.row_ids().tolist() == [0, 2, 2]
+    assert matrix.row(1)[0].size == 0
+
+
+def test_csr_matrix_column_out_of_bounds():
+    with pytest.raises(IndexError):
+        weight_utils.CSRMatrix.from_rows([[(0, 1)], [(5, 1)]], 5)
+
+
+def test_csr_matrix_replace_rows():
+    # Arrange
+    matrix = weight_utils.CSRMatrix.from_rows(
+        [[(0, 1), (2, 2)], [(1, 3)], [], [(3, 4)]], 4
+    )
+    rows = weight_utils.CSRMatrix.from_rows([[], [(0, 5), (1, 6)]], 4)
+
+    # Act
+    replaced = matrix.replace_rows([3, 2], rows)
+
+    # Assert
+    expected = matrix.todense()
+    expected[3] = 0
+    expected[2] = [5, 6, 0, 0]
+    assert np.array_equal(replaced.todense(), expected)
+    assert replaced.indptr.tolist() == [0, 2, 3, 5, 5]